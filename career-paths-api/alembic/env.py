@@ -11,9 +11,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from app.database import Base
 from app.config import get_settings
 from app.models import (
-    user, evaluation_cycle, competency, evaluation,
-    evaluation_detail, assessment, career_path,
-    career_path_step, development_action
+    user, user_hierarchy, evaluation_cycle, competency, evaluation,
+    evaluation_detail, competency_score, calibration, anomaly, assessment, career_path,
+    career_path_step, development_action, analytics
 )
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,40 @@
+"""add_pipeline_timing_to_assessments
+
+Revision ID: 3f2a9c71d0b4
+Revises: 17dc3ec226b5
+Create Date: 2026-10-19 09:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2a9c71d0b4'
+down_revision: Union[str, None] = '17dc3ec226b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMING_COLUMNS = (
+    'last_evaluation_submitted_at',
+    'completion_detected_at',
+    'queued_at',
+    'ai_call_started_at',
+    'ai_call_completed_at',
+    'career_paths_ready_at',
+)
+
+
+def upgrade() -> None:
+    # Add pipeline stage timestamps
+    for column in TIMING_COLUMNS:
+        op.add_column('assessments', sa.Column(column, sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    # Remove pipeline stage timestamps
+    for column in reversed(TIMING_COLUMNS):
+        op.drop_column('assessments', column)
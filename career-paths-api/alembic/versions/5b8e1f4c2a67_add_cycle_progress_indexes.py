@@ -0,0 +1,31 @@
+"""add_cycle_progress_indexes
+
+Revision ID: 5b8e1f4c2a67
+Revises: a7d4e2b19c38
+Create Date: 2026-10-19 15:04:22.718390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e1f4c2a67'
+down_revision: Union[str, None] = 'a7d4e2b19c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering indexes for the cycle progress roll-up (index-only scans per cycle)
+    op.create_index('ix_evaluations_cycle_coverage', 'evaluations',
+                    ['cycle_id', 'employee_id', 'evaluator_relationship'], unique=False)
+    op.create_index('ix_assessments_cycle_status', 'assessments',
+                    ['cycle_id', 'processing_status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assessments_cycle_status', table_name='assessments')
+    op.drop_index('ix_evaluations_cycle_coverage', table_name='evaluations')
@@ -0,0 +1,55 @@
+"""add_rater_calibration
+
+Revision ID: 9d3c7b5e1a24
+Revises: e6a2d8b45f17
+Create Date: 2026-10-19 19:12:07.481930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3c7b5e1a24'
+down_revision: Union[str, None] = 'e6a2d8b45f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Calibrated score of each answer (written per cycle by app.services.calibration)
+    op.create_table(
+        'calibrated_scores',
+        sa.Column('evaluation_detail_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('z_score', sa.Float(), nullable=False),
+        sa.Column('calibrated_score', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['evaluation_detail_id'], ['evaluation_details.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['cycle_id'], ['evaluation_cycles.id'], ),
+        sa.PrimaryKeyConstraint('evaluation_detail_id')
+    )
+    op.create_index(op.f('ix_calibrated_scores_cycle_id'), 'calibrated_scores', ['cycle_id'], unique=False)
+
+    # Rater agreement and self-vs-others gap per competency and cycle
+    op.create_table(
+        'competency_calibrations',
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('competency_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('answers', sa.Integer(), nullable=False),
+        sa.Column('rater_agreement', sa.Float(), nullable=True),
+        sa.Column('self_delta', sa.Float(), nullable=True),
+        sa.Column('self_delta_calibrated', sa.Float(), nullable=True),
+        sa.Column('calibrated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['competency_id'], ['competencies.id'], ),
+        sa.ForeignKeyConstraint(['cycle_id'], ['evaluation_cycles.id'], ),
+        sa.PrimaryKeyConstraint('cycle_id', 'competency_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('competency_calibrations')
+    op.drop_index(op.f('ix_calibrated_scores_cycle_id'), table_name='calibrated_scores')
+    op.drop_table('calibrated_scores')
@@ -0,0 +1,49 @@
+"""add_reporting_lines_and_user_hierarchy
+
+Revision ID: a7d4e2b19c38
+Revises: 3f2a9c71d0b4
+Create Date: 2026-10-19 11:02:17.540921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e2b19c38'
+down_revision: Union[str, None] = '3f2a9c71d0b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reporting line of each user
+    op.add_column('users', sa.Column('manager_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('users_manager_id_fkey', 'users', 'users', ['manager_id'], ['id'], ondelete='SET NULL')
+    op.create_index(op.f('ix_users_manager_id'), 'users', ['manager_id'], unique=False)
+
+    # Closure table of the hierarchy
+    op.create_table(
+        'user_hierarchy',
+        sa.Column('ancestor_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('descendant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index('ix_user_hierarchy_descendant', 'user_hierarchy', ['descendant_id', 'depth'], unique=False)
+
+    # No reporting lines yet: every existing user is its own root
+    op.execute("INSERT INTO user_hierarchy (ancestor_id, descendant_id, depth) SELECT id, id, 0 FROM users")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_hierarchy_descendant', table_name='user_hierarchy')
+    op.drop_table('user_hierarchy')
+    op.drop_index(op.f('ix_users_manager_id'), table_name='users')
+    op.drop_constraint('users_manager_id_fkey', 'users', type_='foreignkey')
+    op.drop_column('users', 'manager_id')
@@ -0,0 +1,43 @@
+"""add_evaluation_anomalies
+
+Revision ID: b82f6e0c4d19
+Revises: 9d3c7b5e1a24
+Create Date: 2026-10-19 20:03:41.226815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b82f6e0c4d19'
+down_revision: Union[str, None] = '9d3c7b5e1a24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Evaluations flagged by the anomaly detection job (keyset-paginated by primary key)
+    op.create_table(
+        'evaluation_anomalies',
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('evaluation_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('reason', sa.Enum('STRAIGHT_LINING', 'RECIPROCAL_INFLATION', 'OUTLIER', name='anomalyreason'),
+                  nullable=False),
+        sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('detected_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['cycle_id'], ['evaluation_cycles.id'], ),
+        sa.ForeignKeyConstraint(['evaluation_id'], ['evaluations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('cycle_id', 'evaluation_id', 'reason')
+    )
+    op.create_index(op.f('ix_evaluation_anomalies_evaluation_id'), 'evaluation_anomalies', ['evaluation_id'],
+                    unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evaluation_anomalies_evaluation_id'), table_name='evaluation_anomalies')
+    op.drop_table('evaluation_anomalies')
+    sa.Enum(name='anomalyreason').drop(op.get_bind(), checkfirst=True)
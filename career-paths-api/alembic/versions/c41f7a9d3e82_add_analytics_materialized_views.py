@@ -0,0 +1,74 @@
+"""add_analytics_materialized_views
+
+Revision ID: c41f7a9d3e82
+Revises: 5b8e1f4c2a67
+Create Date: 2026-10-19 16:21:09.402851
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f7a9d3e82'
+down_revision: Union[str, None] = '5b8e1f4c2a67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Last refresh of each view
+    op.create_table(
+        'analytics_refreshes',
+        sa.Column('view_name', sa.String(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.Column('duration_ms', sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint('view_name')
+    )
+
+    # Competency scores per cycle, department and evaluator relationship
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_competency_scores AS
+        SELECT e.cycle_id,
+               COALESCE(u.department, 'Unassigned') AS department,
+               d.competency_id,
+               c.name AS competency,
+               e.evaluator_relationship,
+               count(*) AS answers,
+               sum(d.score) AS score_sum,
+               count(DISTINCT e.employee_id) AS employees
+        FROM evaluation_details d
+        JOIN evaluations e ON e.id = d.evaluation_id
+        JOIN users u ON u.id = e.employee_id
+        JOIN competencies c ON c.id = d.competency_id
+        GROUP BY e.cycle_id, COALESCE(u.department, 'Unassigned'), d.competency_id, c.name,
+                 e.evaluator_relationship
+    """)
+    # REFRESH ... CONCURRENTLY needs a unique index covering every row
+    op.execute("CREATE UNIQUE INDEX ux_mv_competency_scores ON mv_competency_scores "
+               "(cycle_id, department, competency_id, evaluator_relationship)")
+
+    # Participation per cycle and department
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_department_participation AS
+        SELECT e.cycle_id,
+               COALESCE(u.department, 'Unassigned') AS department,
+               count(DISTINCT e.employee_id) AS employees_evaluated,
+               count(DISTINCT e.id) AS evaluations,
+               count(d.id) AS answers,
+               sum(d.score) AS score_sum
+        FROM evaluations e
+        JOIN users u ON u.id = e.employee_id
+        LEFT JOIN evaluation_details d ON d.evaluation_id = e.id
+        GROUP BY e.cycle_id, COALESCE(u.department, 'Unassigned')
+    """)
+    op.execute("CREATE UNIQUE INDEX ux_mv_department_participation ON mv_department_participation "
+               "(cycle_id, department)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_department_participation")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_competency_scores")
+    op.drop_table('analytics_refreshes')
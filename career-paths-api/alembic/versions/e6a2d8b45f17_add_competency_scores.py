@@ -0,0 +1,97 @@
+"""add_competency_scores
+
+Revision ID: e6a2d8b45f17
+Revises: c41f7a9d3e82
+Create Date: 2026-10-19 17:48:33.165204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a2d8b45f17'
+down_revision: Union[str, None] = 'c41f7a9d3e82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Running score totals per employee, cycle, competency and evaluator relationship
+    op.create_table(
+        'competency_scores',
+        sa.Column('employee_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('competency_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('evaluator_relationship',
+                  postgresql.ENUM('SELF', 'MANAGER', 'PEER', 'DIRECT_REPORT', name='evaluatorrelationship',
+                                  create_type=False),
+                  nullable=False),
+        sa.Column('answers', sa.Integer(), nullable=False),
+        sa.Column('score_sum', sa.BigInteger(), nullable=False),
+        sa.Column('score_sum_squares', sa.BigInteger(), nullable=False),
+        sa.Column('score_min', sa.Integer(), nullable=False),
+        sa.Column('score_max', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['competency_id'], ['competencies.id'], ),
+        sa.ForeignKeyConstraint(['cycle_id'], ['evaluation_cycles.id'], ),
+        sa.ForeignKeyConstraint(['employee_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('employee_id', 'cycle_id', 'competency_id', 'evaluator_relationship')
+    )
+
+    # Totals of the answers already stored
+    op.execute("""
+        INSERT INTO competency_scores
+        SELECT e.employee_id, e.cycle_id, d.competency_id, e.evaluator_relationship,
+               count(*), sum(d.score), sum(d.score * d.score), min(d.score), max(d.score)
+        FROM evaluation_details d
+        JOIN evaluations e ON e.id = d.evaluation_id
+        GROUP BY e.employee_id, e.cycle_id, d.competency_id, e.evaluator_relationship
+    """)
+
+    # Competency analytics now aggregate the totals instead of every answer
+    op.execute("DROP MATERIALIZED VIEW mv_competency_scores")
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_competency_scores AS
+        SELECT s.cycle_id,
+               COALESCE(u.department, 'Unassigned') AS department,
+               s.competency_id,
+               c.name AS competency,
+               s.evaluator_relationship,
+               sum(s.answers)::bigint AS answers,
+               sum(s.score_sum)::bigint AS score_sum,
+               count(*) AS employees
+        FROM competency_scores s
+        JOIN users u ON u.id = s.employee_id
+        JOIN competencies c ON c.id = s.competency_id
+        GROUP BY s.cycle_id, COALESCE(u.department, 'Unassigned'), s.competency_id, c.name,
+                 s.evaluator_relationship
+    """)
+    op.execute("CREATE UNIQUE INDEX ux_mv_competency_scores ON mv_competency_scores "
+               "(cycle_id, department, competency_id, evaluator_relationship)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW mv_competency_scores")
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_competency_scores AS
+        SELECT e.cycle_id,
+               COALESCE(u.department, 'Unassigned') AS department,
+               d.competency_id,
+               c.name AS competency,
+               e.evaluator_relationship,
+               count(*) AS answers,
+               sum(d.score) AS score_sum,
+               count(DISTINCT e.employee_id) AS employees
+        FROM evaluation_details d
+        JOIN evaluations e ON e.id = d.evaluation_id
+        JOIN users u ON u.id = e.employee_id
+        JOIN competencies c ON c.id = d.competency_id
+        GROUP BY e.cycle_id, COALESCE(u.department, 'Unassigned'), d.competency_id, c.name,
+                 e.evaluator_relationship
+    """)
+    op.execute("CREATE UNIQUE INDEX ux_mv_competency_scores ON mv_competency_scores "
+               "(cycle_id, department, competency_id, evaluator_relationship)")
+    op.drop_table('competency_scores')
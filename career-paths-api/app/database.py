@@ -1,29 +1,416 @@
 """
 Database configuration and SQLAlchemy session.
+
+Writes always go to the primary engine. Sessions created by ``get_read_db``
+read from a healthy replica (when ``DATABASE_REPLICA_URLS`` is set) and fall
+back to the primary when replicas are down, lagging, or the client has
+written recently (see ReadYourWritesMiddleware).
 """
-from sqlalchemy import create_engine
+import itertools
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.cookies import CookieError, SimpleCookie
+from typing import Deque, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import any_, bindparam, create_engine, event, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.config import get_settings
+from app.services import metrics
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Checkout statistics of one pool, kept in process for ``/internal/pool``."""
+
+    def __init__(self, window: int = 1000):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent_waits: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, wait: float, timed_out: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.recent_waits.append(wait)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self.recent_waits)
+            checkouts, timeouts, total_wait, max_wait = self.checkouts, self.timeouts, self.total_wait, self.max_wait
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not recent:
+                return None
+            return round(recent[min(int(fraction * len(recent)), len(recent) - 1)] * 1000, 3)
+
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "mean_wait_ms": round(total_wait / checkouts * 1000, 3) if checkouts else None,
+            "max_wait_ms": round(max_wait * 1000, 3),
+            "recent_p50_wait_ms": percentile(0.50),
+            "recent_p95_wait_ms": percentile(0.95),
+            "recent_p99_wait_ms": percentile(0.99),
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waits for a connection.
+    The measured time includes pre-ping and opening overflow connections.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            timed_out = True
+            metrics.DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            metrics.DB_POOL_CHECKOUT_WAIT.observe(wait)
+            self.stats.record(wait, timed_out)
+
+
+def _connect_args() -> dict:
+    """Server-side timeouts sent as startup options (not supported through PgBouncer)."""
+    options = []
+    if settings.DB_STATEMENT_TIMEOUT_MS and not settings.PGBOUNCER_MODE:
+        options.append(f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}")
+    if settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS and not settings.PGBOUNCER_MODE:
+        options.append(f"-c idle_in_transaction_session_timeout={settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS}")
+    return {"options": " ".join(options)} if options else {}
+
+
+def create_pooled_engine(url: str, **connect_args) -> Engine:
+    """Create an engine with the pool configured from settings."""
+    pooled_engine = create_engine(
+        url,
+        # SQL logging goes through the logging subsystem (LOG_LEVELS=sqlalchemy.engine=INFO)
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,   # Verify connections before using them
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        connect_args={**_connect_args(), **connect_args}
+    )
+    if settings.PGBOUNCER_MODE and (settings.DB_STATEMENT_TIMEOUT_MS or settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS):
+        # Transaction pooling shares server connections between clients, so
+        # timeouts are set per transaction instead of per connection
+        statements = []
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            statements.append(f"SET LOCAL statement_timeout = {settings.DB_STATEMENT_TIMEOUT_MS}")
+        if settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS:
+            statements.append(
+                f"SET LOCAL idle_in_transaction_session_timeout = {settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS}"
+            )
+
+        @event.listens_for(pooled_engine, "begin")
+        def set_transaction_timeouts(connection):
+            connection.exec_driver_sql("; ".join(statements))
+
+    return pooled_engine
+
+
+def pool_status(pooled_engine: Engine) -> dict:
+    """Current size, usage and checkout waits of an engine's pool."""
+    pool = pooled_engine.pool
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    status = {
+        "database": make_url(pooled_engine.url).render_as_string(hide_password=True),
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "saturation": round(checked_out / capacity, 3) if capacity > 0 else None,
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status["checkout"] = stats.snapshot()
+    return status
+
+
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    pool_pre_ping=True,   # Verify connections before using them
-    pool_size=10,
-    max_overflow=20
-)
+engine = create_pooled_engine(settings.DATABASE_URL)
+
+# Pool usage is read at scrape time (engine.pool is replaced on dispose/recreate)
+metrics.DB_POOL_SIZE.set_function(lambda: engine.pool.size())
+metrics.DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+metrics.DB_POOL_OVERFLOW.set_function(lambda: max(engine.pool.overflow(), 0))
+
+
+# Seconds a replica is behind; 0 when it has replayed everything it received
+# (an idle primary would otherwise look like growing lag)
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class Replica:
+    """A replica engine and its last health check."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.name = make_url(engine.url).render_as_string(hide_password=True)
+        self.healthy = False
+        self.lag_seconds: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+
+class ReplicaSet:
+    """
+    Round-robin choice among healthy replicas.
+
+    Health is checked lazily: the first request after ``check_interval`` seconds
+    measures the replica's lag; concurrent requests keep using the last result.
+    """
+
+    def __init__(self, engines: List[Engine], max_lag_seconds: float, check_interval: float):
+        self.replicas = [Replica(replica_engine) for replica_engine in engines]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._next = itertools.count()
+
+    def measure_lag(self, replica: Replica) -> float:
+        with replica.engine.connect() as connection:
+            return float(connection.execute(REPLICA_LAG_SQL).scalar() or 0.0)
+
+    def _refresh(self, replica: Replica) -> None:
+        now = time.monotonic()
+        if replica.checked_at is not None and now - replica.checked_at < self.check_interval:
+            return
+        if not replica.lock.acquire(blocking=False):
+            return
+        try:
+            try:
+                replica.lag_seconds = self.measure_lag(replica)
+                replica.healthy = replica.lag_seconds <= self.max_lag_seconds
+                if not replica.healthy:
+                    logger.warning("Replica lagging, reads fall back",
+                                   extra={"replica": replica.name, "lag_seconds": replica.lag_seconds})
+            except Exception as exc:
+                replica.healthy = False
+                replica.lag_seconds = None
+                logger.warning("Replica health check failed", extra={"replica": replica.name, "error": str(exc)})
+            replica.checked_at = time.monotonic()
+            metrics.DB_REPLICA_LAG.labels(replica=replica.name).set(
+                replica.lag_seconds if replica.lag_seconds is not None else -1
+            )
+        finally:
+            replica.lock.release()
+
+    def choose(self) -> Optional[Engine]:
+        """Return a healthy replica engine, or None if reads must go to the primary."""
+        for replica in self.replicas:
+            self._refresh(replica)
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._next) % len(healthy)].engine
+
+
+# Last write of the client behind the current request, shared by every session of the
+# request (a mutable holder, so writes made in threadpool copies of the context are seen)
+_client_writes: ContextVar[Optional[Dict[str, object]]] = ContextVar("client_writes", default=None)
+
+LAST_WRITE_COOKIE = "last_write"
+
+
+@contextmanager
+def client_writes(last_write_at: Optional[float] = None):
+    """
+    Scope of one client request: sessions opened inside read from the primary while
+    the client's last write (epoch seconds) is within READ_YOUR_WRITES_SECONDS.
+    Yields the holder; ``wrote`` is set when a session commits a write.
+    """
+    holder = {"last_write_at": last_write_at, "wrote": False}
+    token = _client_writes.set(holder)
+    try:
+        yield holder
+    finally:
+        _client_writes.reset(token)
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware carrying each client's last write across requests in a cookie,
+    so a GET that follows the client's own POST reads from the primary even though
+    it uses a new session.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    @staticmethod
+    def _last_write(scope) -> Optional[float]:
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                try:
+                    morsel = SimpleCookie(value.decode("latin-1")).get(LAST_WRITE_COOKIE)
+                    return float(morsel.value) if morsel is not None else None
+                except (CookieError, ValueError):
+                    return None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with client_writes(self._last_write(scope)) as holder:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and holder["wrote"]:
+                    cookie = (f"{LAST_WRITE_COOKIE}={holder['last_write_at']:.3f}; Path=/; HttpOnly; SameSite=Lax; "
+                              f"Max-Age={math.ceil(settings.READ_YOUR_WRITES_SECONDS)}")
+                    message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads of read-only sessions to a replica.
+
+    Everything else uses the primary: flushes, sessions that wrote in the
+    current transaction, and sessions whose client (see client_writes) or
+    itself committed a write less than ``READ_YOUR_WRITES_SECONDS`` ago
+    (so clients read their own writes).
+    The replica is chosen once per session so its reads stay consistent.
+    """
+
+    replica_set: Optional[ReplicaSet] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wrote_in_transaction = False
+        self.last_write_at: Optional[float] = None
+        self._replica: Optional[Engine] = None
+
+    def use_primary(self) -> None:
+        """Route every following read of this session to the primary."""
+        self.info["read_only"] = False
+
+    def reads_from_replica(self) -> bool:
+        return self._replica is not None and self.info.get("read_only", False)
+
+    def _recently_wrote(self) -> bool:
+        if self.wrote_in_transaction:
+            return True
+        client = _client_writes.get()
+        last_write_at = max(
+            (at for at in (self.last_write_at, client and client["last_write_at"]) if at is not None),
+            default=None
+        )
+        return last_write_at is not None and time.time() - last_write_at < settings.READ_YOUR_WRITES_SECONDS
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            not self.info.get("read_only")
+            or self.replica_set is None
+            or self._flushing
+            or self._recently_wrote()
+        ):
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        if self._replica is None:
+            self._replica = self.replica_set.choose()
+            if self._replica is None:
+                # No healthy replica: this session reads from the primary
+                metrics.DB_READS.labels(target="primary").inc()
+                self.use_primary()
+                return super().get_bind(mapper, clause=clause, **kwargs)
+            metrics.DB_READS.labels(target="replica").inc()
+        return self._replica
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_write(session, flush_context):
+    session.wrote_in_transaction = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_read_your_writes_window(session):
+    if session.wrote_in_transaction:
+        # Wall-clock time: the window is carried to the client's next requests
+        session.last_write_at = time.time()
+        client = _client_writes.get()
+        if client is not None:
+            client["last_write_at"] = session.last_write_at
+            client["wrote"] = True
+    session.wrote_in_transaction = False
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_transaction_writes(session):
+    session.wrote_in_transaction = False
+
+
+replica_engines = [
+    # An unreachable replica must fail fast
+    create_pooled_engine(url.strip(), connect_timeout=2)
+    for url in settings.DATABASE_REPLICA_URLS.split(",")
+    if url.strip()
+]
+if replica_engines:
+    RoutingSession.replica_set = ReplicaSet(
+        replica_engines,
+        max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval=settings.REPLICA_HEALTH_CHECK_INTERVAL
+    )
 
 # Create session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession,
+                                info={"read_only": True})
 
 # Base for models
 Base = declarative_base()
 
 
+def any_uuid(column, values: Iterable[UUID]):
+    """
+    ``column = ANY(:ids)`` with the IDs bound as one ``uuid[]`` parameter: unlike an
+    expanded ``IN (...)`` the statement text does not change with the number of IDs.
+    """
+    return column == any_(bindparam("ids", list(values), type_=ARRAY(PG_UUID(as_uuid=True)), unique=True))
+
+
 def get_db():
     """
     Dependency to get database session.
@@ -37,3 +424,18 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Dependency to get a read-only database session.
+    Reads go to a healthy replica when one is configured.
+    
+    Yields:
+        Session: Database session
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
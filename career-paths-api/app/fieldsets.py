@@ -0,0 +1,52 @@
+"""
+Sparse fieldsets (``?fields=``) and expansions (``?include=``) for read endpoints.
+
+Each endpoint declares the fields it can return; the requested subset decides
+which columns are selected and which related rows are loaded, so nothing is
+fetched or serialised only to be dropped afterwards.
+"""
+from typing import Iterable, List, Optional, Set
+
+from fastapi import HTTPException, Query, status
+
+FIELDS_DESCRIPTION = "Comma separated fields to return (default: all), e.g. `path_name,status`"
+INCLUDE_DESCRIPTION = "Comma separated related data to embed"
+
+
+def fields_query():
+    return Query(None, description=FIELDS_DESCRIPTION)
+
+
+def include_query(*allowed: str):
+    return Query(None, description=f"{INCLUDE_DESCRIPTION}: {', '.join(allowed)}")
+
+
+def _split(value: str) -> List[str]:
+    names = []
+    for name in value.split(","):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str], parameter: str = "fields") -> List[str]:
+    """Requested fields in the declared order; all of them when the parameter is absent or empty."""
+    allowed = list(allowed)
+    requested = _split(fields or "")
+    if not requested:
+        return allowed
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown {parameter}: {', '.join(unknown)}. Allowed: {', '.join(allowed)}."
+        )
+    return [name for name in allowed if name in requested]
+
+
+def parse_include(include: Optional[str], allowed: Iterable[str]) -> Set[str]:
+    """Requested expansions (none when the parameter is absent)."""
+    if not _split(include or ""):
+        return set()
+    return set(parse_fields(include, allowed, parameter="include"))
@@ -0,0 +1,183 @@
+"""
+Structured logging configuration.
+
+Records are serialised as one JSON object per line on stdout. Application
+threads only enqueue records (``QueueHandler``); formatting and I/O happen in a
+``QueueListener`` thread so logging never blocks the event loop. Request and
+background job correlation IDs are carried through context variables.
+"""
+import copy
+import json
+import logging
+import queue
+import sys
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator, Optional
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+job_id_var: ContextVar[Optional[str]] = ContextVar("job_id", default=None)
+
+REQUEST_ID_HEADER = "x-request-id"
+
+# Attributes present on every LogRecord; anything else was passed via ``extra=``
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "request_id", "job_id"
+}
+
+_listener: Optional[QueueListener] = None
+
+
+class ContextFilter(logging.Filter):
+    """Attach the current correlation IDs to the record in the emitting thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        record.job_id = job_id_var.get()
+        return True
+
+
+class _ContextQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the exception separate from the message.
+    The stock ``prepare`` folds the traceback into ``msg`` using a plain formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            payload["request_id"] = request_id
+        job_id = getattr(record, "job_id", None)
+        if job_id:
+            payload["job_id"] = job_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def parse_log_levels(spec: str) -> Dict[str, str]:
+    """
+    Parse per-module levels such as ``"app.routers=DEBUG,sqlalchemy.engine=INFO"``.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown level.
+    """
+    levels = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, separator, level = entry.partition("=")
+        level = level.strip().upper()
+        if not separator or not name.strip() or not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Invalid log level entry: '{entry}'")
+        levels[name.strip()] = level
+    return levels
+
+
+def configure_logging(level: str = "INFO", module_levels: str = "") -> None:
+    """
+    Route the root logger through a non-blocking queue to JSON on stdout.
+    Safe to call more than once; the previous listener is replaced.
+    """
+    global _listener
+    stop_logging()
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _ContextQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    for name, module_level in parse_log_levels(module_levels).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+@contextmanager
+def job_context(job_name: str) -> Iterator[str]:
+    """Tag every record emitted inside the block with a new job ID."""
+    job_id = f"{job_name}-{uuid.uuid4().hex[:12]}"
+    token = job_id_var.set(job_id)
+    try:
+        yield job_id
+    finally:
+        job_id_var.reset(token)
+
+
+class RequestContextMiddleware:
+    """
+    ASGI middleware assigning a request ID to every HTTP request.
+    Reuses an incoming ``X-Request-ID`` header and echoes it in the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER.encode():
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER.encode(), request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
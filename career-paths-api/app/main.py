@@ -1,11 +1,22 @@
 """
 FastAPI main application.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.config import get_settings
-from app.database import engine, Base
-from app.routers import evaluations, assessments, career_paths
+from app.database import engine, replica_engines, Base, SessionLocal, ReadYourWritesMiddleware
+from app.responses import ORJSONResponse
+from app.logging_config import configure_logging, stop_logging, RequestContextMiddleware
+from app.routers import evaluations, assessments, career_paths, employees, teams, cycles, analytics, pipeline, internal
+from app.services import metrics
+from app.services.tracing import tracer, FileSpanExporter, TracingMiddleware, instrument_engine
+from app.services.compression import CompressionMiddleware
+from app.services.loop_monitor import EventLoopMonitor, LoopActivityMiddleware
+from app.services.reference_data import reference_data
+from app.services.analytics import analytics_refresher
 
 settings = get_settings()
 
@@ -14,13 +25,44 @@ settings = get_settings()
 # Run: alembic upgrade head
 # Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    configure_logging(settings.LOG_LEVEL, settings.LOG_LEVELS)
+    if settings.TRACING_ENABLED:
+        tracer.configure(
+            FileSpanExporter(settings.TRACE_EXPORT_PATH, settings.TRACE_SERVICE_NAME),
+            settings.TRACE_SAMPLE_RATE
+        )
+    loop_monitor = None
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor = EventLoopMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+            threshold=settings.LOOP_STALL_THRESHOLD_MS / 1000
+        )
+        loop_monitor.start()
+    reference_data.start(SessionLocal)
+    analytics_refresher.start(SessionLocal)
+    yield
+    await analytics_refresher.stop()
+    await reference_data.stop()
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    tracer.shutdown()
+    # Flush queued log records before the process exits
+    stop_logging()
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Sistema de evaluación 360° con generación inteligente de senderos de carrera usando IA",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -32,6 +74,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+    for traced_engine in [engine, *replica_engines]:
+        instrument_engine(traced_engine)
+
+if settings.LOOP_MONITOR_ENABLED:
+    app.add_middleware(LoopActivityMiddleware)
+
+# Reads that follow a client's own writes go to the primary
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Outermost so every log line of the request carries its ID
+app.add_middleware(RequestContextMiddleware)
+
 # Include routers
 app.include_router(
     evaluations.router,
@@ -48,6 +110,39 @@ app.include_router(
     prefix=f"{settings.API_V1_PREFIX}/career-paths",
     tags=["career-paths"]
 )
+# :batchGet routes sit on the collection paths, outside the routers' prefixes
+app.include_router(assessments.batch_router, prefix=settings.API_V1_PREFIX)
+app.include_router(career_paths.batch_router, prefix=settings.API_V1_PREFIX)
+app.include_router(
+    employees.router,
+    prefix=f"{settings.API_V1_PREFIX}/employees",
+    tags=["employees"]
+)
+app.include_router(
+    teams.router,
+    prefix=f"{settings.API_V1_PREFIX}/teams",
+    tags=["teams"]
+)
+app.include_router(
+    cycles.router,
+    prefix=f"{settings.API_V1_PREFIX}/cycles",
+    tags=["cycles"]
+)
+app.include_router(
+    analytics.router,
+    prefix=f"{settings.API_V1_PREFIX}/analytics",
+    tags=["analytics"]
+)
+app.include_router(
+    pipeline.router,
+    prefix=f"{settings.API_V1_PREFIX}/pipeline",
+    tags=["pipeline"]
+)
+app.include_router(
+    internal.router,
+    prefix="/internal",
+    tags=["internal"]
+)
 
 
 @app.get("/")
@@ -65,3 +160,10 @@ async def root():
 async def health_check():
     """Health check endpoint to verify the API is running."""
     return {"status": "healthy"}
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        """Expose this worker's metrics in Prometheus text format."""
+        return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE_LATEST)
@@ -1,16 +1,22 @@
 # Models package - Import all models for Alembic
 from app.models.user import User
+from app.models.user_hierarchy import UserHierarchy
 from app.models.evaluation_cycle import EvaluationCycle, CycleStatus
 from app.models.competency import Competency
 from app.models.evaluation import Evaluation, EvaluatorRelationship, EvaluationStatus
 from app.models.evaluation_detail import EvaluationDetail
+from app.models.competency_score import CompetencyScore
+from app.models.calibration import CalibratedScore, CompetencyCalibration
+from app.models.anomaly import EvaluationAnomaly, AnomalyReason
 from app.models.assessment import Assessment, ProcessingStatus
 from app.models.career_path import CareerPath, CareerPathStatus
 from app.models.career_path_step import CareerPathStep
 from app.models.development_action import DevelopmentAction
+from app.models.analytics import AnalyticsRefresh
 
 __all__ = [
     "User",
+    "UserHierarchy",
     "EvaluationCycle",
     "CycleStatus",
     "Competency",
@@ -18,10 +24,16 @@ __all__ = [
     "EvaluatorRelationship",
     "EvaluationStatus",
     "EvaluationDetail",
+    "CompetencyScore",
+    "CalibratedScore",
+    "CompetencyCalibration",
+    "EvaluationAnomaly",
+    "AnomalyReason",
     "Assessment",
     "ProcessingStatus",
     "CareerPath",
     "CareerPathStatus",
     "CareerPathStep",
     "DevelopmentAction",
+    "AnalyticsRefresh",
 ]
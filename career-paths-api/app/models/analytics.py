@@ -0,0 +1,125 @@
+"""
+Analytics materialized views (competency scores by department and relationship).
+
+The views pre-aggregate evaluation answers per cycle (competency scores from the
+per-employee totals in competency_scores), so org-level reports read a few
+thousand summary rows instead of every answer. They are not part of
+Base.metadata as tables: they are created after the tables (and dropped before
+them) by the metadata events at the bottom, and described by the read-only
+Table objects below for querying.
+"""
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, DateTime, Float, Integer, MetaData, String, Table, event, text
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from app.database import Base
+from app.models.evaluation import EvaluatorRelationship
+
+# Employees without a department are grouped under this name
+UNASSIGNED_DEPARTMENT = "Unassigned"
+
+
+class AnalyticsRefresh(Base):
+    """When each analytics view was last refreshed (shared by every worker)."""
+    __tablename__ = "analytics_refreshes"
+
+    view_name = Column(String, primary_key=True)
+    refreshed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    duration_ms = Column(Float, nullable=True)
+
+    def __repr__(self):
+        return f"<AnalyticsRefresh {self.view_name} at {self.refreshed_at}>"
+
+
+# name -> (definition, unique index columns required by REFRESH ... CONCURRENTLY)
+VIEWS = {
+    "mv_competency_scores": (
+        f"""
+        SELECT s.cycle_id,
+               COALESCE(u.department, '{UNASSIGNED_DEPARTMENT}') AS department,
+               s.competency_id,
+               c.name AS competency,
+               s.evaluator_relationship,
+               sum(s.answers)::bigint AS answers,
+               sum(s.score_sum)::bigint AS score_sum,
+               count(*) AS employees
+        FROM competency_scores s
+        JOIN users u ON u.id = s.employee_id
+        JOIN competencies c ON c.id = s.competency_id
+        GROUP BY s.cycle_id, COALESCE(u.department, '{UNASSIGNED_DEPARTMENT}'), s.competency_id, c.name,
+                 s.evaluator_relationship
+        """,
+        ("cycle_id", "department", "competency_id", "evaluator_relationship")
+    ),
+    "mv_department_participation": (
+        f"""
+        SELECT e.cycle_id,
+               COALESCE(u.department, '{UNASSIGNED_DEPARTMENT}') AS department,
+               count(DISTINCT e.employee_id) AS employees_evaluated,
+               count(DISTINCT e.id) AS evaluations,
+               count(d.id) AS answers,
+               sum(d.score) AS score_sum
+        FROM evaluations e
+        JOIN users u ON u.id = e.employee_id
+        LEFT JOIN evaluation_details d ON d.evaluation_id = e.id
+        GROUP BY e.cycle_id, COALESCE(u.department, '{UNASSIGNED_DEPARTMENT}')
+        """,
+        ("cycle_id", "department")
+    ),
+}
+
+# Read-only descriptions of the views (their own MetaData: never created as tables)
+views_metadata = MetaData()
+
+competency_scores = Table(
+    "mv_competency_scores", views_metadata,
+    Column("cycle_id", UUID(as_uuid=True)),
+    Column("department", String),
+    Column("competency_id", UUID(as_uuid=True)),
+    Column("competency", String),
+    Column("evaluator_relationship", ENUM(EvaluatorRelationship, name="evaluatorrelationship", create_type=False)),
+    Column("answers", Integer),
+    Column("score_sum", Integer),
+    Column("employees", Integer),
+)
+
+department_participation = Table(
+    "mv_department_participation", views_metadata,
+    Column("cycle_id", UUID(as_uuid=True)),
+    Column("department", String),
+    Column("employees_evaluated", Integer),
+    Column("evaluations", Integer),
+    Column("answers", Integer),
+    Column("score_sum", Integer),
+)
+
+
+def view_ddl():
+    """CREATE statements of every view and its unique index, in creation order."""
+    statements = []
+    for name, (definition, key) in VIEWS.items():
+        statements.append(f"CREATE MATERIALIZED VIEW {name} AS {definition.strip()}")
+        statements.append(f"CREATE UNIQUE INDEX ux_{name} ON {name} ({', '.join(key)})")
+    return statements
+
+
+def create_views(connection) -> None:
+    for statement in view_ddl():
+        connection.execute(text(statement))
+
+
+def drop_views(connection) -> None:
+    for name in reversed(list(VIEWS)):
+        connection.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {name}"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_views_after_tables(target, connection, **kw):
+    create_views(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_views_before_tables(target, connection, **kw):
+    drop_views(connection)
@@ -0,0 +1,35 @@
+"""
+Evaluation Anomaly Model (output of the anomaly detection job).
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+import enum
+from app.database import Base
+
+
+class AnomalyReason(str, enum.Enum):
+    """Why an evaluation was flagged."""
+    STRAIGHT_LINING = "STRAIGHT_LINING"  # Same score for every competency
+    RECIPROCAL_INFLATION = "RECIPROCAL_INFLATION"  # Two peers rating each other above the rest of their raters
+    OUTLIER = "OUTLIER"  # Far from the evaluatee's other raters
+
+
+class EvaluationAnomaly(Base):
+    """
+    A suspicious evaluation found by app.services.anomalies, which replaces the
+    flags of a whole cycle on each run. The primary key is also the keyset of
+    GET /cycles/{cycle_id}/anomalies.
+    """
+    __tablename__ = "evaluation_anomalies"
+
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("evaluation_cycles.id"), primary_key=True)
+    evaluation_id = Column(UUID(as_uuid=True), ForeignKey("evaluations.id", ondelete="CASCADE"), primary_key=True,
+                           index=True)
+    reason = Column(SQLEnum(AnomalyReason), primary_key=True)
+    # Measurements behind the flag (depend on the reason)
+    details = Column(JSONB, nullable=False)
+    detected_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<EvaluationAnomaly {self.evaluation_id} {self.reason}>"
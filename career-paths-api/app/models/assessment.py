@@ -1,7 +1,7 @@
 """
 Assessment Model (AI Skills Assessment).
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -45,12 +45,24 @@ class Assessment(Base):
     processing_completed_at = Column(DateTime, nullable=True)
     error_message = Column(String, nullable=True)
     
+    # Pipeline timeline (evaluation -> assessment -> career paths), in pipeline order:
+    # last_evaluation_submitted_at -> completion_detected_at -> queued_at -> processing_started_at
+    # -> ai_call_started_at -> ai_call_completed_at -> processing_completed_at -> career_paths_ready_at
+    last_evaluation_submitted_at = Column(DateTime, nullable=True)
+    completion_detected_at = Column(DateTime, nullable=True)
+    queued_at = Column(DateTime, nullable=True)
+    ai_call_started_at = Column(DateTime, nullable=True)
+    ai_call_completed_at = Column(DateTime, nullable=True)
+    career_paths_ready_at = Column(DateTime, nullable=True)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Constraint: un usuario solo puede tener un assessment por ciclo
     __table_args__ = (
         UniqueConstraint('user_id', 'cycle_id', name='uq_user_cycle_assessment'),
+        # Estado de los assessments de un ciclo sin leer la tabla (progreso del ciclo)
+        Index('ix_assessments_cycle_status', 'cycle_id', 'processing_status'),
     )
     
     # Relaciones
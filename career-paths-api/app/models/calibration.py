@@ -0,0 +1,43 @@
+"""
+Rater Calibration Models (output of the calibration engine).
+"""
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from app.database import Base
+
+
+class CalibratedScore(Base):
+    """
+    Score of one evaluation answer normalised against its evaluator's other ratings
+    in the cycle, so lenient and harsh raters become comparable.
+    Written in bulk by app.services.calibration, one cycle at a time.
+    """
+    __tablename__ = "calibrated_scores"
+
+    evaluation_detail_id = Column(UUID(as_uuid=True), ForeignKey("evaluation_details.id", ondelete="CASCADE"),
+                                  primary_key=True)
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("evaluation_cycles.id"), nullable=False, index=True)
+    z_score = Column(Float, nullable=False)  # Within the evaluator's ratings of the cycle
+    calibrated_score = Column(Float, nullable=False)  # z_score back on the cycle's 1-10 scale
+
+    def __repr__(self):
+        return f"<CalibratedScore {self.evaluation_detail_id}: {self.calibrated_score:.2f}>"
+
+
+class CompetencyCalibration(Base):
+    """Rater agreement and self-vs-others gap of a competency in a cycle."""
+    __tablename__ = "competency_calibrations"
+
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("evaluation_cycles.id"), primary_key=True)
+    competency_id = Column(UUID(as_uuid=True), ForeignKey("competencies.id"), primary_key=True)
+    answers = Column(Integer, nullable=False)
+    # ICC(1) of the ratings from others (1: raters agree, <= 0: no agreement); NULL when undefined
+    rater_agreement = Column(Float, nullable=True)
+    # Mean over employees of self score minus others' score (raw and calibrated)
+    self_delta = Column(Float, nullable=True)
+    self_delta_calibrated = Column(Float, nullable=True)
+    calibrated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CompetencyCalibration {self.cycle_id} {self.competency_id}>"
@@ -0,0 +1,164 @@
+"""
+Competency Score Model (pre-aggregated evaluation answers).
+"""
+from sqlalchemy import (
+    Column, Integer, BigInteger, ForeignKey, Enum as SQLEnum, column, delete, event, func, inspect, select, tuple_,
+    values
+)
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.orm import Session
+from app.database import Base
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_detail import EvaluationDetail
+
+
+class CompetencyScore(Base):
+    """
+    Running totals of the scores an employee received for a competency in a cycle,
+    per evaluator relationship. Mean, variance and self-vs-others gaps are derived
+    from these few rows instead of scanning every evaluation answer.
+
+    Kept up to date by the session events below in the same transaction as the
+    answers; bulk loads that bypass the ORM (COPY) call rebuild_competency_scores().
+    """
+    __tablename__ = "competency_scores"
+
+    employee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("evaluation_cycles.id"), primary_key=True)
+    competency_id = Column(UUID(as_uuid=True), ForeignKey("competencies.id"), primary_key=True)
+    evaluator_relationship = Column(SQLEnum(EvaluatorRelationship), primary_key=True)
+
+    answers = Column(Integer, nullable=False)
+    score_sum = Column(BigInteger, nullable=False)
+    score_sum_squares = Column(BigInteger, nullable=False)
+    score_min = Column(Integer, nullable=False)
+    score_max = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<CompetencyScore {self.employee_id} {self.competency_id} {self.evaluator_relationship}: {self.answers}>"
+
+
+scores = CompetencyScore.__table__
+evaluations = Evaluation.__table__
+details = EvaluationDetail.__table__
+KEY_COLUMNS = ["employee_id", "cycle_id", "competency_id", "evaluator_relationship"]
+TOTAL_COLUMNS = ["answers", "score_sum", "score_sum_squares", "score_min", "score_max"]
+
+
+def _totals(score):
+    """Aggregates of a set of answers, in TOTAL_COLUMNS order."""
+    return [
+        func.count(),
+        func.sum(score),
+        func.sum(score * score),
+        func.min(score),
+        func.max(score)
+    ]
+
+
+def record_scores(connection, new_details) -> None:
+    """Add new answers, given as (evaluation_id, competency_id, score), to the running totals."""
+    new_details = list(new_details)
+    if not new_details:
+        return
+    new = values(
+        column("evaluation_id", UUID(as_uuid=True)),
+        column("competency_id", UUID(as_uuid=True)),
+        column("score", Integer),
+        name="new_details"
+    ).data(new_details)
+    statement = insert(scores).from_select(KEY_COLUMNS + TOTAL_COLUMNS, select(
+        evaluations.c.employee_id,
+        evaluations.c.cycle_id,
+        new.c.competency_id,
+        evaluations.c.evaluator_relationship,
+        *_totals(new.c.score)
+    ).join_from(new, evaluations, evaluations.c.id == new.c.evaluation_id).group_by(
+        evaluations.c.employee_id, evaluations.c.cycle_id, new.c.competency_id, evaluations.c.evaluator_relationship
+    ))
+    excluded = statement.excluded
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=KEY_COLUMNS,
+        set_={
+            "answers": scores.c.answers + excluded.answers,
+            "score_sum": scores.c.score_sum + excluded.score_sum,
+            "score_sum_squares": scores.c.score_sum_squares + excluded.score_sum_squares,
+            "score_min": func.least(scores.c.score_min, excluded.score_min),
+            "score_max": func.greatest(scores.c.score_max, excluded.score_max)
+        }
+    ))
+
+
+def rebuild_competency_scores(connection, employee_cycles=None) -> None:
+    """
+    Recompute the totals from evaluation_details: for the given (employee_id, cycle_id)
+    pairs, or for everything (after bulk loads).
+    """
+    recompute = select(
+        evaluations.c.employee_id,
+        evaluations.c.cycle_id,
+        details.c.competency_id,
+        evaluations.c.evaluator_relationship,
+        *_totals(details.c.score)
+    ).join_from(details, evaluations, evaluations.c.id == details.c.evaluation_id).group_by(
+        evaluations.c.employee_id, evaluations.c.cycle_id, details.c.competency_id, evaluations.c.evaluator_relationship
+    )
+    stale = delete(scores)
+    if employee_cycles is not None:
+        employee_cycles = list(employee_cycles)
+        if not employee_cycles:
+            return
+        stale = stale.where(tuple_(scores.c.employee_id, scores.c.cycle_id).in_(employee_cycles))
+        recompute = recompute.where(tuple_(evaluations.c.employee_id, evaluations.c.cycle_id).in_(employee_cycles))
+    connection.execute(stale)
+    connection.execute(insert(scores).from_select(KEY_COLUMNS + TOTAL_COLUMNS, recompute))
+
+
+# Evaluation attributes that decide which totals its answers belong to
+EVALUATION_KEY_ATTRIBUTES = ("employee_id", "cycle_id", "evaluator_relationship")
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_answers(session, flush_context, instances):
+    """
+    Answers are normally only inserted, which after_flush adds incrementally. Edited or
+    deleted answers (and evaluations moved to another employee, cycle or relationship)
+    mark their (employee, cycle) totals for a recompute once the flush is done.
+    """
+    employee_cycles, evaluation_ids = set(), set()
+    for instance in session.deleted:
+        if isinstance(instance, Evaluation):
+            employee_cycles.add((instance.employee_id, instance.cycle_id))
+        elif isinstance(instance, EvaluationDetail):
+            evaluation_ids.add(instance.evaluation_id)
+    for instance in session.dirty:
+        if isinstance(instance, EvaluationDetail) and session.is_modified(instance):
+            evaluation_ids.add(instance.evaluation_id)
+        elif isinstance(instance, Evaluation):
+            state = inspect(instance)
+            if any(state.attrs[name].history.has_changes() for name in EVALUATION_KEY_ATTRIBUTES):
+                employee_cycles.add((instance.employee_id, instance.cycle_id))
+                employee_cycles.update(
+                    (employee_id, cycle_id)
+                    for employee_id in state.attrs.employee_id.history.deleted or [instance.employee_id]
+                    for cycle_id in state.attrs.cycle_id.history.deleted or [instance.cycle_id]
+                )
+    evaluation_ids.discard(None)
+    if evaluation_ids:
+        employee_cycles.update(session.connection().execute(
+            select(evaluations.c.employee_id, evaluations.c.cycle_id).where(evaluations.c.id.in_(evaluation_ids))
+        ).all())
+    if employee_cycles:
+        session.info.setdefault("stale_competency_scores", set()).update(employee_cycles)
+
+
+@event.listens_for(Session, "after_flush")
+def _update_competency_scores(session, flush_context):
+    record_scores(session.connection(), (
+        (instance.evaluation_id, instance.competency_id, instance.score)
+        for instance in session.new
+        if isinstance(instance, EvaluationDetail)
+    ))
+    stale = session.info.pop("stale_competency_scores", None)
+    if stale:
+        rebuild_competency_scores(session.connection(), stale)
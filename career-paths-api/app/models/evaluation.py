@@ -58,6 +58,8 @@ class Evaluation(Base):
     __table_args__ = (
         UniqueConstraint('evaluator_id', 'employee_id', 'cycle_id', name='uq_evaluator_employee_cycle'),
         Index('ix_evaluations_employee_cycle', 'employee_id', 'cycle_id'),
+        # Covers the cycle progress roll-up with an index-only scan
+        Index('ix_evaluations_cycle_coverage', 'cycle_id', 'employee_id', 'evaluator_relationship'),
     )
     
     # Relationships
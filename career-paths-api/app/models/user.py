@@ -1,7 +1,7 @@
 """
 User Model.
 """
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -22,10 +22,15 @@ class User(Base):
     current_position = Column(String, nullable=True)
     department = Column(String, nullable=True)
     years_experience = Column(String, nullable=True)
+    
+    # Reporting line; the full hierarchy is kept in the user_hierarchy closure table
+    manager_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
+    manager = relationship("User", remote_side=[id])
     evaluations_given = relationship("Evaluation", foreign_keys="Evaluation.evaluator_id", back_populates="evaluator")
     evaluations_received = relationship("Evaluation", foreign_keys="Evaluation.employee_id", back_populates="employee")
     assessments = relationship("Assessment", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,129 @@
+"""
+User Hierarchy Model (closure table of the reporting lines).
+"""
+from sqlalchemy import Column, Integer, ForeignKey, Index, delete, event, insert, inspect, literal, select, true
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+from app.models.user import User
+
+
+class UserHierarchy(Base):
+    """
+    One row per (ancestor, descendant) pair of the reporting lines, including every
+    user with itself at depth 0, so "everyone under manager X at any depth" is a
+    single lookup on the primary key.
+    
+    Kept up to date by the User mapper events below on every ORM write; bulk loads
+    that bypass the ORM (COPY) call rebuild_hierarchy() afterwards.
+    """
+    __tablename__ = "user_hierarchy"
+    
+    ancestor_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)  # 0: the user itself, 1: direct report...
+    
+    __table_args__ = (
+        # Ancestors of a user (moving a subtree)
+        Index('ix_user_hierarchy_descendant', 'descendant_id', 'depth'),
+    )
+    
+    def __repr__(self):
+        return f"<UserHierarchy {self.ancestor_id} -> {self.descendant_id} ({self.depth})>"
+
+
+hierarchy = UserHierarchy.__table__
+CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "depth"]
+
+
+def add_to_hierarchy(connection, user_id, manager_id=None) -> None:
+    """Insert a new user (a leaf) below ``manager_id``."""
+    connection.execute(insert(hierarchy).values(ancestor_id=user_id, descendant_id=user_id, depth=0))
+    if manager_id is not None:
+        connection.execute(insert(hierarchy).from_select(CLOSURE_COLUMNS, select(
+            hierarchy.c.ancestor_id,
+            literal(user_id, UUID(as_uuid=True)),
+            hierarchy.c.depth + 1
+        ).where(hierarchy.c.descendant_id == manager_id)))
+
+
+def detach_subtree(connection, user_id, include_self: bool = False) -> None:
+    """Cut the paths from the user's ancestors (and the user itself, if asked) into its subtree."""
+    subtree = select(hierarchy.c.descendant_id).where(hierarchy.c.ancestor_id == user_id)
+    ancestors = select(hierarchy.c.ancestor_id).where(hierarchy.c.descendant_id == user_id)
+    if not include_self:
+        ancestors = ancestors.where(hierarchy.c.ancestor_id != user_id)
+    connection.execute(delete(hierarchy).where(
+        hierarchy.c.descendant_id.in_(subtree),
+        hierarchy.c.ancestor_id.in_(ancestors)
+    ))
+
+
+def attach_subtree(connection, user_id, manager_id) -> None:
+    """Link every ancestor of ``manager_id`` (itself included) to every member of the user's subtree."""
+    above = hierarchy.alias("above")
+    below = hierarchy.alias("below")
+    connection.execute(insert(hierarchy).from_select(CLOSURE_COLUMNS, select(
+        above.c.ancestor_id,
+        below.c.descendant_id,
+        above.c.depth + below.c.depth + 1
+    ).select_from(above).join(below, true()).where(
+        above.c.descendant_id == manager_id,
+        below.c.ancestor_id == user_id
+    )))
+
+
+def reports_to(connection, user_id, manager_id) -> bool:
+    """Whether ``user_id`` is ``manager_id`` or somewhere under it."""
+    return connection.execute(select(literal(1)).where(
+        hierarchy.c.ancestor_id == manager_id,
+        hierarchy.c.descendant_id == user_id
+    )).first() is not None
+
+
+def rebuild_hierarchy(connection) -> None:
+    """Recompute the whole closure table from users.manager_id (after bulk loads)."""
+    users = User.__table__
+    tree = select(
+        users.c.id.label("ancestor_id"),
+        users.c.id.label("descendant_id"),
+        literal(0).label("depth")
+    ).cte("tree", recursive=True)
+    tree = tree.union_all(
+        select(tree.c.ancestor_id, users.c.id, tree.c.depth + 1).where(users.c.manager_id == tree.c.descendant_id)
+    )
+    connection.execute(delete(hierarchy))
+    connection.execute(insert(hierarchy).from_select(CLOSURE_COLUMNS, select(tree)))
+
+
+@event.listens_for(User, "before_insert")
+def _check_new_user(mapper, connection, user):
+    if user.manager_id is not None and user.manager_id == user.id:
+        raise ValueError("A user cannot be their own manager.")
+
+
+@event.listens_for(User, "before_update")
+def _check_new_manager(mapper, connection, user):
+    if user.manager_id is None or not inspect(user).attrs.manager_id.history.has_changes():
+        return
+    if reports_to(connection, user.manager_id, user.id):
+        raise ValueError("A user cannot report to themselves or to someone in their own reporting line.")
+
+
+@event.listens_for(User, "after_insert")
+def _add_user(mapper, connection, user):
+    add_to_hierarchy(connection, user.id, user.manager_id)
+
+
+@event.listens_for(User, "after_update")
+def _move_user(mapper, connection, user):
+    if not inspect(user).attrs.manager_id.history.has_changes():
+        return
+    detach_subtree(connection, user.id)
+    if user.manager_id is not None:
+        attach_subtree(connection, user.id, user.manager_id)
+
+
+@event.listens_for(User, "before_delete")
+def _remove_user(mapper, connection, user):
+    # Reports become roots, as users.manager_id is SET NULL
+    detach_subtree(connection, user.id, include_self=True)
@@ -0,0 +1,58 @@
+"""
+Fast JSON response helpers.
+
+FastAPI dumps a returned model to a dict, validates it again against
+``response_model`` and encodes the result. Routes that build their response
+themselves skip that round trip:
+
+- ``model_response`` serialises a model we constructed with pydantic-core,
+  without re-validating it (``response_model`` still documents the route).
+- ``rows_response`` / ``dumps`` encode Core ``Row`` mappings with orjson, which
+  handles UUID, datetime and enum values natively.
+- ``embed_raw_json`` splices JSON text produced by PostgreSQL (``jsonb::text``)
+  into a document, so large JSONB columns are never decoded into Python.
+
+The application's default response class is ``ORJSONResponse`` for the
+remaining routes that return plain dicts.
+"""
+from typing import Any, Iterable, Mapping, Optional, Union
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+__all__ = ["ORJSONResponse", "dumps", "embed_raw_json", "json_response", "model_response", "rows_response"]
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def embed_raw_json(document: bytes, field: str, raw_json: Union[str, bytes, None]) -> bytes:
+    """Append ``field`` with an already encoded JSON value to an encoded JSON object."""
+    if raw_json is None:
+        value = b"null"
+    else:
+        value = raw_json if isinstance(raw_json, bytes) else raw_json.encode("utf-8")
+    separator = b"," if document != b"{}" else b""
+    return b"".join((document[:-1], separator, dumps(field), b":", value, b"}"))
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Response for plain data, or for a document already encoded with ``dumps``."""
+    body = content if isinstance(content, bytes) else dumps(content)
+    return Response(body, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+
+def model_response(model: BaseModel, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """Response for a model built by the route itself (no re-validation)."""
+    return Response(model.model_dump_json().encode("utf-8"), status_code=status_code,
+                    headers=headers, media_type=JSON_MEDIA_TYPE)
+
+
+def rows_response(rows: Iterable[Any]) -> Response:
+    """JSON array of Core rows; column labels become the keys."""
+    return json_response([dict(row._mapping) for row in rows])
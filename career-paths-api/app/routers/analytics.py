@@ -0,0 +1,117 @@
+"""
+Router for org-level analytics.
+Endpoints read only the materialized views of app.models.analytics, never the
+evaluation tables, so their cost does not grow with the number of answers.
+"""
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from uuid import UUID
+from typing import Optional
+
+from app.database import get_read_db
+from app.models.analytics import competency_scores, department_participation
+from app.models.evaluation import EvaluatorRelationship
+from app.responses import dumps
+from app.schemas.analytics import CompetencyHeatmapResponse, DepartmentParticipationResponse
+from app.services.analytics import last_refreshed_at
+from app.services.response_cache import lookup, make_etag, store
+
+router = APIRouter(
+    tags=["analytics"]
+)
+
+
+def _average(score_sum: Optional[int], answers: int) -> Optional[float]:
+    return round(score_sum / answers, 2) if answers else None
+
+
+@router.get("/competency-heatmap",
+            response_model=CompetencyHeatmapResponse,
+            summary="Average score per competency, department and evaluator relationship",
+            responses={422: {"description": "Invalid UUID or relationship"}})
+async def get_competency_heatmap(
+    request: Request,
+    cycle_id: UUID = Query(..., description="Cycle to report"),
+    department: Optional[str] = Query(None, description="Restrict the report to one department"),
+    relationship: Optional[EvaluatorRelationship] = Query(None, description="Restrict to one evaluator relationship"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Competency x department x relationship heatmap of a cycle.
+
+    Data is as of **refreshed_at**: the views are refreshed every
+    ANALYTICS_REFRESH_INTERVAL_SECONDS and after a cycle closes.
+    """
+    cache_key = ("competency-heatmap", cycle_id, department, relationship)
+    cached = lookup(request, "competency_heatmap", cache_key)
+    if cached is not None:
+        return cached
+
+    query = select(competency_scores).where(competency_scores.c.cycle_id == cycle_id)
+    if department is not None:
+        query = query.where(competency_scores.c.department == department)
+    if relationship is not None:
+        query = query.where(competency_scores.c.evaluator_relationship == relationship)
+    query = query.order_by(
+        competency_scores.c.department,
+        competency_scores.c.competency,
+        competency_scores.c.evaluator_relationship
+    )
+
+    body = dumps({
+        "cycle_id": cycle_id,
+        "refreshed_at": last_refreshed_at(db),
+        "cells": [
+            {
+                "department": row.department,
+                "competency": row.competency,
+                "evaluator_relationship": row.evaluator_relationship.value,
+                "answers": row.answers,
+                "employees": row.employees,
+                "average_score": _average(row.score_sum, row.answers)
+            }
+            for row in db.execute(query)
+        ]
+    })
+    return store(request, cache_key, make_etag(body), body)
+
+
+@router.get("/departments",
+            response_model=DepartmentParticipationResponse,
+            summary="Evaluation participation and average score per department",
+            responses={422: {"description": "Invalid UUID"}})
+async def get_department_participation(
+    request: Request,
+    cycle_id: UUID = Query(..., description="Cycle to report"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Employees evaluated, evaluations, answers and average score of each department in a cycle
+    (as of **refreshed_at**).
+    """
+    cache_key = ("department-participation", cycle_id)
+    cached = lookup(request, "department_participation", cache_key)
+    if cached is not None:
+        return cached
+
+    rows = db.execute(
+        select(department_participation)
+        .where(department_participation.c.cycle_id == cycle_id)
+        .order_by(department_participation.c.department)
+    )
+    body = dumps({
+        "cycle_id": cycle_id,
+        "refreshed_at": last_refreshed_at(db),
+        "departments": [
+            {
+                "department": row.department,
+                "employees_evaluated": row.employees_evaluated,
+                "evaluations": row.evaluations,
+                "answers": row.answers,
+                "average_score": _average(row.score_sum, row.answers)
+            }
+            for row in rows
+        ]
+    })
+    return store(request, cache_key, make_etag(body), body)
@@ -2,108 +2,220 @@
 Router for skills assessments operations (AI skills analysis).
 Endpoint: /skills-assessments according to architecture
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import Text, and_, cast, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
 from uuid import UUID
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+import logging
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import any_uuid, get_read_db
 from app.models.assessment import Assessment, ProcessingStatus
+from app.models.calibration import CalibratedScore
 from app.models.user import User
 from app.models.evaluation import Evaluation, EvaluatorRelationship
 from app.models.evaluation_cycle import EvaluationCycle
-from app.schemas.assessment import SkillsAssessmentResponse
+from app.fieldsets import fields_query, parse_fields
+from app.responses import dumps, embed_raw_json, json_response
+from app.schemas.assessment import SkillsAssessmentBatchResponse, SkillsAssessmentResponse
+from app.schemas.batch import UserBatchRequest
+from app.routers.employees import employee_profile_cache_key
 from app.services.ai_integration import ai_service
+from app.services.metrics import PIPELINE_STAGE_DURATION
+from app.services.jobs import background_job
+from app.services.response_cache import lookup, make_etag, response_cache, store
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     tags=["skills-assessments"]
 )
 
+# Routes on the collection itself (/skills-assessments:batchGet), mounted at the API prefix
+batch_router = APIRouter(
+    tags=["skills-assessments"]
+)
+
+
+# Column read for each selectable field (?fields=); ai_profile is read as JSON text
+SKILLS_ASSESSMENT_COLUMNS = {
+    "assessment_id": Assessment.id.label("assessment_id"),
+    "user_id": Assessment.user_id,
+    "cycle_id": Assessment.cycle_id,
+    "ai_profile": cast(Assessment.ai_profile, Text).label("ai_profile"),
+    "processing_status": Assessment.processing_status,
+    "timestamp": Assessment.created_at.label("timestamp")
+}
+SKILLS_ASSESSMENT_FIELDS = list(SkillsAssessmentResponse.model_fields)
 
-async def trigger_ai_processing(user_id: UUID, cycle_id: UUID, db: Session):
+
+def skills_assessment_cache_key(user_id: UUID):
+    """Response cache key of a user's skills assessment."""
+    return ("skills-assessment", user_id)
+
+
+def build_evaluation_payload(
+    user_id: UUID,
+    cycle_id: UUID,
+    evaluations: List[Evaluation],
+    calibrated_scores: Optional[Dict[UUID, float]] = None
+) -> Dict[str, Any]:
     """
-    Helper function to trigger AI processing.
-    Collects all cycle evaluations and calls the AI service.
+    Prepare the evaluations of a user/cycle for the AI service (simplified format).
+    Pure function over already loaded evaluations, so it can be benchmarked without a database.
+    ``calibrated_scores`` (evaluation_detail_id -> calibrated score) adds "calibrated_score"
+    to the answers that have one.
     """
-    try:
-        # Check if an assessment already exists for this user/cycle
-        existing_assessment = db.query(Assessment).filter(
-            and_(
-                Assessment.user_id == user_id,
-                Assessment.cycle_id == cycle_id
-            )
-        ).first()
-        
-        if existing_assessment and existing_assessment.processing_status == ProcessingStatus.COMPLETED:
-            # Already processed, do nothing
-            return
-        
-        if not existing_assessment:
-            # Create new assessment
-            assessment = Assessment(
-                user_id=user_id,
-                cycle_id=cycle_id,
-                processing_status=ProcessingStatus.PENDING
-            )
-            db.add(assessment)
-            db.flush()
-        else:
-            assessment = existing_assessment
-        
-        # Update status to PROCESSING
-        assessment.processing_status = ProcessingStatus.PROCESSING
-        assessment.processing_started_at = datetime.utcnow()
-        db.commit()
-        
-        # Collect all cycle evaluations for this user
-        evaluations = db.query(Evaluation).filter(
-            and_(
-                Evaluation.employee_id == user_id,
-                Evaluation.cycle_id == cycle_id
-            )
-        ).all()
-        
-        if not evaluations:
-            raise Exception("No evaluations found for this user/cycle")
-        
-        # Prepare data for AI (simplified format)
-        evaluation_data = {
-            "user_id": str(user_id),
-            "cycle_id": str(cycle_id),
-            "evaluations": []
+    evaluation_data = {
+        "user_id": str(user_id),
+        "cycle_id": str(cycle_id),
+        "evaluations": []
+    }
+    
+    for eval in evaluations:
+        eval_dict = {
+            "relationship": eval.evaluator_relationship.value,
+            "competencies": []
         }
-        
-        for eval in evaluations:
-            eval_dict = {
-                "relationship": eval.evaluator_relationship.value,
-                "competencies": []
+        for detail in eval.details:
+            answer = {
+                "name": detail.competency.name if detail.competency else "Unknown",
+                "score": detail.score,
+                "comments": detail.comments
             }
-            for detail in eval.details:
-                eval_dict["competencies"].append({
-                    "name": detail.competency.name if detail.competency else "Unknown",
-                    "score": detail.score,
-                    "comments": detail.comments
-                })
-            evaluation_data["evaluations"].append(eval_dict)
-        
-        # Call AI service
-        ai_result = await ai_service.analyze_skills(evaluation_data)
-        
-        # Update assessment with results
-        assessment.ai_profile = ai_result
-        assessment.processing_status = ProcessingStatus.COMPLETED
-        assessment.processing_completed_at = datetime.utcnow()
-        
-        db.commit()
-        
-    except Exception as e:
-        # In case of error, update the assessment
-        if 'assessment' in locals():
-            assessment.processing_status = ProcessingStatus.FAILED
-            assessment.error_message = str(e)
-            assessment.processing_completed_at = datetime.utcnow()
+            if calibrated_scores and detail.id in calibrated_scores:
+                answer["calibrated_score"] = round(calibrated_scores[detail.id], 2)
+            eval_dict["competencies"].append(answer)
+        evaluation_data["evaluations"].append(eval_dict)
+    
+    return evaluation_data
+
+
+def skills_assessment_json(row, fields: Iterable[str] = SKILLS_ASSESSMENT_FIELDS) -> bytes:
+    """Encode an assessment row (see get_skills_assessment) as a SkillsAssessmentResponse document."""
+    document = dumps({name: getattr(row, name) for name in fields if name != "ai_profile"})
+    if "ai_profile" not in fields:
+        return document
+    return embed_raw_json(document, "ai_profile", row.ai_profile)
+
+
+async def trigger_ai_processing(
+    user_id: UUID,
+    cycle_id: UUID,
+    db: Session,
+    last_evaluation_submitted_at: Optional[datetime] = None,
+    completion_detected_at: Optional[datetime] = None,
+    queued_at: Optional[datetime] = None
+):
+    """
+    Helper function to trigger AI processing.
+    Collects all cycle evaluations and calls the AI service.
+    
+    The optional timestamps describe the pipeline stages that happened before
+    this job ran; they are persisted on the assessment with the stages timed here.
+    """
+    with background_job("assessment", user_id=user_id, cycle_id=cycle_id):
+        try:
+            # Check if an assessment already exists for this user/cycle
+            existing_assessment = db.query(Assessment).filter(
+                and_(
+                    Assessment.user_id == user_id,
+                    Assessment.cycle_id == cycle_id
+                )
+            ).first()
+            
+            if existing_assessment and existing_assessment.processing_status == ProcessingStatus.COMPLETED:
+                # Already processed, do nothing
+                return
+            
+            if not existing_assessment:
+                # Create new assessment
+                assessment = Assessment(
+                    user_id=user_id,
+                    cycle_id=cycle_id,
+                    processing_status=ProcessingStatus.PENDING
+                )
+                db.add(assessment)
+                db.flush()
+            else:
+                assessment = existing_assessment
+            
+            # Update status to PROCESSING
+            assessment.processing_status = ProcessingStatus.PROCESSING
+            assessment.last_evaluation_submitted_at = last_evaluation_submitted_at
+            assessment.completion_detected_at = completion_detected_at
+            assessment.queued_at = queued_at
+            assessment.processing_started_at = datetime.utcnow()
+            assessment.ai_call_started_at = None
+            assessment.ai_call_completed_at = None
+            assessment.career_paths_ready_at = None
             db.commit()
+            
+            with PIPELINE_STAGE_DURATION.labels(stage="collect_evaluations").time():
+                # Collect all cycle evaluations for this user
+                evaluations = db.query(Evaluation).filter(
+                    and_(
+                        Evaluation.employee_id == user_id,
+                        Evaluation.cycle_id == cycle_id
+                    )
+                ).all()
+                
+                if not evaluations:
+                    raise Exception("No evaluations found for this user/cycle")
+                
+                if assessment.last_evaluation_submitted_at is None:
+                    # Manual processing: the last submission is the newest evaluation
+                    assessment.last_evaluation_submitted_at = max(e.created_at for e in evaluations)
+                
+                calibrated_scores = None
+                if settings.AI_USE_CALIBRATED_SCORES:
+                    calibrated_scores = dict(db.execute(
+                        select(CalibratedScore.evaluation_detail_id, CalibratedScore.calibrated_score).where(
+                            CalibratedScore.evaluation_detail_id.in_(
+                                [detail.id for evaluation in evaluations for detail in evaluation.details]
+                            )
+                        )
+                    ).all())
+                
+                evaluation_data = build_evaluation_payload(user_id, cycle_id, evaluations, calibrated_scores)
+            
+            # Call AI service
+            assessment.ai_call_started_at = datetime.utcnow()
+            with PIPELINE_STAGE_DURATION.labels(stage="ai_skills_analysis").time():
+                if settings.AI_PROFILE_PASSTHROUGH:
+                    # The validated JSON text is cast to JSONB by PostgreSQL
+                    raw_profile = await ai_service.analyze_skills_raw(evaluation_data)
+                    ai_result = cast(literal(raw_profile.decode("utf-8"), Text), JSONB)
+                else:
+                    ai_result = await ai_service.analyze_skills(evaluation_data)
+            assessment.ai_call_completed_at = datetime.utcnow()
+            
+            # Update assessment with results
+            with PIPELINE_STAGE_DURATION.labels(stage="persist_assessment").time():
+                assessment.ai_profile = ai_result
+                assessment.processing_status = ProcessingStatus.COMPLETED
+                assessment.processing_completed_at = datetime.utcnow()
+                
+                db.commit()
+            
+            response_cache.invalidate(skills_assessment_cache_key(user_id), employee_profile_cache_key(user_id))
+            
+        except Exception as e:
+            logger.exception(
+                "AI processing failed",
+                extra={"user_id": str(user_id), "cycle_id": str(cycle_id)}
+            )
+            # In case of error, update the assessment
+            if 'assessment' in locals():
+                assessment.processing_status = ProcessingStatus.FAILED
+                assessment.error_message = str(e)
+                assessment.processing_completed_at = datetime.utcnow()
+                db.commit()
 
 
 @router.get("/{user_id}", 
@@ -115,34 +227,54 @@ async def trigger_ai_processing(user_id: UUID, cycle_id: UUID, db: Session):
             })
 async def get_skills_assessment(
     user_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    fields: Optional[str] = fields_query(),
+    db: Session = Depends(get_read_db)
 ):
     """
     Gets the most recent skills assessment for a user.
     
     - **user_id**: User ID
+    - **fields**: Fields to return (default: all); leaving out ai_profile skips reading the JSONB column
     
     Returns the AI-generated skills profile with:
     - strengths: Identified strengths
     - growth_areas: Areas for improvement
     - hidden_talents: Hidden talents
     - readiness_for_roles: Readiness for different roles
+    
+    Full responses carry an ETag; send it back in If-None-Match to get 304 when unchanged.
     """
+    selected = parse_fields(fields, SKILLS_ASSESSMENT_FIELDS)
+    # Only the full representation is cached
+    sparse = selected != SKILLS_ASSESSMENT_FIELDS
+    cache_key = skills_assessment_cache_key(user_id)
+    if not sparse:
+        cached = lookup(request, "skills_assessment", cache_key)
+        if cached is not None:
+            return cached
+    
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User.id).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Employee with ID {user_id} not found."
         )
     
-    # Get the most recent completed assessment
-    assessment = db.query(Assessment).filter(
-        and_(
-            Assessment.user_id == user_id,
-            Assessment.processing_status == ProcessingStatus.COMPLETED
-        )
-    ).order_by(Assessment.created_at.desc()).first()
+    # Get the most recent completed assessment, reading only the requested columns;
+    # ai_profile is read as JSON text and embedded in the response as is, without decoding it
+    columns = [SKILLS_ASSESSMENT_COLUMNS[name] for name in selected]
+    if not sparse:
+        columns.append(Assessment.updated_at)
+    assessment = db.execute(
+        select(*columns).where(
+            and_(
+                Assessment.user_id == user_id,
+                Assessment.processing_status == ProcessingStatus.COMPLETED
+            )
+        ).order_by(Assessment.created_at.desc()).limit(1)
+    ).first()
     
     if not assessment:
         raise HTTPException(
@@ -150,4 +282,47 @@ async def get_skills_assessment(
             detail="No skills assessments have been processed for this employee yet."
         )
     
-    return SkillsAssessmentResponse.from_assessment(assessment)
+    if sparse:
+        return json_response(skills_assessment_json(assessment, selected))
+    return store(
+        request,
+        cache_key,
+        make_etag(assessment.assessment_id, assessment.updated_at),
+        skills_assessment_json(assessment)
+    )
+
+
+@batch_router.post("/skills-assessments:batchGet",
+                   response_model=SkillsAssessmentBatchResponse,
+                   summary="Get skills assessments for several users",
+                   responses={
+                       422: {"description": "Invalid UUIDs, or more user IDs than BATCH_GET_MAX_USERS"}
+                   })
+async def batch_get_skills_assessments(
+    batch: UserBatchRequest,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Gets the most recent completed skills assessment of each requested user with a single query.
+    
+    - **user_ids**: User IDs (duplicates are ignored)
+    
+    Assessments are returned in request order; users without one (or unknown users) are
+    listed in missing_user_ids.
+    """
+    # DISTINCT ON keeps the first row per user in ORDER BY order: the latest assessment
+    assessments = db.execute(
+        select(*SKILLS_ASSESSMENT_COLUMNS.values()).where(
+            and_(
+                any_uuid(Assessment.user_id, batch.user_ids),
+                Assessment.processing_status == ProcessingStatus.COMPLETED
+            )
+        ).distinct(Assessment.user_id).order_by(Assessment.user_id, Assessment.created_at.desc())
+    ).all()
+    by_user = {assessment.user_id: assessment for assessment in assessments}
+    
+    documents = b",".join(skills_assessment_json(by_user[user_id]) for user_id in batch.user_ids if user_id in by_user)
+    missing = [user_id for user_id in batch.user_ids if user_id not in by_user]
+    return json_response(embed_raw_json(
+        dumps({"missing_user_ids": missing}), "skills_assessments", b"[" + documents + b"]"
+    ))
@@ -2,161 +2,266 @@
 Router for career paths operations.
 Endpoints: /career-paths according to architecture
 """
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, status, BackgroundTasks
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from uuid import UUID
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, List, Optional
+from collections import defaultdict
+import logging
+import time
 
-from app.database import get_db
+from app.database import any_uuid, get_db, get_read_db
 from app.models.career_path import CareerPath, CareerPathStatus
 from app.models.career_path_step import CareerPathStep
 from app.models.development_action import DevelopmentAction
 from app.models.user import User
 from app.models.assessment import Assessment, ProcessingStatus
 from app.schemas.career_path import (
+    CareerPathsBatchResponse,
     CareerPathsListResponse,
     CareerPathSummaryResponse,
     CareerPathStepsResponse,
-    CareerPathStepDetail,
     CareerPathAcceptResponse
 )
+from app.fieldsets import fields_query, include_query, parse_fields, parse_include
+from app.responses import dumps, json_response, model_response
+from app.schemas.batch import UserBatchRequest
+from app.routers.employees import employee_profile_cache_key
 from app.services.ai_integration import ai_service
+from app.services.metrics import PIPELINE_STAGE_DURATION
+from app.services.jobs import background_job
+from app.services.response_cache import lookup, make_etag, response_cache, store
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     tags=["career-paths"]
 )
 
+# Routes on the collection itself (/career-paths:batchGet), mounted at the API prefix
+batch_router = APIRouter(
+    tags=["career-paths"]
+)
+
+
+# Column read for each selectable field (?fields=); "steps" comes from career_path_steps
+CAREER_PATH_COLUMNS = {
+    "path_id": CareerPath.id.label("path_id"),
+    "path_name": CareerPath.path_name,
+    "recommended": CareerPath.recommended,
+    "total_duration_months": CareerPath.total_duration_months,
+    "feasibility_score": CareerPath.feasibility_score,
+    "status": CareerPath.status,
+    "generated_at": CareerPath.generated_at
+}
+SUMMARY_FIELDS = list(CareerPathSummaryResponse.model_fields)
+STEPS_FIELDS = list(CareerPathStepsResponse.model_fields)
+# development_actions implies steps
+SUMMARY_INCLUDES = ("steps", "development_actions")
+STEPS_INCLUDES = ("development_actions",)
+
+
+def career_paths_cache_key(user_id: UUID):
+    """Response cache key of a user's career path list."""
+    return ("career-paths", user_id)
+
+
+def select_current_paths(db: Session, user_id: UUID, columns: List):
+    """Non-archived paths of a user, newest first, reading only ``columns``."""
+    return db.execute(
+        select(*columns).where(
+            and_(
+                CareerPath.user_id == user_id,
+                CareerPath.status != CareerPathStatus.ARCHIVED
+            )
+        ).order_by(CareerPath.generated_at.desc())
+    ).all()
+
+
+def career_paths_document(user_id: UUID, paths: List, selected: List[str] = SUMMARY_FIELDS,
+                          steps: Optional[Dict[UUID, List[dict]]] = None) -> dict:
+    """
+    CareerPathsListResponse document for rows selected with ``_id``, ``_generated_at`` and
+    the ``selected`` summary columns (newest first); ``steps`` embeds each path's steps.
+    """
+    generated_paths = []
+    for path in paths:
+        summary = {name: path._mapping[name] for name in selected}
+        if steps is not None:
+            summary["steps"] = steps.get(path._id, [])
+        generated_paths.append(summary)
+    return {
+        "career_path_id": paths[0]._id,
+        "user_id": user_id,
+        "generated_paths": generated_paths,
+        "timestamp": paths[0]._generated_at
+    }
+
+
+def load_steps(db: Session, path_ids: Iterable[UUID], with_actions: bool = False) -> Dict[UUID, List[dict]]:
+    """
+    Steps (CareerPathStepDetail documents) of several paths in step order, in a single query;
+    development actions are loaded with one more query when requested.
+    """
+    steps = defaultdict(list)
+    rows = db.execute(
+        select(
+            CareerPathStep.id,
+            CareerPathStep.career_path_id,
+            CareerPathStep.step_order,
+            CareerPathStep.target_role,
+            CareerPathStep.duration_months,
+            CareerPathStep.required_competencies
+        ).where(
+            CareerPathStep.career_path_id.in_(list(path_ids))
+        ).order_by(CareerPathStep.career_path_id, CareerPathStep.step_order)
+    ).all()
+    
+    actions = defaultdict(list)
+    if with_actions and rows:
+        for action in db.execute(
+            select(DevelopmentAction.step_id, DevelopmentAction.type, DevelopmentAction.description)
+            .where(DevelopmentAction.step_id.in_([row.id for row in rows]))
+        ):
+            actions[action.step_id].append({"type": action.type, "description": action.description})
+    
+    for row in rows:
+        step = {
+            "step_number": row.step_order,
+            "target_role": row.target_role,
+            "duration_months": row.duration_months,
+            "required_competencies": row.required_competencies or []
+        }
+        if with_actions:
+            step["development_actions"] = actions[row.id]
+        steps[row.career_path_id].append(step)
+    return steps
+
 
 async def generate_career_paths_task(user_id: UUID, db: Session):
     """
     Generates career paths in the background using the AI service.
     """
-    import traceback
-    try:
-        print(f"[DEBUG] Starting career path generation for user {user_id}")
-        
-        # Get the user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            print(f"[ERROR] User {user_id} not found")
-            return
-        
-        print(f"[DEBUG] User found: {user.full_name}")
-        
-        # Get the most recent completed assessment
-        latest_assessment = db.query(Assessment).filter(
-            and_(
-                Assessment.user_id == user_id,
-                Assessment.processing_status == ProcessingStatus.COMPLETED
-            )
-        ).order_by(Assessment.created_at.desc()).first()
-        
-        if not latest_assessment or not latest_assessment.ai_profile:
-            error_msg = "No completed assessment found for user"
-            print(f"[ERROR] {error_msg}")
-            raise Exception(error_msg)
-        
-        print(f"[DEBUG] Assessment found: {latest_assessment.id}")
-        
-        # Prepare user profile
-        user_profile = {
-            "user_id": str(user_id),
-            "email": user.email,
-            "full_name": user.full_name,
-            "current_position": user.current_position,
-            "department": user.department,
-            "years_experience": user.years_experience
-        }
-        
-        print(f"[DEBUG] Calling AI service to generate career paths")
-        
-        # Call AI service to generate paths
-        career_data = await ai_service.generate_career_paths(
-            user_profile=user_profile,
-            ai_profile=latest_assessment.ai_profile
-        )
-        
-        print(f"[DEBUG] AI service returned data with {len(career_data.get('generated_paths', []))} paths")
-        
-        # Archive previous paths
-        archived_count = db.query(CareerPath).filter(
-            and_(
-                CareerPath.user_id == user_id,
-                CareerPath.status == CareerPathStatus.GENERATED
-            )
-        ).update({"status": CareerPathStatus.ARCHIVED})
-        
-        print(f"[DEBUG] Archived {archived_count} previous paths")
-        
-        # Create the new paths
-        paths_data = career_data.get("generated_paths", [])
-        for idx, path_data in enumerate(paths_data):
-            print(f"[DEBUG] Creating path {idx + 1}: {path_data.get('path_name')}")
+    with background_job("career-paths", user_id=user_id):
+        try:
+            logger.info("Starting career path generation", extra={"user_id": str(user_id)})
             
-            career_path = CareerPath(
-                user_id=user_id,
-                path_name=path_data.get("path_name"),
-                recommended=path_data.get("recommended", False),
-                total_duration_months=path_data.get("total_duration_months", 12),
-                feasibility_score=path_data.get("feasibility_score"),
-                status=CareerPathStatus.GENERATED
-            )
-            db.add(career_path)
-            db.flush()
+            # Get the user
+            user = db.query(User).filter(User.id == user_id).first()
+            if not user:
+                logger.error("User not found for career path generation", extra={"user_id": str(user_id)})
+                return
             
-            print(f"[DEBUG] Path created with ID: {career_path.id}")
+            # Get the most recent completed assessment
+            latest_assessment = db.query(Assessment).filter(
+                and_(
+                    Assessment.user_id == user_id,
+                    Assessment.processing_status == ProcessingStatus.COMPLETED
+                )
+            ).order_by(Assessment.created_at.desc()).first()
             
-            # Create the path steps
-            steps_data = path_data.get("steps", [])
-            for step_data in steps_data:
-                print(f"[DEBUG]   Creating step {step_data.get('step_number')}: {step_data.get('title')}")
-                
-                step = CareerPathStep(
-                    career_path_id=career_path.id,
-                    step_order=step_data.get("step_number"),
-                    title=step_data.get("title", ""),
-                    target_role=step_data.get("target_role"),
-                    duration_months=step_data.get("duration_months"),
-                    required_competencies=step_data.get("required_competencies")
+            if not latest_assessment or not latest_assessment.ai_profile:
+                raise Exception("No completed assessment found for user")
+            
+            logger.debug("Using assessment %s", latest_assessment.id)
+            
+            # Prepare user profile
+            user_profile = {
+                "user_id": str(user_id),
+                "email": user.email,
+                "full_name": user.full_name,
+                "current_position": user.current_position,
+                "department": user.department,
+                "years_experience": user.years_experience
+            }
+            
+            # Call AI service to generate paths
+            with PIPELINE_STAGE_DURATION.labels(stage="ai_career_paths").time():
+                career_data = await ai_service.generate_career_paths(
+                    user_profile=user_profile,
+                    ai_profile=latest_assessment.ai_profile
+                )
+            
+            persist_started = time.perf_counter()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            
+            # Archive previous paths
+            archived_count = db.query(CareerPath).filter(
+                and_(
+                    CareerPath.user_id == user_id,
+                    CareerPath.status == CareerPathStatus.GENERATED
+                )
+            ).update({"status": CareerPathStatus.ARCHIVED})
+            
+            # Create the new paths
+            paths_data = career_data.get("generated_paths", [])
+            for path_data in paths_data:
+                career_path = CareerPath(
+                    user_id=user_id,
+                    path_name=path_data.get("path_name"),
+                    recommended=path_data.get("recommended", False),
+                    total_duration_months=path_data.get("total_duration_months", 12),
+                    feasibility_score=path_data.get("feasibility_score"),
+                    status=CareerPathStatus.GENERATED
                 )
-                db.add(step)
+                db.add(career_path)
                 db.flush()
                 
-                print(f"[DEBUG]   Step created with ID: {step.id}")
+                if debug_enabled:
+                    logger.debug("Created path %s: %s", career_path.id, career_path.path_name)
                 
-                # Create development actions
-                actions_data = step_data.get("development_actions", [])
-                for action_data in actions_data:
-                    if isinstance(action_data, dict):
-                        action = DevelopmentAction(
-                            step_id=step.id,
-                            type=action_data.get("type", "training"),
-                            description=action_data.get("description", "")
-                        )
-                        db.add(action)
-                    elif isinstance(action_data, str):
-                        # If it's a string, create generic action
-                        action = DevelopmentAction(
-                            step_id=step.id,
-                            type="training",
-                            description=action_data
-                        )
-                        db.add(action)
-                
-                print(f"[DEBUG]   Created {len(actions_data)} actions for step")
-        
-        print(f"[DEBUG] Committing changes to database")
-        db.commit()
-        print(f"[DEBUG] Career paths generation completed successfully")
-        
-    except Exception as e:
-        print(f"[ERROR] Error generating career paths: {e}")
-        print(f"[ERROR] Traceback:\n{traceback.format_exc()}")
-        db.rollback()
-        raise
-        db.rollback()
+                # Create the path steps
+                steps_data = path_data.get("steps", [])
+                for step_data in steps_data:
+                    step = CareerPathStep(
+                        career_path_id=career_path.id,
+                        step_order=step_data.get("step_number"),
+                        title=step_data.get("title", ""),
+                        target_role=step_data.get("target_role"),
+                        duration_months=step_data.get("duration_months"),
+                        required_competencies=step_data.get("required_competencies")
+                    )
+                    db.add(step)
+                    db.flush()
+                    
+                    # Create development actions
+                    actions_data = step_data.get("development_actions", [])
+                    for action_data in actions_data:
+                        if isinstance(action_data, dict):
+                            action = DevelopmentAction(
+                                step_id=step.id,
+                                type=action_data.get("type", "training"),
+                                description=action_data.get("description", "")
+                            )
+                            db.add(action)
+                        elif isinstance(action_data, str):
+                            # If it's a string, create generic action
+                            action = DevelopmentAction(
+                                step_id=step.id,
+                                type="training",
+                                description=action_data
+                            )
+                            db.add(action)
+                    
+                    if debug_enabled:
+                        logger.debug("Created step %s (%s) with %d actions",
+                                     step.step_order, step.id, len(actions_data))
+            
+            latest_assessment.career_paths_ready_at = datetime.utcnow()
+            db.commit()
+            response_cache.invalidate(career_paths_cache_key(user_id), employee_profile_cache_key(user_id))
+            PIPELINE_STAGE_DURATION.labels(stage="persist_career_paths").observe(time.perf_counter() - persist_started)
+            logger.info(
+                "Career paths generation completed",
+                extra={"user_id": str(user_id), "paths": len(paths_data), "archived": archived_count}
+            )
+            
+        except Exception:
+            logger.exception("Error generating career paths", extra={"user_id": str(user_id)})
+            db.rollback()
+            raise
 
 
 @router.get("/{user_id}",
@@ -169,18 +274,41 @@ async def generate_career_paths_task(user_id: UUID, db: Session):
             })
 async def get_career_paths(
     user_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    fields: Optional[str] = fields_query(),
+    include: Optional[str] = include_query(*SUMMARY_INCLUDES),
+    db: Session = Depends(get_read_db)
 ):
     """
     Gets a user's career paths.
     If they don't exist, generates them automatically.
     
     - **user_id**: User ID
+    - **fields**: Fields of each generated path to return (default: all)
+    - **include**: `steps` embeds each path's steps, `development_actions` also their actions
     
     Returns list of generated paths with summary information.
+    Full responses carry an ETag; send it back in If-None-Match to get 304 when unchanged.
     """
+    selected = parse_fields(fields, SUMMARY_FIELDS)
+    includes = parse_include(include, SUMMARY_INCLUDES)
+    # Only the full summary is cached
+    sparse = selected != SUMMARY_FIELDS or bool(includes)
+    cache_key = career_paths_cache_key(user_id)
+    if not sparse:
+        cached = lookup(request, "career_paths", cache_key)
+        if cached is not None:
+            return cached
+    
+    # The id and generation time are always read (response envelope); status and
+    # updated_at also when the ETag is computed
+    columns = [CareerPath.id.label("_id"), CareerPath.generated_at.label("_generated_at")]
+    columns += [CAREER_PATH_COLUMNS[name] for name in selected]
+    if not sparse:
+        columns += [CareerPath.status.label("_status"), CareerPath.updated_at.label("_updated_at")]
+    
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User.id).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -188,12 +316,12 @@ async def get_career_paths(
         )
     
     # Search for user's generated paths
-    career_paths = db.query(CareerPath).filter(
-        and_(
-            CareerPath.user_id == user_id,
-            CareerPath.status != CareerPathStatus.ARCHIVED
-        )
-    ).order_by(CareerPath.generated_at.desc()).all()
+    career_paths = select_current_paths(db, user_id, columns)
+    
+    if not career_paths and db.reads_from_replica():
+        # A lagging replica may miss recent paths; confirm on the primary before generating
+        db.use_primary()
+        career_paths = select_current_paths(db, user_id, columns)
     
     if not career_paths:
         # Don't exist, check if there's a completed assessment
@@ -215,12 +343,7 @@ async def get_career_paths(
             await generate_career_paths_task(user_id, db)
             
             # Retrieve the newly generated paths
-            career_paths = db.query(CareerPath).filter(
-                and_(
-                    CareerPath.user_id == user_id,
-                    CareerPath.status != CareerPathStatus.ARCHIVED
-                )
-            ).order_by(CareerPath.generated_at.desc()).all()
+            career_paths = select_current_paths(db, user_id, columns)
             
             if not career_paths:
                 raise HTTPException(
@@ -233,15 +356,15 @@ async def get_career_paths(
                 detail=f"Error generating career paths: {str(e)}"
             )
     
-    # Construir respuesta
-    paths_summaries = [CareerPathSummaryResponse.from_career_path(path) for path in career_paths]
-    
-    return CareerPathsListResponse(
-        career_path_id=career_paths[0].id if career_paths else None,
-        user_id=user_id,
-        generated_paths=paths_summaries,
-        timestamp=career_paths[0].generated_at if career_paths else datetime.utcnow()
-    )
+    # Construir respuesta (CareerPathsListResponse)
+    steps = None
+    if includes:
+        steps = load_steps(db, [path._id for path in career_paths], "development_actions" in includes)
+    body = dumps(career_paths_document(user_id, career_paths, selected, steps))
+    if sparse:
+        return json_response(body)
+    etag = make_etag(*((path._id, path._status.value, path._updated_at) for path in career_paths))
+    return store(request, cache_key, etag, body)
 
 
 @router.get("/{path_id}/steps",
@@ -254,16 +377,31 @@ async def get_career_paths(
             })
 async def get_career_path_steps(
     path_id: UUID,
-    db: Session = Depends(get_db)
+    fields: Optional[str] = fields_query(),
+    include: Optional[str] = include_query(*STEPS_INCLUDES),
+    db: Session = Depends(get_read_db)
 ):
     """
     Gets detailed steps for a specific path.
     
     - **path_id**: Path ID
+    - **fields**: Fields to return (default: all); steps are only loaded when requested
+    - **include**: `development_actions` embeds each step's development actions
     
-    Returns steps with required competencies and development actions.
+    Returns steps with required competencies and, on request, development actions.
     """
-    career_path = db.query(CareerPath).filter(CareerPath.id == path_id).first()
+    selected = parse_fields(fields, STEPS_FIELDS)
+    includes = parse_include(include, STEPS_INCLUDES)
+    if includes and "steps" not in selected:
+        selected.append("steps")
+    
+    # The id is always selected so a missing path is told apart from an empty selection
+    career_path = db.execute(
+        select(
+            CareerPath.id.label("_id"),
+            *(CAREER_PATH_COLUMNS[name] for name in selected if name != "steps")
+        ).where(CareerPath.id == path_id)
+    ).first()
     
     if not career_path:
         raise HTTPException(
@@ -271,25 +409,11 @@ async def get_career_path_steps(
             detail=f"Path with ID {path_id} not found."
         )
     
-    # Build response with steps
-    steps_response = []
-    for step in career_path.steps:
-        step_detail = CareerPathStepDetail(
-            step_number=step.step_order,
-            target_role=step.target_role,
-            duration_months=step.duration_months,
-            required_competencies=step.required_competencies or []
-        )
-        steps_response.append(step_detail)
-    
-    return CareerPathStepsResponse(
-        path_id=career_path.id,
-        path_name=career_path.path_name,
-        total_duration_months=career_path.total_duration_months,
-        feasibility_score=career_path.feasibility_score,
-        status=career_path.status.value,
-        steps=steps_response
-    )
+    steps = load_steps(db, [path_id], "development_actions" in includes) if "steps" in selected else {}
+    return json_response({
+        name: steps.get(path_id, []) if name == "steps" else career_path._mapping[name]
+        for name in selected
+    })
 
 
 @router.post("/{path_id}/accept",
@@ -341,10 +465,57 @@ async def accept_career_path(
     career_path.status = CareerPathStatus.IN_PROGRESS
     career_path.started_at = datetime.utcnow()
     db.commit()
+    response_cache.invalidate(
+        career_paths_cache_key(career_path.user_id),
+        employee_profile_cache_key(career_path.user_id)
+    )
     
-    return CareerPathAcceptResponse(
+    return model_response(CareerPathAcceptResponse(
         path_id=career_path.id,
         user_id=career_path.user_id,
         status=career_path.status.value,
         started_at=career_path.started_at
-    )
+    ))
+
+
+@batch_router.post("/career-paths:batchGet",
+                   response_model=CareerPathsBatchResponse,
+                   summary="Get career paths for several users",
+                   responses={
+                       422: {"description": "Invalid UUIDs, or more user IDs than BATCH_GET_MAX_USERS"}
+                   })
+async def batch_get_career_paths(
+    batch: UserBatchRequest,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Gets the current (non archived) career paths of each requested user with a single query.
+    
+    - **user_ids**: User IDs (duplicates are ignored)
+    
+    Unlike GET /career-paths/{user_id}, missing paths are not generated: users without
+    paths (or unknown users) are listed in missing_user_ids.
+    """
+    paths = db.execute(
+        select(
+            CareerPath.user_id.label("_user_id"),
+            CareerPath.id.label("_id"),
+            CareerPath.generated_at.label("_generated_at"),
+            *CAREER_PATH_COLUMNS.values()
+        ).where(
+            and_(
+                any_uuid(CareerPath.user_id, batch.user_ids),
+                CareerPath.status != CareerPathStatus.ARCHIVED
+            )
+        ).order_by(CareerPath.user_id, CareerPath.generated_at.desc())
+    ).all()
+    by_user = defaultdict(list)
+    for path in paths:
+        by_user[path._user_id].append(path)
+    
+    return json_response({
+        "career_paths": [
+            career_paths_document(user_id, by_user[user_id]) for user_id in batch.user_ids if user_id in by_user
+        ],
+        "missing_user_ids": [user_id for user_id in batch.user_ids if user_id not in by_user]
+    })
@@ -0,0 +1,241 @@
+"""
+Router for evaluation cycle progress and anomalies.
+Endpoints: /cycles/{cycle_id}/progress, /cycles/{cycle_id}/anomalies
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, exists, func, select, true, tuple_
+from uuid import UUID
+from typing import Optional, Tuple
+
+from app.database import get_read_db
+from app.models.anomaly import AnomalyReason, EvaluationAnomaly
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_cycle import EvaluationCycle
+from app.responses import dumps, json_response
+from app.schemas.evaluation_cycle import CycleAnomaliesResponse, CycleProgressResponse
+from app.services.response_cache import lookup, make_etag, store
+
+router = APIRouter(
+    tags=["cycles"]
+)
+
+# Same rule as is_cycle_complete
+REQUIRED_RELATIONSHIPS = (EvaluatorRelationship.SELF, EvaluatorRelationship.MANAGER, EvaluatorRelationship.PEER)
+
+
+def cycle_progress_cache_key(cycle_id: UUID):
+    """Response cache key of a cycle progress report (expires with the TTL; writes do not invalidate it)."""
+    return ("cycle-progress", cycle_id)
+
+
+def _coverage(cycle_id: UUID):
+    """Employees evaluated in the cycle, per relationship received and with complete coverage."""
+    # One row per evaluated employee, read from ix_evaluations_cycle_coverage alone
+    per_employee = select(
+        Evaluation.employee_id,
+        *(
+            func.bool_or(Evaluation.evaluator_relationship == relationship).label(relationship.value)
+            for relationship in EvaluatorRelationship
+        )
+    ).where(Evaluation.cycle_id == cycle_id).group_by(Evaluation.employee_id).subquery("per_employee")
+
+    return select(
+        func.count().label("evaluated_employees"),
+        func.count().filter(and_(*(per_employee.c[relationship.value] for relationship in REQUIRED_RELATIONSHIPS)))
+        .label("complete_employees"),
+        *(
+            func.count().filter(per_employee.c[relationship.value]).label(relationship.value)
+            for relationship in EvaluatorRelationship
+        )
+    ).subquery("coverage")
+
+
+def _assessments(cycle_id: UUID):
+    """Cycle assessments by processing status, read from ix_assessments_cycle_status."""
+    return select(*(
+        func.count().filter(Assessment.processing_status == processing_status).label(processing_status.value)
+        for processing_status in ProcessingStatus
+    )).where(Assessment.cycle_id == cycle_id).subquery("assessments")
+
+
+def _career_paths(cycle_id: UUID):
+    """
+    Paths generated from the cycle's assessments: after the employee's cycle assessment
+    and before any later assessment of theirs. Archived paths (replaced by a regeneration)
+    are not counted.
+    """
+    later = aliased(Assessment)
+    superseded = exists().where(
+        later.user_id == Assessment.user_id,
+        later.created_at > Assessment.created_at,
+        later.created_at <= CareerPath.generated_at
+    )
+    return select(
+        func.count().label("generated"),
+        func.count().filter(CareerPath.started_at.isnot(None)).label("accepted")
+    ).join(
+        Assessment, Assessment.user_id == CareerPath.user_id
+    ).where(
+        Assessment.cycle_id == cycle_id,
+        CareerPath.status != CareerPathStatus.ARCHIVED,
+        CareerPath.generated_at >= Assessment.created_at,
+        ~superseded
+    ).subquery("career_paths")
+
+
+def cycle_progress_query(cycle_id: UUID):
+    """The whole report as one row (no row for an unknown cycle)."""
+    coverage = _coverage(cycle_id)
+    assessments = _assessments(cycle_id)
+    career_paths = _career_paths(cycle_id)
+    return select(
+        EvaluationCycle.name,
+        EvaluationCycle.status,
+        coverage,
+        assessments,
+        career_paths.c.generated.label("career_paths_generated"),
+        career_paths.c.accepted.label("career_paths_accepted")
+    ).select_from(
+        EvaluationCycle.__table__
+        .join(coverage, true())
+        .join(assessments, true())
+        .join(career_paths, true())
+    ).where(EvaluationCycle.id == cycle_id)
+
+
+@router.get("/{cycle_id}/progress",
+            response_model=CycleProgressResponse,
+            summary="Get the completion progress of an evaluation cycle",
+            responses={
+                404: {"description": "Cycle not found"},
+                422: {"description": "Invalid UUID"}
+            })
+async def get_cycle_progress(
+    cycle_id: UUID,
+    request: Request,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Reports how complete a cycle is:
+
+    - **coverage**: Employees with at least one SELF/MANAGER/PEER/DIRECT_REPORT evaluation
+    - **complete_employees**: Employees with SELF + MANAGER + at least one PEER
+    - **assessments**: Cycle assessments by processing status
+    - **career_paths_generated** / **career_paths_accepted**: Paths produced from those assessments
+
+    Computed by a single grouped query over covering indexes; reports are cached for
+    RESPONSE_CACHE_TTL_SECONDS and carry an ETag.
+    """
+    cache_key = cycle_progress_cache_key(cycle_id)
+    cached = lookup(request, "cycle_progress", cache_key)
+    if cached is not None:
+        return cached
+
+    row = db.execute(cycle_progress_query(cycle_id)).one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cycle with ID {cycle_id} not found."
+        )
+
+    body = dumps({
+        "cycle_id": cycle_id,
+        "name": row.name,
+        "status": row.status.value,
+        "evaluated_employees": row.evaluated_employees,
+        "coverage": {relationship.value: row._mapping[relationship.value] for relationship in EvaluatorRelationship},
+        "complete_employees": row.complete_employees,
+        "assessments": {
+            processing_status.value: row._mapping[processing_status.value] for processing_status in ProcessingStatus
+        },
+        "career_paths_generated": row.career_paths_generated,
+        "career_paths_accepted": row.career_paths_accepted
+    })
+    return store(request, cache_key, make_etag(body), body)
+
+
+def _anomaly_cursor(evaluation_id: UUID, reason: AnomalyReason) -> str:
+    """Keyset position after a flag: its primary key within the cycle."""
+    return f"{evaluation_id}.{reason.value}"
+
+
+def _parse_anomaly_cursor(cursor: str) -> Tuple[UUID, AnomalyReason]:
+    try:
+        evaluation_id, reason = cursor.split(".", 1)
+        return UUID(evaluation_id), AnomalyReason(reason)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor."
+        )
+
+
+@router.get("/{cycle_id}/anomalies",
+            response_model=CycleAnomaliesResponse,
+            summary="List the evaluations of a cycle flagged as suspicious",
+            responses={
+                404: {"description": "Cycle not found"},
+                422: {"description": "Invalid UUID, reason or cursor"}
+            })
+async def get_cycle_anomalies(
+    cycle_id: UUID,
+    reason: Optional[AnomalyReason] = Query(None, description="Only flags with this reason"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of flags to return"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Flags written by the anomaly detection job (`python -m app.services.anomalies <cycle_id>`),
+    ordered by evaluation.
+
+    Keyset pagination: each page continues after **cursor** through the primary key of
+    evaluation_anomalies, so every page costs the same however deep it is.
+    """
+    query = select(
+        EvaluationAnomaly.evaluation_id,
+        EvaluationAnomaly.reason,
+        EvaluationAnomaly.details,
+        EvaluationAnomaly.detected_at,
+        Evaluation.evaluator_id,
+        Evaluation.employee_id,
+        Evaluation.evaluator_relationship
+    ).join(
+        Evaluation, Evaluation.id == EvaluationAnomaly.evaluation_id
+    ).where(EvaluationAnomaly.cycle_id == cycle_id)
+    if reason is not None:
+        query = query.where(EvaluationAnomaly.reason == reason)
+    if cursor is not None:
+        query = query.where(
+            tuple_(EvaluationAnomaly.evaluation_id, EvaluationAnomaly.reason) > _parse_anomaly_cursor(cursor)
+        )
+    # One extra row tells whether there is a next page
+    rows = db.execute(
+        query.order_by(EvaluationAnomaly.evaluation_id, EvaluationAnomaly.reason).limit(limit + 1)
+    ).all()
+
+    if not rows and cursor is None and db.get(EvaluationCycle, cycle_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cycle with ID {cycle_id} not found."
+        )
+
+    page = rows[:limit]
+    return json_response({
+        "cycle_id": cycle_id,
+        "anomalies": [
+            {
+                "evaluation_id": row.evaluation_id,
+                "evaluator_id": row.evaluator_id,
+                "employee_id": row.employee_id,
+                "evaluator_relationship": row.evaluator_relationship.value,
+                "reason": row.reason.value,
+                "details": row.details,
+                "detected_at": row.detected_at
+            }
+            for row in page
+        ],
+        "next_cursor": _anomaly_cursor(page[-1].evaluation_id, page[-1].reason) if len(rows) > limit else None
+    })
@@ -0,0 +1,293 @@
+"""
+Router for the combined employee profile.
+Endpoints: /employees/{user_id}/profile, /employees/{user_id}/competency-scores
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+from sqlalchemy import Text, and_, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+from uuid import UUID
+from typing import Dict, List, Optional
+import math
+
+from app.database import get_read_db
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.career_path_step import CareerPathStep
+from app.models.competency import Competency
+from app.models.competency_score import CompetencyScore
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_cycle import EvaluationCycle
+from app.models.user import User
+from app.responses import json_response
+from app.schemas.employee import EmployeeCompetencyScoresResponse, EmployeeProfileResponse
+from app.services.response_cache import lookup, make_etag, store
+
+router = APIRouter(
+    tags=["employees"]
+)
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def employee_profile_cache_key(user_id: UUID):
+    """Response cache key of an employee profile (invalidated by every write that changes it)."""
+    return ("employee-profile", user_id)
+
+
+def _json_object(**fields):
+    return func.json_build_object(*(part for name, value in fields.items() for part in (name, value)))
+
+
+def _latest_assessment(user_id: UUID):
+    """Most recent completed assessment as a SkillsAssessmentResponse object (NULL without one)."""
+    return select(
+        _json_object(
+            assessment_id=Assessment.id,
+            user_id=Assessment.user_id,
+            cycle_id=Assessment.cycle_id,
+            ai_profile=Assessment.ai_profile,
+            processing_status=Assessment.processing_status,
+            timestamp=Assessment.created_at
+        )
+    ).where(
+        and_(
+            Assessment.user_id == user_id,
+            Assessment.processing_status == ProcessingStatus.COMPLETED
+        )
+    ).order_by(Assessment.created_at.desc()).limit(1).scalar_subquery()
+
+
+def _career_paths(user_id: UUID):
+    """Non archived paths, newest first, each with its steps in order."""
+    steps = select(
+        func.coalesce(
+            func.json_agg(aggregate_order_by(
+                _json_object(
+                    step_number=CareerPathStep.step_order,
+                    target_role=CareerPathStep.target_role,
+                    duration_months=CareerPathStep.duration_months,
+                    required_competencies=func.coalesce(
+                        CareerPathStep.required_competencies, literal_column("'[]'::jsonb", JSONB)
+                    )
+                ),
+                CareerPathStep.step_order
+            )),
+            EMPTY_JSON_ARRAY
+        )
+    ).where(CareerPathStep.career_path_id == CareerPath.id).scalar_subquery()
+
+    return select(
+        func.coalesce(
+            func.json_agg(aggregate_order_by(
+                _json_object(
+                    path_id=CareerPath.id,
+                    path_name=CareerPath.path_name,
+                    recommended=CareerPath.recommended,
+                    total_duration_months=CareerPath.total_duration_months,
+                    feasibility_score=CareerPath.feasibility_score,
+                    status=CareerPath.status,
+                    generated_at=CareerPath.generated_at,
+                    steps=steps
+                ),
+                CareerPath.generated_at.desc()
+            )),
+            EMPTY_JSON_ARRAY
+        )
+    ).where(
+        and_(
+            CareerPath.user_id == user_id,
+            CareerPath.status != CareerPathStatus.ARCHIVED
+        )
+    ).scalar_subquery()
+
+
+def _cycle_coverage(user_id: UUID):
+    """Evaluations received per cycle and relationship, newest cycle first."""
+    received = select(
+        Evaluation.cycle_id,
+        Evaluation.evaluator_relationship,
+        func.count().label("evaluations")
+    ).where(
+        Evaluation.employee_id == user_id
+    ).group_by(Evaluation.cycle_id, Evaluation.evaluator_relationship).cte("received")
+
+    # Same rule as is_cycle_complete: SELF + MANAGER + at least one PEER
+    complete = and_(*(
+        func.bool_or(received.c.evaluator_relationship == relationship)
+        for relationship in (EvaluatorRelationship.SELF, EvaluatorRelationship.MANAGER, EvaluatorRelationship.PEER)
+    ))
+    per_cycle = select(
+        received.c.cycle_id,
+        func.json_object_agg(received.c.evaluator_relationship, received.c.evaluations).label("evaluations"),
+        complete.label("complete")
+    ).group_by(received.c.cycle_id).cte("per_cycle")
+
+    return select(
+        func.coalesce(
+            func.json_agg(aggregate_order_by(
+                _json_object(
+                    cycle_id=EvaluationCycle.id,
+                    name=EvaluationCycle.name,
+                    status=EvaluationCycle.status,
+                    evaluations=per_cycle.c.evaluations,
+                    complete=per_cycle.c.complete
+                ),
+                EvaluationCycle.start_date.desc()
+            )),
+            EMPTY_JSON_ARRAY
+        )
+    ).select_from(per_cycle.join(EvaluationCycle, EvaluationCycle.id == per_cycle.c.cycle_id)).scalar_subquery()
+
+
+def employee_profile_query(user_id: UUID):
+    """
+    The whole profile as one JSON document built by PostgreSQL in a single statement
+    (no row for an unknown user).
+    """
+    profile = _json_object(
+        user=_json_object(
+            user_id=User.id,
+            email=User.email,
+            full_name=User.full_name,
+            current_position=User.current_position,
+            department=User.department,
+            years_experience=User.years_experience
+        ),
+        latest_assessment=_latest_assessment(user_id),
+        career_paths=_career_paths(user_id),
+        cycle_coverage=_cycle_coverage(user_id)
+    )
+    return select(cast(profile, Text).label("profile")).where(User.id == user_id)
+
+
+@router.get("/{user_id}/profile",
+            response_model=EmployeeProfileResponse,
+            summary="Get the combined profile of an employee",
+            responses={
+                404: {"description": "Employee not found"},
+                422: {"description": "Invalid UUID"}
+            })
+async def get_employee_profile(
+    user_id: UUID,
+    request: Request,
+    db: Session = Depends(get_read_db)
+):
+    """
+    Gets everything the employee page shows in one request:
+
+    - **user**: Employee data
+    - **latest_assessment**: Most recent completed skills assessment (null if none)
+    - **career_paths**: Active career paths with their steps (not generated on demand)
+    - **cycle_coverage**: Evaluations received per cycle and whether the cycle is complete
+
+    The document is assembled by a single query and cached as a unit; responses carry an
+    ETag, send it back in If-None-Match to get 304 when unchanged.
+    """
+    cache_key = employee_profile_cache_key(user_id)
+    cached = lookup(request, "employee_profile", cache_key)
+    if cached is not None:
+        return cached
+
+    profile = db.execute(employee_profile_query(user_id)).scalar()
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Employee with ID {user_id} not found."
+        )
+
+    # The document itself identifies the version: it contains every field it depends on
+    return store(request, cache_key, make_etag(profile), profile.encode("utf-8"))
+
+
+def _mean(rows) -> float:
+    return sum(row.score_sum for row in rows) / sum(row.answers for row in rows)
+
+
+def _score_statistics(rows) -> Optional[Dict[str, float]]:
+    """Statistics of the answers behind one or more competency_scores rows (None without rows)."""
+    if not rows:
+        return None
+    answers = sum(row.answers for row in rows)
+    mean = _mean(rows)
+    variance = max(sum(row.score_sum_squares for row in rows) / answers - mean ** 2, 0.0)
+    return {
+        "answers": answers,
+        "mean": round(mean, 2),
+        "stddev": round(math.sqrt(variance), 2),
+        "min": min(row.score_min for row in rows),
+        "max": max(row.score_max for row in rows)
+    }
+
+
+@router.get("/{user_id}/competency-scores",
+            response_model=EmployeeCompetencyScoresResponse,
+            summary="Get the score statistics of an employee per competency",
+            responses={
+                404: {"description": "No scores for this employee (in this cycle)"},
+                422: {"description": "Invalid UUID"}
+            })
+async def get_competency_scores(
+    user_id: UUID,
+    cycle_id: Optional[UUID] = Query(None, description="Cycle to report (default: the latest with scores)"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Mean, standard deviation and range of the scores the employee received for each
+    competency, per evaluator relationship and from others (everyone but themselves),
+    plus the self-vs-others gap.
+
+    Read from the competency_scores totals: one row per competency and relationship,
+    however many evaluations were submitted.
+    """
+    if cycle_id is None:
+        cycle_id = db.execute(
+            select(CompetencyScore.cycle_id)
+            .join(EvaluationCycle, EvaluationCycle.id == CompetencyScore.cycle_id)
+            .where(CompetencyScore.employee_id == user_id)
+            .order_by(EvaluationCycle.start_date.desc())
+            .limit(1)
+        ).scalar()
+
+    rows = db.execute(
+        select(
+            CompetencyScore.competency_id,
+            Competency.name.label("competency"),
+            CompetencyScore.evaluator_relationship,
+            CompetencyScore.answers,
+            CompetencyScore.score_sum,
+            CompetencyScore.score_sum_squares,
+            CompetencyScore.score_min,
+            CompetencyScore.score_max
+        ).join(
+            Competency, Competency.id == CompetencyScore.competency_id
+        ).where(
+            CompetencyScore.employee_id == user_id,
+            CompetencyScore.cycle_id == cycle_id
+        ).order_by(Competency.name, CompetencyScore.evaluator_relationship)
+    ).all() if cycle_id is not None else []
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No competency scores found for employee {user_id}."
+        )
+
+    by_competency: Dict[UUID, List] = {}
+    for row in rows:
+        by_competency.setdefault(row.competency_id, []).append(row)
+
+    competencies = []
+    for competency_id, competency_rows in by_competency.items():
+        own = [row for row in competency_rows if row.evaluator_relationship == EvaluatorRelationship.SELF]
+        others = [row for row in competency_rows if row.evaluator_relationship != EvaluatorRelationship.SELF]
+        competencies.append({
+            "competency_id": competency_id,
+            "competency": competency_rows[0].competency,
+            "relationships": {
+                row.evaluator_relationship.value: _score_statistics([row]) for row in competency_rows
+            },
+            "others": _score_statistics(others),
+            "self_gap": round(_mean(own) - _mean(others), 2) if own and others else None
+        })
+
+    return json_response({"user_id": user_id, "cycle_id": cycle_id, "competencies": competencies})
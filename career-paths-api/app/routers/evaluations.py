@@ -5,56 +5,86 @@ According to architecture defined in ARCHITECTURE.md
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
 from uuid import UUID
-from typing import List
+from typing import Dict, Iterable, List, Optional
+from collections import defaultdict
+from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.evaluation import Evaluation, EvaluationStatus, EvaluatorRelationship
 from app.models.evaluation_detail import EvaluationDetail
 from app.models.evaluation_cycle import EvaluationCycle
 from app.models.user import User
 from app.models.competency import Competency
-from app.schemas.evaluation import EvaluationCreate, EvaluationResponse, EvaluationFullResponse, EvaluationDetailResponse
+from app.fieldsets import fields_query, include_query, parse_fields, parse_include
+from app.responses import json_response, model_response, rows_response
+from app.services.reference_data import reference_data
+from app.services.response_cache import response_cache
+from app.routers.employees import employee_profile_cache_key
+from app.schemas.evaluation import EvaluationCreate, EvaluationResponse, EvaluationFullResponse
 
 router = APIRouter(
     tags=["evaluations"]
 )
 
+# Column read for each selectable field (?fields=); "answers" comes from evaluation_details
+EVALUATION_COLUMNS = {
+    "id": Evaluation.id,
+    "employee_id": Evaluation.employee_id,
+    "evaluator_id": Evaluation.evaluator_id,
+    "cycle_id": Evaluation.cycle_id,
+    "evaluator_relationship": Evaluation.evaluator_relationship,
+    "general_feedback": Evaluation.general_feedback,
+    "status": Evaluation.status,
+    "created_at": Evaluation.created_at,
+    "updated_at": Evaluation.updated_at
+}
+LIST_FIELDS = list(EvaluationResponse.model_fields)
+DETAIL_FIELDS = list(EvaluationFullResponse.model_fields)
+LIST_INCLUDES = ("answers",)
 
-async def check_cycle_completion_and_trigger_ai(employee_id: UUID, cycle_id: UUID, db: Session):
+
+def load_answers(db: Session, evaluation_ids: Iterable[UUID]) -> Dict[UUID, List[dict]]:
+    """Answers (EvaluationDetailResponse documents) of several evaluations in a single query."""
+    answers = defaultdict(list)
+    rows = db.execute(
+        select(
+            EvaluationDetail.evaluation_id,
+            func.coalesce(Competency.name, "Unknown").label("competency"),
+            EvaluationDetail.score,
+            EvaluationDetail.comments
+        ).outerjoin(
+            Competency, EvaluationDetail.competency_id == Competency.id
+        ).where(EvaluationDetail.evaluation_id.in_(list(evaluation_ids)))
+    )
+    for row in rows:
+        answers[row.evaluation_id].append({"competency": row.competency, "score": row.score, "comments": row.comments})
+    return answers
+
+
+def is_cycle_complete(employee_id: UUID, cycle_id: UUID, db: Session) -> bool:
     """
     Checks if all cycle evaluations are completed for a user.
-    If complete, triggers AI processing.
+    A cycle is complete with at least: SELF + MANAGER + 1 PEER.
     """
-    from app.routers.assessments import trigger_ai_processing
-    
-    # Count required and completed evaluations
-    required_types = [
+    required_types = {
         EvaluatorRelationship.SELF,
         EvaluatorRelationship.MANAGER,
         EvaluatorRelationship.PEER
-    ]
+    }
     
-    completed_types = set()
-    evaluations = db.query(Evaluation).filter(
-        and_(
-            Evaluation.employee_id == employee_id,
-            Evaluation.cycle_id == cycle_id
-        )
-    ).all()
-    
-    for eval in evaluations:
-        completed_types.add(eval.evaluator_relationship)
-    
-    # Check if it has at least: SELF + MANAGER + 1 PEER
-    has_self = EvaluatorRelationship.SELF in completed_types
-    has_manager = EvaluatorRelationship.MANAGER in completed_types
-    has_peer = EvaluatorRelationship.PEER in completed_types
+    completed_types = {
+        row.evaluator_relationship
+        for row in db.query(Evaluation.evaluator_relationship).filter(
+            and_(
+                Evaluation.employee_id == employee_id,
+                Evaluation.cycle_id == cycle_id
+            )
+        ).distinct()
+    }
     
-    if has_self and has_manager and has_peer:
-        # Ciclo completo, disparar procesamiento
-        await trigger_ai_processing(evaluatee_id, cycle_id, db)
+    return required_types.issubset(completed_types)
 
 
 @router.post("/", response_model=EvaluationResponse, status_code=status.HTTP_201_CREATED,
@@ -82,25 +112,29 @@ async def create_evaluation(
     
     If the cycle is completed (SELF + MANAGER + PEER), triggers AI processing automatically.
     """
+    # Reference data is looked up in the shared cache first; a miss asks the database
     # Verify the cycle exists
-    cycle = db.query(EvaluationCycle).filter(EvaluationCycle.id == evaluation.cycle_id).first()
-    if not cycle:
+    if not reference_data.has_cycle(evaluation.cycle_id) and not db.query(EvaluationCycle.id).filter(
+        EvaluationCycle.id == evaluation.cycle_id
+    ).first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Evaluation cycle with ID {evaluation.cycle_id} not found."
         )
     
     # Verify evaluator exists
-    evaluator = db.query(User).filter(User.id == evaluation.evaluator_id).first()
-    if not evaluator:
+    if not reference_data.has_user(evaluation.evaluator_id) and not db.query(User.id).filter(
+        User.id == evaluation.evaluator_id
+    ).first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The specified evaluator ({evaluation.evaluator_id}) does not exist."
         )
     
     # Verify employee exists
-    employee = db.query(User).filter(User.id == evaluation.employee_id).first()
-    if not employee:
+    if not reference_data.has_user(evaluation.employee_id) and not db.query(User.id).filter(
+        User.id == evaluation.employee_id
+    ).first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"The specified employee ({evaluation.employee_id}) does not exist."
@@ -117,13 +151,16 @@ async def create_evaluation(
     # Verify all competencies exist and build a mapping name -> id
     competency_mapping = {}
     for answer in evaluation.answers:
-        competency = db.query(Competency).filter(Competency.name == answer.competency).first()
-        if not competency:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Competency '{answer.competency}' not found."
-            )
-        competency_mapping[answer.competency] = competency.id
+        competency_id = reference_data.competency_id(answer.competency)
+        if competency_id is None:
+            competency = db.query(Competency.id).filter(Competency.name == answer.competency).first()
+            if not competency:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Competency '{answer.competency}' not found."
+                )
+            competency_id = competency.id
+        competency_mapping[answer.competency] = competency_id
     
     try:
         # Create the evaluation
@@ -151,17 +188,26 @@ async def create_evaluation(
         
         db.commit()
         db.refresh(db_evaluation)
+        # The employee's cycle coverage changed
+        response_cache.invalidate(employee_profile_cache_key(evaluation.employee_id))
         
         # Check if cycle is complete and trigger AI in background
-        background_tasks.add_task(
-            check_cycle_completion_and_trigger_ai,
-            evaluation.employee_id,
-            evaluation.cycle_id,
-            db
-        )
+        if is_cycle_complete(evaluation.employee_id, evaluation.cycle_id, db):
+            from app.routers.assessments import trigger_ai_processing
+            
+            completion_detected_at = datetime.utcnow()
+            background_tasks.add_task(
+                trigger_ai_processing,
+                evaluation.employee_id,
+                evaluation.cycle_id,
+                db,
+                last_evaluation_submitted_at=db_evaluation.created_at,
+                completion_detected_at=completion_detected_at,
+                queued_at=datetime.utcnow()
+            )
         
         # Return response according to architecture spec
-        return EvaluationResponse(
+        return model_response(EvaluationResponse(
             id=db_evaluation.id,
             employee_id=db_evaluation.employee_id,
             evaluator_id=db_evaluation.evaluator_id,
@@ -170,7 +216,7 @@ async def create_evaluation(
             status=db_evaluation.status.value,
             created_at=db_evaluation.created_at,
             updated_at=db_evaluation.updated_at
-        )
+        ), status_code=status.HTTP_201_CREATED)
         
     except IntegrityError as e:
         db.rollback()
@@ -190,14 +236,24 @@ async def create_evaluation(
             })
 async def get_evaluation(
     evaluation_id: UUID,
-    db: Session = Depends(get_db)
+    fields: Optional[str] = fields_query(),
+    db: Session = Depends(get_read_db)
 ):
     """
     Gets an evaluation by its ID with all its details.
     
     - **evaluation_id**: ID of the evaluation to query
+    - **fields**: Fields to return (default: all); answers are only loaded when requested
     """
-    evaluation = db.query(Evaluation).filter(Evaluation.id == evaluation_id).first()
+    selected = parse_fields(fields, DETAIL_FIELDS)
+    
+    # The id is always selected so a missing evaluation is told apart from an empty selection
+    evaluation = db.execute(
+        select(
+            Evaluation.id.label("_id"),
+            *(EVALUATION_COLUMNS[name] for name in selected if name != "answers")
+        ).where(Evaluation.id == evaluation_id)
+    ).first()
     
     if not evaluation:
         raise HTTPException(
@@ -205,46 +261,43 @@ async def get_evaluation(
             detail=f"Evaluation with ID {evaluation_id} not found."
         )
     
-    # Build answers list according to architecture spec
-    answers_response = []
-    for detail in evaluation.details:
-        answers_response.append(EvaluationDetailResponse(
-            competency=detail.competency.name if detail.competency else "Unknown",
-            score=detail.score,
-            comments=detail.comments
-        ))
-    
-    # Build response according to architecture spec
-    response = EvaluationFullResponse(
-        id=evaluation.id,
-        employee_id=evaluation.employee_id,
-        evaluator_id=evaluation.evaluator_id,
-        cycle_id=evaluation.cycle_id,
-        evaluator_relationship=evaluation.evaluator_relationship.value,
-        answers=answers_response,
-        general_feedback=evaluation.general_feedback,
-        status=evaluation.status.value,
-        created_at=evaluation.created_at,
-        updated_at=evaluation.updated_at
-    )
-    
-    return response
+    answers = load_answers(db, [evaluation_id]) if "answers" in selected else {}
+    return json_response({
+        name: answers.get(evaluation_id, []) if name == "answers" else evaluation._mapping[name]
+        for name in selected
+    })
 
 
 @router.get("/", response_model=List[EvaluationResponse])
 async def list_evaluations(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    fields: Optional[str] = fields_query(),
+    include: Optional[str] = include_query(*LIST_INCLUDES),
+    db: Session = Depends(get_read_db)
 ):
     """
     Lists all evaluations.
     
     - **skip**: Number of records to skip (pagination)
     - **limit**: Maximum number of records to return
+    - **fields**: Fields to return (default: all)
+    - **include**: `answers` embeds each evaluation's answers (loaded with one extra query)
     """
-    evaluations = db.query(Evaluation).offset(skip).limit(limit).all()
-    return evaluations
+    selected = parse_fields(fields, LIST_FIELDS)
+    includes = parse_include(include, LIST_INCLUDES)
+    columns = [EVALUATION_COLUMNS[name] for name in selected]
+    
+    # Rows go straight to JSON: no ORM objects and no response model validation
+    if "answers" not in includes:
+        return rows_response(db.execute(select(*columns).offset(skip).limit(limit)))
+    
+    evaluations = db.execute(select(Evaluation.id.label("_id"), *columns).offset(skip).limit(limit)).all()
+    answers = load_answers(db, [evaluation._id for evaluation in evaluations]) if evaluations else {}
+    return json_response([
+        {**{name: evaluation._mapping[name] for name in selected}, "answers": answers.get(evaluation._id, [])}
+        for evaluation in evaluations
+    ])
 
 
 @router.post("/{evaluation_id}/process", 
@@ -0,0 +1,50 @@
+"""
+Router for internal operational endpoints (not part of the public API).
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import engine, get_db, pool_status, replica_engines
+from app.services.analytics import refresh_due, refresh_views
+
+settings = get_settings()
+
+router = APIRouter(
+    tags=["internal"]
+)
+
+
+@router.get("/pool", include_in_schema=False)
+async def get_pool_status():
+    """
+    Report this worker's connection pools: size, usage, saturation and checkout waits.
+
+    Saturation is the fraction of size + max_overflow currently checked out;
+    values close to 1 mean requests are about to queue for connections.
+    """
+    return {
+        "primary": pool_status(engine),
+        "replicas": [pool_status(replica_engine) for replica_engine in replica_engines]
+    }
+
+
+@router.post("/analytics/refresh", include_in_schema=False)
+def refresh_analytics(db: Session = Depends(get_db)):
+    """
+    Refresh the analytics materialized views now (e.g. right after closing a cycle)
+    instead of waiting for the next scheduled check.
+    Only refreshes when a refresh is due (see refresh_due), so repeated calls cannot
+    keep the primary busy refreshing; otherwise nothing is refreshed.
+    A plain ``def``: the refresh can take seconds, so it runs in the threadpool
+    instead of blocking the event loop.
+    """
+    if not refresh_due(db, settings.ANALYTICS_REFRESH_INTERVAL_SECONDS):
+        return {"refreshed": {}}
+    durations = refresh_views(db)
+    if durations is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A refresh is already running."
+        )
+    return {"refreshed": durations}
@@ -0,0 +1,103 @@
+"""
+Router for pipeline latency reporting.
+Reports how long each stage of evaluation -> assessment -> career paths takes.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from sqlalchemy import Float, String, cast, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from uuid import UUID
+from typing import Dict, List, Optional
+
+from app.database import get_read_db
+from app.models.assessment import Assessment
+from app.schemas.pipeline import PipelineLatencyResponse, StageLatency, CycleLatency
+
+router = APIRouter(
+    tags=["pipeline"]
+)
+
+# (stage, start timestamp, end timestamp) in pipeline order
+PIPELINE_STAGES = (
+    ("completion_detection", Assessment.last_evaluation_submitted_at, Assessment.completion_detected_at),
+    ("enqueue", Assessment.completion_detected_at, Assessment.queued_at),
+    ("queue_wait", Assessment.queued_at, Assessment.processing_started_at),
+    ("payload_build", Assessment.processing_started_at, Assessment.ai_call_started_at),
+    ("ai_call", Assessment.ai_call_started_at, Assessment.ai_call_completed_at),
+    ("persistence", Assessment.ai_call_completed_at, Assessment.processing_completed_at),
+    ("career_paths", Assessment.processing_completed_at, Assessment.career_paths_ready_at),
+    # Ends when career paths are ready, or at the assessment while they are still pending
+    ("end_to_end", Assessment.last_evaluation_submitted_at,
+     func.coalesce(Assessment.career_paths_ready_at, Assessment.processing_completed_at)),
+)
+
+STAGE_ORDER = {name: index for index, (name, _, _) in enumerate(PIPELINE_STAGES)}
+
+
+def _stage_durations(cycle_id: Optional[UUID]):
+    """One row per (stage, assessment) with the stage duration in seconds."""
+    selects = []
+    for name, start, end in PIPELINE_STAGES:
+        query = select(
+            literal(name, String).label("stage"),
+            Assessment.cycle_id.label("cycle_id"),
+            func.extract("epoch", end - start).label("seconds")
+        ).where(start.isnot(None), end.isnot(None))
+        if cycle_id is not None:
+            query = query.where(Assessment.cycle_id == cycle_id)
+        selects.append(query)
+    return union_all(*selects).subquery("stage_durations")
+
+
+@router.get("/latency",
+            response_model=PipelineLatencyResponse,
+            summary="Pipeline stage latency percentiles")
+async def get_pipeline_latency(
+    cycle_id: Optional[UUID] = Query(None, description="Restrict the report to one cycle"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Reports p50/p95/p99 latency (seconds) for each pipeline stage, overall and per cycle.
+    
+    Stages run from the last evaluation submitted to career paths ready.
+    Computed with a single grouped query over the timestamps persisted on assessments.
+    """
+    durations = _stage_durations(cycle_id)
+    fractions = cast(array([0.5, 0.95, 0.99]), ARRAY(Float))
+    percentiles = func.percentile_cont(fractions).within_group(durations.c.seconds)
+    
+    rows = db.execute(
+        select(
+            durations.c.stage,
+            durations.c.cycle_id,
+            func.grouping(durations.c.cycle_id).label("overall"),
+            func.count().label("count"),
+            percentiles.label("percentiles")
+        ).group_by(
+            func.grouping_sets(
+                tuple_(durations.c.stage),
+                tuple_(durations.c.stage, durations.c.cycle_id)
+            )
+        )
+    ).all()
+    
+    overall: List[StageLatency] = []
+    by_cycle: Dict[UUID, List[StageLatency]] = {}
+    for row in rows:
+        p50, p95, p99 = row.percentiles or (None, None, None)
+        latency = StageLatency(stage=row.stage, count=row.count, p50=p50, p95=p95, p99=p99)
+        if row.overall:
+            overall.append(latency)
+        else:
+            by_cycle.setdefault(row.cycle_id, []).append(latency)
+    
+    def ordered(stages: List[StageLatency]) -> List[StageLatency]:
+        return sorted(stages, key=lambda stage: STAGE_ORDER[stage.stage])
+    
+    return PipelineLatencyResponse(
+        stages=ordered(overall),
+        cycles=[
+            CycleLatency(cycle_id=cycle, stages=ordered(stages))
+            for cycle, stages in by_cycle.items()
+        ]
+    )
@@ -0,0 +1,123 @@
+"""
+Router for team roll-ups over the reporting hierarchy.
+Endpoint: /teams/{manager_id}/summary
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+from sqlalchemy import distinct, func, select, tuple_
+from uuid import UUID
+from typing import Optional
+
+from app.database import get_read_db
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.user import User
+from app.models.user_hierarchy import UserHierarchy
+from app.responses import dumps
+from app.schemas.team import TeamSummaryResponse
+from app.services.response_cache import lookup, make_etag, store
+
+router = APIRouter(
+    tags=["teams"]
+)
+
+
+def team_summary_cache_key(manager_id: UUID, depth: Optional[int]):
+    """Response cache key of a team summary (expires with the TTL; member writes do not invalidate it)."""
+    return ("team-summary", manager_id, depth)
+
+
+def team_members(manager_id: UUID, depth: Optional[int] = None):
+    """Everyone under ``manager_id`` (down to ``depth`` levels): one range scan of the closure table."""
+    members = select(
+        UserHierarchy.descendant_id.label("user_id"),
+        UserHierarchy.depth
+    ).where(UserHierarchy.ancestor_id == manager_id, UserHierarchy.depth > 0)
+    if depth is not None:
+        members = members.where(UserHierarchy.depth <= depth)
+    return members.cte("members")
+
+
+@router.get("/{manager_id}/summary",
+            response_model=TeamSummaryResponse,
+            summary="Get the assessment and career path roll-up of a manager's team",
+            responses={
+                404: {"description": "Manager not found"},
+                422: {"description": "Invalid UUID or depth"}
+            })
+async def get_team_summary(
+    manager_id: UUID,
+    request: Request,
+    depth: Optional[int] = Query(None, ge=1, description="Levels below the manager to include (default: all)"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Aggregates the team of a manager, at any depth of the reporting lines:
+
+    - **team_size**, **direct_reports**, **levels**: Shape of the subtree
+    - **assessments**: Members by the status of their latest assessment (NONE: no assessment)
+    - **career_paths**: Non archived career paths by status
+
+    Summaries are cached for RESPONSE_CACHE_TTL_SECONDS and carry an ETag.
+    """
+    cache_key = team_summary_cache_key(manager_id, depth)
+    cached = lookup(request, "team_summary", cache_key)
+    if cached is not None:
+        return cached
+
+    members = team_members(manager_id, depth)
+    team = db.execute(select(
+        func.count(members.c.user_id).label("size"),
+        func.count().filter(members.c.depth == 1).label("direct_reports"),
+        func.coalesce(func.max(members.c.depth), 0).label("levels")
+    )).one()
+    if team.size == 0 and not db.query(User.id).filter(User.id == manager_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Manager with ID {manager_id} not found."
+        )
+
+    # DISTINCT ON keeps each member's latest assessment
+    latest = select(
+        Assessment.user_id,
+        Assessment.processing_status
+    ).join(
+        members, members.c.user_id == Assessment.user_id
+    ).distinct(Assessment.user_id).order_by(Assessment.user_id, Assessment.created_at.desc()).subquery("latest")
+    assessments = {processing_status.value: 0 for processing_status in ProcessingStatus}
+    for row in db.execute(select(latest.c.processing_status, func.count().label("members"))
+                          .group_by(latest.c.processing_status)):
+        assessments[row.processing_status.value] = row.members
+    assessments["NONE"] = team.size - sum(assessments.values())
+
+    # Per status, plus a grand total row (grouping = 1) for the distinct members
+    career_paths = {path_status.value: 0 for path_status in CareerPathStatus if path_status != CareerPathStatus.ARCHIVED}
+    members_with_career_paths = 0
+    for row in db.execute(
+        select(
+            CareerPath.status,
+            func.grouping(CareerPath.status).label("total"),
+            func.count().label("paths"),
+            func.count(distinct(CareerPath.user_id)).label("members")
+        ).join(
+            members, members.c.user_id == CareerPath.user_id
+        ).where(
+            CareerPath.status != CareerPathStatus.ARCHIVED
+        ).group_by(func.grouping_sets(tuple_(CareerPath.status), tuple_()))
+    ):
+        if row.total:
+            members_with_career_paths = row.members
+        else:
+            career_paths[row.status.value] = row.paths
+
+    body = dumps({
+        "manager_id": manager_id,
+        "depth": depth,
+        "team_size": team.size,
+        "direct_reports": team.direct_reports,
+        "levels": team.levels,
+        "assessments": assessments,
+        "career_paths": career_paths,
+        "members_with_career_paths": members_with_career_paths
+    })
+    return store(request, cache_key, make_etag(body), body)
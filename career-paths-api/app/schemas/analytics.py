@@ -0,0 +1,39 @@
+"""
+Schemas for the analytics reports (read from the materialized views).
+"""
+from pydantic import BaseModel
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+
+
+class CompetencyScoreCell(BaseModel):
+    """Average score of one competency in one department, from one evaluator relationship."""
+    department: str
+    competency: str
+    evaluator_relationship: str
+    answers: int
+    employees: int  # Employees of the department evaluated on the competency
+    average_score: float
+
+
+class CompetencyHeatmapResponse(BaseModel):
+    """Competency x department x relationship scores of a cycle."""
+    cycle_id: UUID
+    refreshed_at: Optional[datetime] = None  # When the views were last refreshed (None: never)
+    cells: List[CompetencyScoreCell]
+
+
+class DepartmentParticipation(BaseModel):
+    """Evaluation volume and overall score of a department."""
+    department: str
+    employees_evaluated: int
+    evaluations: int
+    answers: int
+    average_score: Optional[float] = None  # None when no evaluation has answers
+
+
+class DepartmentParticipationResponse(BaseModel):
+    cycle_id: UUID
+    refreshed_at: Optional[datetime] = None
+    departments: List[DepartmentParticipation]
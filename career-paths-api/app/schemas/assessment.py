@@ -4,7 +4,7 @@ Schemas for Assessment (Skills Assessment).
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from uuid import UUID
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class SkillsAssessmentResponse(BaseModel):
@@ -36,3 +36,9 @@ class SkillsAssessmentResponse(BaseModel):
             processing_status=assessment.processing_status.value,
             timestamp=assessment.created_at
         )
+
+
+class SkillsAssessmentBatchResponse(BaseModel):
+    """Schema for POST /skills-assessments:batchGet."""
+    skills_assessments: List[SkillsAssessmentResponse]
+    missing_user_ids: List[UUID]  # Unknown users or users without a completed assessment
@@ -0,0 +1,24 @@
+"""
+Schemas for batch reads (``:batchGet``).
+"""
+from pydantic import BaseModel, validator
+from uuid import UUID
+from typing import List
+
+from app.config import get_settings
+
+
+class UserBatchRequest(BaseModel):
+    """Schema for batch reads over several users."""
+    user_ids: List[UUID]
+    
+    @validator('user_ids')
+    def validate_user_ids(cls, v):
+        """Drop duplicates (keeping order) and enforce the batch size limit."""
+        user_ids = list(dict.fromkeys(v))
+        max_users = get_settings().BATCH_GET_MAX_USERS
+        if not user_ids:
+            raise ValueError('At least one user ID is required')
+        if len(user_ids) > max_users:
+            raise ValueError(f'At most {max_users} user IDs can be requested at once')
+        return user_ids
@@ -41,6 +41,12 @@ class CareerPathsListResponse(BaseModel):
     timestamp: datetime
 
 
+class CareerPathsBatchResponse(BaseModel):
+    """Schema for POST /career-paths:batchGet."""
+    career_paths: List[CareerPathsListResponse]
+    missing_user_ids: List[UUID]  # Unknown users or users without generated paths
+
+
 class CompetencyDevelopment(BaseModel):
     """Schema for competency development in a step."""
     name: str
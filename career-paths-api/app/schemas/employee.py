@@ -0,0 +1,66 @@
+"""
+Schemas for the combined employee profile.
+"""
+from pydantic import BaseModel
+from uuid import UUID
+from typing import Dict, List, Optional
+
+from app.schemas.assessment import SkillsAssessmentResponse
+from app.schemas.career_path import CareerPathStepDetail, CareerPathSummaryResponse
+
+
+class EmployeeSummary(BaseModel):
+    """Employee data shown on the profile page."""
+    user_id: UUID
+    email: str
+    full_name: str
+    current_position: Optional[str] = None
+    department: Optional[str] = None
+    years_experience: Optional[str] = None
+
+
+class EmployeeCareerPath(CareerPathSummaryResponse):
+    """Active career path with its steps."""
+    steps: List[CareerPathStepDetail]
+
+
+class CycleCoverage(BaseModel):
+    """Evaluations received by the employee in one cycle."""
+    cycle_id: UUID
+    name: str
+    status: str
+    evaluations: Dict[str, int]  # Evaluator relationship -> evaluations received
+    complete: bool  # SELF + MANAGER + PEER received (triggers AI processing)
+
+
+class EmployeeProfileResponse(BaseModel):
+    """Schema for GET /employees/{user_id}/profile."""
+    user: EmployeeSummary
+    latest_assessment: Optional[SkillsAssessmentResponse] = None
+    career_paths: List[EmployeeCareerPath]
+    cycle_coverage: List[CycleCoverage]
+
+
+class ScoreStatistics(BaseModel):
+    """Statistics of the scores received for a competency."""
+    answers: int
+    mean: float
+    stddev: float  # Population standard deviation
+    min: int
+    max: int
+
+
+class CompetencyScoreSummary(BaseModel):
+    """Scores of one competency, per evaluator relationship and for everyone but the employee."""
+    competency_id: UUID
+    competency: str
+    relationships: Dict[str, ScoreStatistics]
+    others: Optional[ScoreStatistics] = None  # MANAGER, PEER and DIRECT_REPORT together
+    self_gap: Optional[float] = None  # Self mean minus others mean (positive: overrates themselves)
+
+
+class EmployeeCompetencyScoresResponse(BaseModel):
+    """Schema for GET /employees/{user_id}/competency-scores."""
+    user_id: UUID
+    cycle_id: UUID
+    competencies: List[CompetencyScoreSummary]
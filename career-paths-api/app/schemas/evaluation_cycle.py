@@ -4,7 +4,7 @@ Schemas for EvaluationCycle.
 from pydantic import BaseModel, ConfigDict, validator
 from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 class EvaluationCycleBase(BaseModel):
@@ -35,3 +35,36 @@ class EvaluationCycleResponse(EvaluationCycleBase):
     updated_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
+
+
+class CycleProgressResponse(BaseModel):
+    """How far a cycle has come: evaluation coverage, assessments and career paths."""
+    cycle_id: UUID
+    name: str
+    status: str
+    evaluated_employees: int  # Employees with at least one evaluation received in the cycle
+    # Employees with at least one evaluation from each relationship
+    coverage: Dict[str, int]
+    complete_employees: int  # SELF + MANAGER + at least one PEER (ready for assessment)
+    # Cycle assessments by processing status
+    assessments: Dict[str, int]
+    career_paths_generated: int  # Paths generated from the cycle's assessments
+    career_paths_accepted: int
+
+
+class EvaluationAnomalyResponse(BaseModel):
+    """An evaluation flagged by the anomaly detection job."""
+    evaluation_id: UUID
+    evaluator_id: UUID
+    employee_id: UUID
+    evaluator_relationship: str
+    reason: str  # STRAIGHT_LINING, OUTLIER or RECIPROCAL_INFLATION
+    details: Dict[str, Any]  # Measurements behind the flag
+    detected_at: datetime
+
+
+class CycleAnomaliesResponse(BaseModel):
+    """A page of a cycle's flagged evaluations."""
+    cycle_id: UUID
+    anomalies: List[EvaluationAnomalyResponse]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to get the next page; null on the last page
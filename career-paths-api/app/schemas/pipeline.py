@@ -0,0 +1,27 @@
+"""
+Schemas for pipeline latency reporting.
+"""
+from pydantic import BaseModel
+from uuid import UUID
+from typing import List, Optional
+
+
+class StageLatency(BaseModel):
+    """Latency percentiles (seconds) for one pipeline stage."""
+    stage: str
+    count: int
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
+class CycleLatency(BaseModel):
+    """Stage latencies for a single evaluation cycle."""
+    cycle_id: UUID
+    stages: List[StageLatency]
+
+
+class PipelineLatencyResponse(BaseModel):
+    """Schema for pipeline latency report."""
+    stages: List[StageLatency]
+    cycles: List[CycleLatency]
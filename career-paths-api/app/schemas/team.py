@@ -0,0 +1,20 @@
+"""
+Schemas for team roll-ups over the reporting hierarchy.
+"""
+from pydantic import BaseModel
+from uuid import UUID
+from typing import Dict, Optional
+
+
+class TeamSummaryResponse(BaseModel):
+    """Aggregated assessment and career path status of everyone under a manager."""
+    manager_id: UUID
+    depth: Optional[int] = None  # Levels included (None: the whole subtree)
+    team_size: int  # Reports at any included depth, excluding the manager
+    direct_reports: int
+    levels: int  # Deepest level below the manager
+    # Latest assessment status of each member ("NONE": no assessment yet)
+    assessments: Dict[str, int]
+    # Non archived career paths by status
+    career_paths: Dict[str, int]
+    members_with_career_paths: int
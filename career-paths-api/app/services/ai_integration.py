@@ -3,9 +3,13 @@ AI integration service for skills analysis and career path generation.
 Includes retry logic with tenacity and robust error handling.
 """
 import httpx
+import orjson
 import asyncio
+import functools
+import logging
 import random
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -13,25 +17,140 @@ from tenacity import (
     retry_if_exception_type
 )
 from app.config import get_settings
+from app.services import metrics
+from app.services.tracing import tracer, current_span, inject_headers, SPAN_KIND_CLIENT
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
+
+def record_retry(operation: str):
+    """Build a tenacity ``before_sleep`` hook that counts retries of an operation."""
+    def before_sleep(retry_state):
+        metrics.AI_RETRIES.labels(operation=operation).inc()
+        span = current_span()
+        if span is not None:
+            span.add_event("retry", {"attempt": retry_state.attempt_number})
+        logger.warning(
+            "AI call failed, retrying",
+            extra={
+                "operation": operation,
+                "attempt": retry_state.attempt_number,
+                "error": str(retry_state.outcome.exception()),
+                "retry_in_seconds": round(retry_state.next_action.sleep, 2) if retry_state.next_action else None
+            }
+        )
+    return before_sleep
+
+
+def instrumented(operation: str):
+    """
+    Record latency (including retries) and final failures of an AI call.
+    Must wrap the tenacity-decorated method so it sees the final outcome.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "success"
+            try:
+                with tracer.span(f"ai.{operation}", attributes={"ai.operation": operation}):
+                    return await func(*args, **kwargs)
+            except Exception:
+                outcome = "failure"
+                metrics.AI_FAILURES.labels(operation=operation).inc()
+                raise
+            finally:
+                metrics.AI_REQUEST_DURATION.labels(
+                    operation=operation,
+                    outcome=outcome
+                ).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def traced_attempt(operation: str):
+    """
+    Trace every attempt of an AI call as its own client span.
+    Goes below the tenacity decorator so each retry gets a span.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.span(f"ai.{operation}.attempt", kind=SPAN_KIND_CLIENT):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+SKILLS_PROFILE_LISTS = ("strengths", "growth_areas", "hidden_talents", "readiness_for_roles")
+
+
+def validate_skills_profile(content: bytes) -> bytes:
+    """
+    Check that an AI skills profile is a JSON object whose known fields are lists.
+    Returns the bytes unchanged; the decoded value is only used for the check.
+    """
+    try:
+        profile = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"AI skills profile is not valid JSON: {e}") from e
+    if not isinstance(profile, dict):
+        raise ValueError("AI skills profile must be a JSON object")
+    invalid = [key for key in SKILLS_PROFILE_LISTS if not isinstance(profile.get(key, []), list)]
+    if invalid:
+        raise ValueError(f"AI skills profile fields must be lists: {', '.join(invalid)}")
+    return content
+
 
 class AIIntegrationService:
     """
     Service to integrate with the AI service (mock or real).
     """
     
-    def __init__(self):
-        self.base_url = settings.AI_SERVICE_BASE_URL
+    def __init__(self, base_url: Optional[str] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = base_url or settings.AI_SERVICE_BASE_URL
         self.timeout = httpx.Timeout(30.0, connect=5.0)
+        # Custom transport, e.g. httpx.ASGITransport to call the mock in-process
+        self.transport = transport
+        self.simulate_latency = settings.AI_SIMULATE_LATENCY
+        self.simulated_failure_rate = settings.AI_SIMULATED_FAILURE_RATE
+    
+    async def _simulate_conditions(self) -> None:
+        """Simulate real AI latency (2-5 seconds) and random failures to test resilience."""
+        if self.simulate_latency:
+            await asyncio.sleep(random.uniform(2.0, 5.0))
+        if random.random() < self.simulated_failure_rate:
+            raise httpx.HTTPError("Simulated AI service failure")
+    
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout, transport=self.transport)
         
+    @instrumented("analyze_skills")
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type(httpx.HTTPError),
+        before_sleep=record_retry("analyze_skills"),
         reraise=True
     )
+    @traced_attempt("analyze_skills")
+    async def _post_skills_assessment(self, evaluation_data: Dict[str, Any]) -> httpx.Response:
+        """POST the evaluations to the AI service (with simulated conditions and retries)."""
+        await self._simulate_conditions()
+        
+        async with self._client() as client:
+            response = await client.post(
+                f"{self.base_url}/skills-assessment",
+                json=evaluation_data,
+                headers=inject_headers(),
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return response
+    
     async def analyze_skills(self, evaluation_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calls the AI service to analyze skills based on 360° evaluation.
@@ -73,32 +192,26 @@ class AIIntegrationService:
                     ]
                 }
         """
-        # Simulate latency (2-5 seconds)
-        await asyncio.sleep(random.uniform(2.0, 5.0))
-        
-        # Simulate 10% random failures to test resilience
-        if random.random() < 0.1:
-            raise httpx.HTTPError("Simulated AI service failure")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/skills-assessment",
-                    json=evaluation_data,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                print(f"Error calling AI service (will retry): {e}")
-                raise
+        response = await self._post_skills_assessment(evaluation_data)
+        return response.json()
     
+    async def analyze_skills_raw(self, evaluation_data: Dict[str, Any]) -> bytes:
+        """
+        Same call as ``analyze_skills``, but returns the validated response body
+        as is, so it can be stored in the JSONB column without re-encoding it.
+        """
+        response = await self._post_skills_assessment(evaluation_data)
+        return validate_skills_profile(response.content)
+    
+    @instrumented("generate_career_paths")
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type(httpx.HTTPError),
+        before_sleep=record_retry("generate_career_paths"),
         reraise=True
     )
+    @traced_attempt("generate_career_paths")
     async def generate_career_paths(
         self, 
         user_profile: Dict[str, Any],
@@ -140,29 +253,21 @@ class AIIntegrationService:
                     ]
                 }
         """
-        # Simulate latency (2-5 seconds)
-        await asyncio.sleep(random.uniform(2.0, 5.0))
+        await self._simulate_conditions()
         
-        # Simulate 10% random failures
-        if random.random() < 0.1:
-            raise httpx.HTTPError("Simulated AI service failure")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                payload = {
-                    "user_profile": user_profile,
-                    "ai_profile": ai_profile
-                }
-                response = await client.post(
-                    f"{self.base_url}/career-path-generator",
-                    json=payload,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                print(f"Error generating career paths (will retry): {e}")
-                raise
+        async with self._client() as client:
+            payload = {
+                "user_profile": user_profile,
+                "ai_profile": ai_profile
+            }
+            response = await client.post(
+                f"{self.base_url}/career-path-generator",
+                json=payload,
+                headers=inject_headers(),
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return response.json()
 
 
 # Singleton instance of the service
@@ -0,0 +1,123 @@
+"""
+Refresh of the analytics materialized views.
+
+Views are refreshed with REFRESH MATERIALIZED VIEW CONCURRENTLY, so reports keep
+reading the previous contents while the new ones are computed. Every worker runs
+the same background check; a transaction-level advisory lock lets only one of
+them refresh at a time, and the analytics_refreshes table tells the others it is
+already done.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.analytics import VIEWS, AnalyticsRefresh
+from app.models.evaluation_cycle import CycleStatus, EvaluationCycle
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+# Serialises refreshes across workers
+REFRESH_LOCK_ID = 724_310_002
+
+
+def last_refreshed_at(db: Session) -> Optional[datetime]:
+    """When the oldest view was last refreshed (None if some view never was)."""
+    refreshed = db.execute(select(
+        func.count(AnalyticsRefresh.view_name),
+        func.min(AnalyticsRefresh.refreshed_at)
+    ).where(AnalyticsRefresh.view_name.in_(VIEWS))).one()
+    return refreshed[1] if refreshed[0] == len(VIEWS) else None
+
+
+def refresh_due(db: Session, interval_seconds: float) -> bool:
+    """A refresh is due when the views are older than the interval or a cycle closed since."""
+    refreshed_at = last_refreshed_at(db)
+    if refreshed_at is None or datetime.utcnow() - refreshed_at >= timedelta(seconds=interval_seconds):
+        return True
+    return db.query(EvaluationCycle.id).filter(
+        EvaluationCycle.status == CycleStatus.CLOSED,
+        EvaluationCycle.updated_at > refreshed_at
+    ).first() is not None
+
+
+def refresh_views(db: Session) -> Optional[Dict[str, float]]:
+    """
+    Refresh every view concurrently and record it; commits the session.
+    Returns the milliseconds per view, or None when another worker is refreshing.
+    """
+    if not db.execute(text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": REFRESH_LOCK_ID}).scalar():
+        return None
+    durations = {}
+    for name in VIEWS:
+        started = time.perf_counter()
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+        durations[name] = round((time.perf_counter() - started) * 1000, 1)
+        statement = insert(AnalyticsRefresh).values(
+            view_name=name, refreshed_at=datetime.utcnow(), duration_ms=durations[name]
+        )
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[AnalyticsRefresh.view_name],
+            set_={"refreshed_at": statement.excluded.refreshed_at, "duration_ms": statement.excluded.duration_ms}
+        ))
+    db.commit()
+    logger.info("Analytics views refreshed", extra={"duration_ms": durations})
+    return durations
+
+
+def refresh_if_due(session_factory: Callable[[], Session], interval_seconds: float) -> bool:
+    db = session_factory()
+    try:
+        if not refresh_due(db, interval_seconds):
+            db.rollback()
+            return False
+        return refresh_views(db) is not None
+    finally:
+        db.close()
+
+
+class AnalyticsRefresher:
+    """Background task that keeps the views within their refresh interval."""
+
+    def __init__(self, interval_seconds: float, check_interval: float, enabled: bool = True):
+        self.interval_seconds = interval_seconds
+        self.check_interval = check_interval
+        self.enabled = enabled
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Check from the running event loop (the first check runs immediately)."""
+        if self.enabled:
+            self._task = asyncio.get_running_loop().create_task(self._refresh_forever(session_factory))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_forever(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(refresh_if_due, session_factory, self.interval_seconds)
+            except Exception:
+                logger.exception("Analytics refresh failed")
+            await asyncio.sleep(self.check_interval)
+
+
+analytics_refresher = AnalyticsRefresher(
+    interval_seconds=settings.ANALYTICS_REFRESH_INTERVAL_SECONDS,
+    check_interval=settings.ANALYTICS_CHECK_INTERVAL_SECONDS,
+    enabled=settings.ANALYTICS_REFRESH_ENABLED
+)
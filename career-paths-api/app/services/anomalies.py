@@ -0,0 +1,154 @@
+"""
+Batch anomaly detection over the evaluations of a cycle.
+
+Each rule is one set-based INSERT ... SELECT: window functions compute, for every
+answer, the totals of the evaluatee's other raters (leave-one-out), so the whole
+cycle is scanned a few times inside PostgreSQL and nothing runs per evaluation.
+Nothing is computed when evaluations are submitted.
+
+- STRAIGHT_LINING: the same score for every competency (ANOMALY_MIN_ANSWERS or more).
+- OUTLIER: the mean z-score of an evaluation's answers against the other non-self
+  raters of the same employee and competency reaches ANOMALY_OUTLIER_Z (their
+  spread is floored at one point, so unanimous raters do not make every
+  difference an outlier).
+- RECIPROCAL_INFLATION: two peers who rated each other both scored ANOMALY_INFLATION_MARGIN
+  points or more above the mean of the evaluatee's other non-self raters.
+
+Usage:
+    python -m app.services.anomalies <cycle_id>
+"""
+import argparse
+import logging
+import time
+from datetime import datetime
+from typing import Dict
+from uuid import UUID
+
+from sqlalchemy import create_engine, delete, text
+
+from app.config import get_settings
+from app.models.anomaly import AnomalyReason, EvaluationAnomaly
+from app.models.evaluation import EvaluatorRelationship
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+SELF = EvaluatorRelationship.SELF.value
+PEER = EvaluatorRelationship.PEER.value
+
+ANSWERS_CTE = """
+    answers AS (
+        SELECT e.id AS evaluation_id, e.evaluator_id, e.employee_id, e.evaluator_relationship,
+               d.competency_id, d.score
+        FROM evaluations e
+        JOIN evaluation_details d ON d.evaluation_id = e.id
+        WHERE e.cycle_id = CAST(:cycle_id AS uuid)
+    )
+"""
+
+INSERT = "INSERT INTO evaluation_anomalies (cycle_id, evaluation_id, reason, details, detected_at)"
+
+RULES = {
+    AnomalyReason.STRAIGHT_LINING: f"""
+        {INSERT}
+        WITH {ANSWERS_CTE}
+        SELECT CAST(:cycle_id AS uuid), evaluation_id, '{AnomalyReason.STRAIGHT_LINING.value}',
+               jsonb_build_object('score', min(score), 'answers', count(*)), :detected_at
+        FROM answers
+        GROUP BY evaluation_id
+        HAVING count(*) >= :min_answers AND min(score) = max(score)
+    """,
+    AnomalyReason.OUTLIER: f"""
+        {INSERT}
+        WITH {ANSWERS_CTE},
+        others AS (
+            SELECT evaluation_id, score,
+                   (sum(score) OVER w - score)::float AS others_sum,
+                   (sum(score * score) OVER w - score * score)::float AS others_squares,
+                   count(*) OVER w - 1 AS others
+            FROM answers
+            WHERE evaluator_relationship <> '{SELF}'
+            WINDOW w AS (PARTITION BY employee_id, competency_id)
+        ),
+        deviations AS (
+            SELECT evaluation_id,
+                   (score - others_sum / others)
+                   / greatest(sqrt(greatest(others_squares / others - (others_sum / others) ^ 2, 0)), 1.0) AS z
+            FROM others
+            WHERE others >= :min_other_raters
+        )
+        SELECT CAST(:cycle_id AS uuid), evaluation_id, '{AnomalyReason.OUTLIER.value}',
+               jsonb_build_object('mean_z', round(avg(z)::numeric, 2), 'answers', count(*)), :detected_at
+        FROM deviations
+        GROUP BY evaluation_id
+        HAVING abs(avg(z)) >= :outlier_z
+    """,
+    AnomalyReason.RECIPROCAL_INFLATION: f"""
+        {INSERT}
+        WITH {ANSWERS_CTE},
+        evaluation_totals AS (
+            SELECT evaluation_id, evaluator_id, employee_id, evaluator_relationship,
+                   sum(score) AS total, count(*) AS answers
+            FROM answers
+            WHERE evaluator_relationship <> '{SELF}'
+            GROUP BY evaluation_id, evaluator_id, employee_id, evaluator_relationship
+        ),
+        inflation AS (
+            -- Window over every non-self rater of the employee; only peers are paired below
+            SELECT evaluation_id, evaluator_id, employee_id, evaluator_relationship,
+                   total::float / answers
+                   - (sum(total) OVER w - total)::float / nullif(sum(answers) OVER w - answers, 0) AS inflation
+            FROM evaluation_totals
+            WINDOW w AS (PARTITION BY employee_id)
+        )
+        SELECT CAST(:cycle_id AS uuid), given.evaluation_id, '{AnomalyReason.RECIPROCAL_INFLATION.value}',
+               jsonb_build_object('counterpart_evaluation_id', received.evaluation_id,
+                                  'inflation', round(given.inflation::numeric, 2),
+                                  'counterpart_inflation', round(received.inflation::numeric, 2)),
+               :detected_at
+        FROM inflation given
+        JOIN inflation received
+          ON received.evaluator_id = given.employee_id AND received.employee_id = given.evaluator_id
+        WHERE given.evaluator_relationship = '{PEER}' AND received.evaluator_relationship = '{PEER}'
+          AND given.inflation >= :inflation_margin AND received.inflation >= :inflation_margin
+    """,
+}
+
+
+def detect_anomalies(connection, cycle_id: UUID) -> Dict[AnomalyReason, int]:
+    """
+    Replace the anomaly flags of a cycle, inside the caller's transaction
+    (``connection`` is a SQLAlchemy Connection). Returns the evaluations flagged per reason.
+    """
+    started = time.perf_counter()
+    parameters = {
+        "cycle_id": str(cycle_id),
+        "detected_at": datetime.utcnow(),
+        "min_answers": settings.ANOMALY_MIN_ANSWERS,
+        "min_other_raters": settings.ANOMALY_MIN_OTHER_RATERS,
+        "outlier_z": settings.ANOMALY_OUTLIER_Z,
+        "inflation_margin": settings.ANOMALY_INFLATION_MARGIN
+    }
+    connection.execute(delete(EvaluationAnomaly).where(EvaluationAnomaly.cycle_id == cycle_id))
+    flagged = {}
+    for reason, statement in RULES.items():
+        flagged[reason] = connection.execute(text(statement), parameters).rowcount
+    logger.info("Cycle anomalies detected", extra={
+        "cycle_id": str(cycle_id),
+        "flagged": {reason.value: count for reason, count in flagged.items()},
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+    })
+    return flagged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flag suspicious evaluations of a cycle.")
+    parser.add_argument("cycle_id", type=UUID)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+    engine = create_engine(args.database_url, isolation_level="REPEATABLE READ")
+    with engine.begin() as conn:
+        counts = detect_anomalies(conn, args.cycle_id)
+    engine.dispose()
+    print("Evaluaciones marcadas: " + ", ".join(f"{reason.value} {count}" for reason, count in counts.items()))
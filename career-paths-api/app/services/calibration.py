@@ -0,0 +1,303 @@
+"""
+Vectorised rater calibration.
+
+Loads every answer of a cycle into NumPy arrays and computes, without Python
+loops over the answers:
+
+- per-evaluator z-scores: each answer relative to the mean and spread of all the
+  ratings its evaluator gave in the cycle, mapped back onto the cycle's scale;
+- inter-rater agreement per competency: ICC(1) of the ratings employees received
+  from others (one-way ANOVA with unequal group sizes);
+- self-vs-others deltas per competency, from raw and calibrated scores.
+
+Answers travel both ways with binary COPY: the query returns fixed-width rows of
+int4 codes (users and competencies are numbered in SQL) that NumPy reads in place,
+and calibrated scores go back as a binary COPY buffer built by NumPy. Memory is
+about 100 bytes per answer.
+
+Usage:
+    python -m app.services.calibration <cycle_id> [--min-ratings N]
+"""
+import argparse
+import io
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import create_engine, delete, insert, text
+
+from app.config import get_settings
+from app.models.calibration import CalibratedScore, CompetencyCalibration
+from app.models.evaluation import EvaluatorRelationship
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+RELATIONSHIPS = list(EvaluatorRelationship)
+SELF = RELATIONSHIPS.index(EvaluatorRelationship.SELF)
+MIN_SCORE, MAX_SCORE = 1.0, 10.0
+
+# PostgreSQL binary COPY framing
+COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00" + b"\x00\x00\x00\x00" + b"\x00\x00\x00\x00"
+COPY_TRAILER = b"\xff\xff"
+
+# One answer: detail id, evaluator, employee, competency, relationship, score
+ANSWER_ROW = np.dtype([
+    ("fields", ">i2"),
+    ("id_length", ">i4"), ("id", "V16"),
+    ("evaluator_length", ">i4"), ("evaluator", ">i4"),
+    ("employee_length", ">i4"), ("employee", ">i4"),
+    ("competency_length", ">i4"), ("competency", ">i4"),
+    ("relationship_length", ">i4"), ("relationship", ">i4"),
+    ("score_length", ">i4"), ("score", ">i4"),
+])
+
+# One calibrated_scores row: evaluation_detail_id, cycle_id, z_score, calibrated_score
+CALIBRATED_ROW = np.dtype([
+    ("fields", ">i2"),
+    ("id_length", ">i4"), ("id", "V16"),
+    ("cycle_length", ">i4"), ("cycle", "V16"),
+    ("z_length", ">i4"), ("z", ">f8"),
+    ("calibrated_length", ">i4"), ("calibrated", ">f8"),
+])
+
+RELATIONSHIP_CODE = "CASE e.evaluator_relationship {} END".format(
+    " ".join(f"WHEN '{relationship.value}' THEN {code}" for code, relationship in enumerate(RELATIONSHIPS))
+)
+
+CODES_SQL = """
+    user_codes AS (SELECT id, (row_number() OVER (ORDER BY id) - 1)::int4 AS code FROM users),
+    competency_codes AS (SELECT id, (row_number() OVER (ORDER BY id) - 1)::int4 AS code FROM competencies)
+"""
+
+ANSWERS_SQL = f"""
+    COPY (
+        WITH {CODES_SQL}
+        SELECT d.id, evaluator.code, employee.code, competency.code, ({RELATIONSHIP_CODE})::int4, d.score::int4
+        FROM evaluation_details d
+        JOIN evaluations e ON e.id = d.evaluation_id
+        JOIN user_codes evaluator ON evaluator.id = e.evaluator_id
+        JOIN user_codes employee ON employee.id = e.employee_id
+        JOIN competency_codes competency ON competency.id = d.competency_id
+        WHERE e.cycle_id = %(cycle_id)s
+    ) TO STDOUT WITH (FORMAT binary)
+"""
+
+
+@dataclass
+class Answers:
+    """Answers of a cycle as parallel arrays (users and competencies as dense codes)."""
+    ids: np.ndarray  # V16 evaluation_details ids
+    evaluator: np.ndarray
+    employee: np.ndarray
+    competency: np.ndarray
+    relationship: np.ndarray
+    score: np.ndarray
+    users: int
+    competencies: int
+
+
+@dataclass
+class CalibrationResult:
+    z_score: np.ndarray  # Per answer
+    calibrated: np.ndarray  # Per answer
+    answers: np.ndarray  # Per competency
+    rater_agreement: np.ndarray  # Per competency (NaN: undefined)
+    self_delta: np.ndarray  # Per competency (NaN: no employee rated by self and others)
+    self_delta_calibrated: np.ndarray
+
+
+def _grouped(keys: np.ndarray, values: np.ndarray, size: int):
+    """(count, sum, sum of squares) of ``values`` per key."""
+    return (
+        np.bincount(keys, minlength=size),
+        np.bincount(keys, weights=values, minlength=size),
+        np.bincount(keys, weights=values * values, minlength=size)
+    )
+
+
+def rater_agreement(group: np.ndarray, score: np.ndarray, group_competency: np.ndarray, competencies: int):
+    """
+    ICC(1) per competency: how much of the variance of the ratings lies between the
+    employees rated rather than between the raters of the same employee.
+    ``group`` numbers each (employee, competency) pair; ``group_competency`` maps it back.
+    """
+    count, total, squares = _grouped(group, score, len(group_competency))
+    present = count > 0
+    count, total, squares, competency = count[present], total[present], squares[present], group_competency[present]
+    group_mean = total / count
+
+    answers = np.bincount(competency, weights=count, minlength=competencies)
+    groups = np.bincount(competency, minlength=competencies).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grand_mean = np.bincount(competency, weights=total, minlength=competencies) / answers
+        between = np.bincount(competency, weights=count * (group_mean - grand_mean[competency]) ** 2,
+                              minlength=competencies)
+        within = np.bincount(competency, weights=squares - total * group_mean, minlength=competencies)
+        mean_square_between = between / (groups - 1)
+        mean_square_within = within / (answers - groups)
+        # Average group size corrected for unequal groups
+        k0 = (answers - np.bincount(competency, weights=count * count, minlength=competencies) / answers) / (groups - 1)
+        icc = (mean_square_between - mean_square_within) / (mean_square_between + (k0 - 1) * mean_square_within)
+    icc[(groups < 2) | (answers - groups < 1) | ~np.isfinite(icc)] = np.nan
+    return icc
+
+
+def self_deltas(group: np.ndarray, score: np.ndarray, is_self: np.ndarray, group_competency: np.ndarray,
+                competencies: int):
+    """Mean over employees of (self score - others' mean score) per competency."""
+    size = len(group_competency)
+    self_count = np.bincount(group[is_self], minlength=size)
+    self_total = np.bincount(group[is_self], weights=score[is_self], minlength=size)
+    others_count = np.bincount(group[~is_self], minlength=size)
+    others_total = np.bincount(group[~is_self], weights=score[~is_self], minlength=size)
+    both = (self_count > 0) & (others_count > 0)
+    delta = self_total[both] / self_count[both] - others_total[both] / others_count[both]
+    competency = group_competency[both]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (np.bincount(competency, weights=delta, minlength=competencies)
+                / np.bincount(competency, minlength=competencies))
+
+
+def calibrate(answers: Answers, min_ratings: int) -> CalibrationResult:
+    """Run every computation over the cycle's answers."""
+    score = answers.score.astype(np.float64)
+    global_mean = score.mean()
+    global_std = score.std() or 1.0
+
+    # Per-evaluator normalisation; evaluators with too few or identical ratings keep their raw scores
+    count, total, squares = _grouped(answers.evaluator, score, answers.users)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        std = np.sqrt(np.maximum(squares / count - mean * mean, 0.0))
+    reliable = (count >= min_ratings) & (std > 0)
+    evaluator_mean = np.where(reliable, mean, global_mean)[answers.evaluator]
+    evaluator_std = np.where(reliable, std, global_std)[answers.evaluator]
+    z_score = (score - evaluator_mean) / evaluator_std
+    calibrated = np.clip(global_mean + z_score * global_std, MIN_SCORE, MAX_SCORE)
+
+    group = answers.employee.astype(np.int64) * answers.competencies + answers.competency
+    group_competency = np.tile(np.arange(answers.competencies), answers.users)
+    is_self = answers.relationship == SELF
+    return CalibrationResult(
+        z_score=z_score,
+        calibrated=calibrated,
+        answers=np.bincount(answers.competency, minlength=answers.competencies),
+        rater_agreement=rater_agreement(group[~is_self], score[~is_self], group_competency, answers.competencies),
+        self_delta=self_deltas(group, score, is_self, group_competency, answers.competencies),
+        self_delta_calibrated=self_deltas(group, calibrated, is_self, group_competency, answers.competencies)
+    )
+
+
+def decode_answers(buffer, competencies: int) -> Answers:
+    """
+    Parse the binary COPY output of ANSWERS_SQL (bytes or a memoryview) without copying it.
+    The user code range is taken from the rows themselves, so it always covers every code
+    the query produced; ``competencies`` is a lower bound for the competency code range.
+    """
+    buffer = memoryview(buffer)
+    if (buffer[:len(COPY_SIGNATURE)].tobytes() != COPY_SIGNATURE
+            or buffer[len(buffer) - len(COPY_TRAILER):].tobytes() != COPY_TRAILER):
+        raise ValueError("Unexpected COPY output")
+    rows = np.frombuffer(buffer, dtype=ANSWER_ROW, offset=len(COPY_SIGNATURE),
+                         count=(len(buffer) - len(COPY_SIGNATURE) - len(COPY_TRAILER)) // ANSWER_ROW.itemsize)
+    evaluator = rows["evaluator"].astype(np.int64)
+    employee = rows["employee"].astype(np.int64)
+    competency = rows["competency"].astype(np.int64)
+    return Answers(
+        ids=rows["id"],
+        evaluator=evaluator,
+        employee=employee,
+        competency=competency,
+        relationship=rows["relationship"].astype(np.int8),
+        score=rows["score"].astype(np.int16),
+        users=int(max(evaluator.max(), employee.max())) + 1 if len(rows) else 0,
+        competencies=max(competencies, int(competency.max()) + 1 if len(rows) else 0)
+    )
+
+
+def encode_calibrated(ids: np.ndarray, cycle_id: UUID, result: CalibrationResult) -> bytes:
+    """calibrated_scores rows as a binary COPY buffer."""
+    rows = np.empty(len(ids), dtype=CALIBRATED_ROW)
+    rows["fields"] = 4
+    rows["id_length"], rows["id"] = 16, ids
+    rows["cycle_length"], rows["cycle"] = 16, np.void(cycle_id.bytes)
+    rows["z_length"], rows["z"] = 8, result.z_score
+    rows["calibrated_length"], rows["calibrated"] = 8, result.calibrated
+    return COPY_SIGNATURE + rows.tobytes() + COPY_TRAILER
+
+
+def calibrate_cycle(connection, cycle_id: UUID, min_ratings: int = settings.CALIBRATION_MIN_RATINGS) -> Dict[str, float]:
+    """
+    Calibrate a cycle and replace its calibrated_scores and competency_calibrations rows,
+    inside the caller's transaction (``connection`` is a SQLAlchemy Connection; use
+    REPEATABLE READ so competencies added meanwhile cannot shift their codes).
+    Returns the seconds spent in each phase.
+    """
+    timings = {}
+    started = time.perf_counter()
+    # Competency codes of the COPY query are positions in this list
+    competency_ids: List[UUID] = connection.execute(text("SELECT id FROM competencies ORDER BY id")).scalars().all()
+    cursor = connection.connection.driver_connection.cursor()
+    output = io.BytesIO()
+    cursor.copy_expert(cursor.mogrify(ANSWERS_SQL, {"cycle_id": str(cycle_id)}).decode(), output)
+    # A view of the COPY output: NumPy reads it in place instead of a second copy
+    answers = decode_answers(output.getbuffer(), len(competency_ids))
+    timings["load"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = calibrate(answers, min_ratings) if len(answers.ids) else None
+    timings["compute"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    connection.execute(delete(CalibratedScore).where(CalibratedScore.cycle_id == cycle_id))
+    connection.execute(delete(CompetencyCalibration).where(CompetencyCalibration.cycle_id == cycle_id))
+    if result is not None:
+        cursor.copy_expert(
+            "COPY calibrated_scores (evaluation_detail_id, cycle_id, z_score, calibrated_score) "
+            "FROM STDIN WITH (FORMAT binary)",
+            io.BytesIO(encode_calibrated(answers.ids, cycle_id, result))
+        )
+        calibrated_at = datetime.utcnow()
+
+        def optional(value):
+            return None if np.isnan(value) else float(value)
+
+        connection.execute(insert(CompetencyCalibration), [
+            {
+                "cycle_id": cycle_id,
+                "competency_id": competency_id,
+                "answers": int(result.answers[code]),
+                "rater_agreement": optional(result.rater_agreement[code]),
+                "self_delta": optional(result.self_delta[code]),
+                "self_delta_calibrated": optional(result.self_delta_calibrated[code]),
+                "calibrated_at": calibrated_at
+            }
+            for code, competency_id in enumerate(competency_ids)
+            if result.answers[code]
+        ])
+    timings["write"] = time.perf_counter() - started
+    logger.info("Cycle calibrated", extra={
+        "cycle_id": str(cycle_id), "answers": len(answers.ids),
+        "duration_ms": {phase: round(seconds * 1000, 1) for phase, seconds in timings.items()}
+    })
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate the scores of an evaluation cycle per rater.")
+    parser.add_argument("cycle_id", type=UUID)
+    parser.add_argument("--min-ratings", type=int, default=settings.CALIBRATION_MIN_RATINGS,
+                        help="Evaluators with fewer ratings keep their raw scores")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+    engine = create_engine(args.database_url, isolation_level="REPEATABLE READ")
+    with engine.begin() as conn:
+        phases = calibrate_cycle(conn, args.cycle_id, args.min_ratings)
+    engine.dispose()
+    print("Ciclo calibrado: " + ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in phases.items()))
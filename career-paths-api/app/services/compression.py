@@ -0,0 +1,168 @@
+"""
+Response compression (brotli when the ``brotli`` package is installed, gzip otherwise).
+
+``CompressionMiddleware`` is a pure ASGI middleware: single-body responses are
+compressed in one go when they reach ``COMPRESSION_MINIMUM_SIZE``, and streaming
+responses are compressed chunk by chunk (each chunk is flushed so clients keep
+receiving data as it is produced). Responses that already carry a
+``Content-Encoding`` pass through untouched, which is how precompressed
+response-cache variants are served.
+"""
+import gzip
+import zlib
+from typing import Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: only gzip is offered without it
+    brotli = None
+
+settings = get_settings()
+
+# Preferred first
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+UNCOMPRESSED_STATUSES = {204, 206, 304}
+
+
+def negotiate(accept_encoding: Optional[str], supported: Tuple[str, ...] = SUPPORTED_ENCODINGS) -> Optional[str]:
+    """Pick the preferred supported encoding accepted by the client (``q=0`` refuses it)."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.strip().partition(";")
+        quality = 1.0
+        parameter = parameters.strip()
+        if parameter.startswith("q="):
+            try:
+                quality = float(parameter[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    candidates = [coding for coding in supported if accepted.get(coding, accepted.get("*", 0.0)) > 0]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda coding: accepted.get(coding, accepted.get("*", 0.0)))
+
+
+def compressible(content_type: Optional[str], size: Optional[int] = None,
+                 content_types: Optional[Iterable[str]] = None, minimum_size: Optional[int] = None) -> bool:
+    """Whether a response of this type (and size, when known) is worth compressing."""
+    if content_types is None:
+        content_types = [prefix.strip() for prefix in settings.COMPRESSION_CONTENT_TYPES.split(",") if prefix.strip()]
+    minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+    if not content_type or not any(content_type.startswith(prefix) for prefix in content_types):
+        return False
+    return size is None or size >= minimum_size
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    # mtime=0 keeps the output identical for identical bodies
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def weak_etag(etag: Optional[str]) -> Optional[str]:
+    """A strong ETag no longer identifies the bytes once they are re-encoded."""
+    if etag is None or etag.startswith("W/"):
+        return etag
+    return f"W/{etag}"
+
+
+class StreamCompressor:
+    """Incremental compressor that flushes every chunk."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool = False) -> bytes:
+        if self.encoding == "br":
+            output = self._compressor.process(data)
+            return output + (self._compressor.finish() if final else self._compressor.flush())
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Compress eligible HTTP responses with the best encoding the client accepts."""
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None, content_types: Optional[Iterable[str]] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        self.content_types = list(content_types) if content_types is not None else [
+            prefix.strip() for prefix in settings.COMPRESSION_CONTENT_TYPES.split(",") if prefix.strip()
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is not None:
+                chunk = compressor.compress(body, final=not more_body)
+                if chunk or not more_body:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            # First body message: decide once for the whole response
+            headers = MutableHeaders(scope=start)
+            eligible = (
+                start["status"] not in UNCOMPRESSED_STATUSES
+                and "content-encoding" not in headers
+                and compressible(headers.get("content-type"), content_types=self.content_types, minimum_size=0)
+            )
+            if eligible:
+                headers.add_vary_header("Accept-Encoding")
+            known_size = len(body) if not more_body else (
+                int(headers["content-length"]) if "content-length" in headers else None
+            )
+            if not eligible or (known_size is not None and known_size < self.minimum_size):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            headers["Content-Encoding"] = encoding
+            if "etag" in headers:
+                headers["ETag"] = weak_etag(headers["etag"])
+            if not more_body:
+                compressed = compress(body, encoding)
+                headers["Content-Length"] = str(len(compressed))
+                await send(start)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+            del headers["content-length"]
+            compressor = StreamCompressor(encoding)
+            await send(start)
+            await send({"type": "http.response.body", "body": compressor.compress(body), "more_body": True})
+
+        await self.app(scope, receive, send_compressed)
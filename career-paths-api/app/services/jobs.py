@@ -0,0 +1,25 @@
+"""
+Helpers for background jobs (AI processing, career path generation).
+"""
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from app.logging_config import job_context
+from app.services.loop_monitor import track_activity
+from app.services.tracing import tracer
+
+
+@contextmanager
+def background_job(name: str, **attributes: Any) -> Iterator[str]:
+    """
+    Run a block as a named background job.
+    Tags logs with a job ID, opens a ``job.<name>`` span and attributes
+    event-loop stalls to the job instead of the request that queued it.
+    
+    Yields:
+        str: The job correlation ID
+    """
+    span_attributes = {key: str(value) for key, value in attributes.items()}
+    with job_context(name) as job_id, tracer.span(f"job.{name}", attributes=span_attributes), \
+            track_activity(f"job:{name}"):
+        yield job_id
@@ -0,0 +1,177 @@
+"""
+Event-loop blocking detector.
+
+A heartbeat coroutine measures event-loop lag while a watchdog thread notices
+when the heartbeat stops. When the loop is blocked longer than the threshold,
+the watchdog captures the loop thread's stack and attributes the stall to the
+route or background job running on the current task.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Union
+
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_ACTIVITY = "unknown"
+
+# Activities per asyncio task (job label or request scope); a stack so jobs can
+# nest inside the request task that runs them as background tasks
+_task_activities: Dict[asyncio.Task, List[Union[str, dict]]] = {}
+
+
+@contextmanager
+def track_activity(label: Union[str, dict]) -> Iterator[None]:
+    """Attribute any stall on the current task to ``label`` while the block runs."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is None:
+        yield
+        return
+    stack = _task_activities.setdefault(task, [])
+    stack.append(label)
+    try:
+        yield
+    finally:
+        stack.pop()
+        if not stack:
+            _task_activities.pop(task, None)
+
+
+@dataclass
+class Stall:
+    """A detected event-loop stall."""
+    activity: str
+    blocked_seconds: float
+    stack: str
+
+
+class EventLoopMonitor:
+    """Measures event-loop lag and reports stalls over a threshold."""
+
+    def __init__(self, interval: float = 0.05, threshold: float = 0.25, stack_limit: int = 25):
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_limit = stack_limit
+        self.recent_stalls: Deque[Stall] = deque(maxlen=50)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_beat = time.monotonic()
+        self._reported_beat: Optional[float] = None
+        self._stall_activity = UNKNOWN_ACTIVITY
+        self._route_templates: Dict[object, str] = {}
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+
+    async def _heartbeat(self) -> None:
+        while not self._stop.is_set():
+            before = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - before - self.interval, 0.0)
+            metrics.EVENT_LOOP_LAG.observe(lag)
+            if lag >= self.threshold:
+                metrics.EVENT_LOOP_STALL_DURATION.labels(activity=self._stall_activity).observe(lag)
+                self._stall_activity = UNKNOWN_ACTIVITY
+            self._last_beat = now
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            last_beat = self._last_beat
+            blocked = time.monotonic() - last_beat
+            if blocked < self.threshold + self.interval or self._reported_beat == last_beat:
+                continue
+            # Report each stall once, while it is still happening
+            self._reported_beat = last_beat
+            stall = Stall(self._current_activity(), blocked, self._capture_stack())
+            self._stall_activity = stall.activity
+            self.recent_stalls.append(stall)
+            metrics.EVENT_LOOP_STALLS.labels(activity=stall.activity).inc()
+            logger.warning(
+                "Event loop blocked",
+                extra={
+                    "activity": stall.activity,
+                    "blocked_ms": round(blocked * 1000),
+                    "stack": stall.stack
+                }
+            )
+
+    def _current_activity(self) -> str:
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        if task is None:
+            return UNKNOWN_ACTIVITY
+        stack = _task_activities.get(task)
+        return _describe(stack[-1], self._route_templates) if stack else UNKNOWN_ACTIVITY
+
+    def _capture_stack(self) -> str:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame, limit=self.stack_limit))
+
+
+class LoopActivityMiddleware:
+    """ASGI middleware labelling each request task with its route for stall attribution."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # The scope is stored and resolved to a route template only when a stall is reported
+        with track_activity(scope):
+            await self.app(scope, receive, send)
+
+
+def _describe(activity: Union[str, dict], route_templates: Dict[object, str]) -> str:
+    """Turn a job label or an ASGI scope into a bounded-cardinality activity label."""
+    if isinstance(activity, str):
+        return activity
+    method = activity.get("method", "")
+    endpoint = activity.get("endpoint")
+    if endpoint is None:
+        return f"{method} unmatched"
+    template = route_templates.get(endpoint)
+    if template is None:
+        template = "unmatched"
+        for route in getattr(activity.get("app"), "routes", []):
+            if getattr(route, "endpoint", None) is endpoint:
+                template = route.path
+                break
+        route_templates[endpoint] = template
+    return f"{method} {template}"
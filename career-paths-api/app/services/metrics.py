@@ -0,0 +1,414 @@
+"""
+In-process metrics registry exposed in Prometheus text format.
+
+Metrics are kept per worker process; no external collector or client library
+is required. Every metric the API records is declared at the bottom of this
+module so the full catalog lives in one place.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **kwargs: str):
+        """Return the child metric for the given label values."""
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _default_child(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def collect(self) -> List[str]:
+        """Return the exposition lines for this metric."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._collect_child(values, child))
+        return lines
+
+    def _collect_child(self, values: Tuple[str, ...], child) -> List[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default_child().inc(amount)
+
+    def _collect_child(self, values, child):
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class _GaugeChild:
+    def __init__(self):
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value at scrape time instead of storing it."""
+        self.function = function
+
+    def get(self) -> float:
+        if self.function is not None:
+            return float(self.function())
+        return self.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    metric_type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default_child().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default_child().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default_child().set_function(function)
+
+    def _collect_child(self, values, child):
+        try:
+            value = child.get()
+        except Exception:
+            # A failing callback must never break the whole scrape
+            return []
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}"]
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed upper bounds."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != float("inf")))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default_child().observe(value)
+
+    def time(self):
+        return self._default_child().time()
+
+    def _collect_child(self, values, child):
+        lines = []
+        cumulative = 0
+        bucket_names = self.labelnames + ("le",)
+        for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+            cumulative += count
+            labels = _format_labels(bucket_names, values + (_format_value(bound),))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the metrics of this process and renders them."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency and in-flight requests.
+
+    Routes are labelled with their path template (``/api/v1/career-paths/{user_id}``)
+    so label cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_templates: Dict[object, str] = {}
+
+    def _route_template(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        template = self._route_templates.get(endpoint)
+        if template is None:
+            template = "unmatched"
+            for route in getattr(scope.get("app"), "routes", []):
+                if getattr(route, "endpoint", None) is endpoint:
+                    template = route.path
+                    break
+            self._route_templates[endpoint] = template
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        finished = False
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method=method)
+        in_flight.inc()
+        start = time.perf_counter()
+
+        def finish():
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            in_flight.dec()
+            HTTP_REQUEST_DURATION.labels(
+                method=method,
+                route=self._route_template(scope),
+                status=str(status_code)
+            ).observe(time.perf_counter() - start)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            # Background tasks run after the body is sent; don't count them as latency
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish()
+
+
+# ============================================================================
+# Metric catalog
+# ============================================================================
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    ("method",)
+)
+
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to obtain a connection from the pool.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+)
+DB_POOL_CHECKOUT_TIMEOUTS = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Connection checkouts that timed out waiting for the pool."
+)
+DB_POOL_SIZE = registry.gauge("db_pool_size", "Configured connection pool size.")
+DB_POOL_CHECKED_OUT = registry.gauge("db_pool_checked_out", "Connections currently checked out.")
+DB_POOL_OVERFLOW = registry.gauge("db_pool_overflow", "Overflow connections currently open.")
+DB_REPLICA_LAG = registry.gauge(
+    "db_replica_lag_seconds",
+    "Replication lag at the last health check (-1 when the replica is unreachable).",
+    ("replica",)
+)
+DB_READS = registry.counter(
+    "db_read_sessions_total",
+    "Read-only sessions by the database they were routed to.",
+    ("target",)
+)
+
+RESPONSE_CACHE_LOOKUPS = registry.counter(
+    "response_cache_lookups_total",
+    "Response cache lookups by endpoint and result (hit or miss).",
+    ("endpoint", "result")
+)
+REFERENCE_CACHE_LOOKUPS = registry.counter(
+    "reference_cache_lookups_total",
+    "Shared reference-data lookups by table and result (a miss falls back to the database).",
+    ("table", "result")
+)
+
+AI_REQUEST_DURATION = registry.histogram(
+    "ai_request_duration_seconds",
+    "AI service call latency including retries.",
+    ("operation", "outcome")
+)
+AI_RETRIES = registry.counter(
+    "ai_request_retries_total",
+    "AI service attempts that failed and were retried.",
+    ("operation",)
+)
+AI_FAILURES = registry.counter(
+    "ai_request_failures_total",
+    "AI service calls that failed after exhausting retries.",
+    ("operation",)
+)
+
+PIPELINE_STAGE_DURATION = registry.histogram(
+    "pipeline_stage_duration_seconds",
+    "Duration of assessment and career path pipeline stages.",
+    ("stage",)
+)
+
+EVENT_LOOP_LAG = registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled event-loop wake-up and when it actually ran.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+EVENT_LOOP_STALLS = registry.counter(
+    "event_loop_stalls_total",
+    "Event-loop stalls over the threshold, by route or job.",
+    ("activity",)
+)
+EVENT_LOOP_STALL_DURATION = registry.histogram(
+    "event_loop_stall_seconds",
+    "Duration of event-loop stalls over the threshold, by route or job.",
+    ("activity",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
@@ -0,0 +1,344 @@
+"""
+Reference data shared by all worker processes through a memory-mapped file.
+
+The competency catalog, evaluation cycles and user directory are written by a
+single loader into one binary snapshot. Every uvicorn worker maps the same file
+read-only, so the pages are shared by the OS page cache instead of being copied
+into each process, and lookups binary-search the mapping without decoding it.
+
+File layout (little endian)::
+
+    header   magic "SRDC", format version, section count, data version,
+             built_at (epoch seconds), source digest, CRC32 of the payload
+    sections name, offset, record count, value width (one entry per section)
+    payload  per section, records sorted by a 16-byte key, each followed by
+             ``value width`` bytes
+
+Keys are UUID bytes, or a 16-byte BLAKE2b digest for competency names.
+
+A new snapshot is written to a temporary file and renamed over the old one, so
+a worker never sees a partial file; workers notice the new inode with a cheap
+``stat`` and remap. Deleting the file (``invalidate``) invalidates every worker
+at once. Lookups only answer positively: a miss (unknown id, cache disabled or
+not built yet) means "ask the database".
+"""
+import asyncio
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.competency import Competency
+from app.models.evaluation_cycle import CycleStatus, EvaluationCycle
+from app.models.user import User
+from app.services.metrics import REFERENCE_CACHE_LOOKUPS
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SRDC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHQd8sI")
+SECTION = struct.Struct("<8sQIH")
+KEY_WIDTH = 16
+
+COMPETENCIES = b"compets"
+CYCLES = b"cycles"
+USERS = b"users"
+
+CYCLE_STATUSES = list(CycleStatus)
+
+
+def competency_key(name: str) -> bytes:
+    return hashlib.blake2b(name.encode("utf-8"), digest_size=KEY_WIDTH).digest()
+
+
+def source_digest(database_url: str) -> bytes:
+    """Identifies the database a snapshot was loaded from (the password is not part of it)."""
+    rendered = make_url(database_url).render_as_string(hide_password=True)
+    return hashlib.blake2b(rendered.encode("utf-8"), digest_size=8).digest()
+
+
+def default_path(database_url: str) -> Path:
+    """One snapshot file per database in the temporary directory."""
+    return Path(tempfile.gettempdir()) / f"career-paths-reference-{source_digest(database_url).hex()}.bin"
+
+
+def encode_snapshot(competencies: Iterable[Tuple[str, UUID]], cycles: Iterable[Tuple[UUID, CycleStatus]],
+                    users: Iterable[UUID], version: int, source: bytes) -> bytes:
+    """Serialise reference data into the snapshot format."""
+    sections = [
+        (COMPETENCIES, KEY_WIDTH, sorted((competency_key(name), uuid.bytes) for name, uuid in competencies)),
+        (CYCLES, 1, sorted((uuid.bytes, bytes([CYCLE_STATUSES.index(status)])) for uuid, status in cycles)),
+        (USERS, 0, sorted((uuid.bytes, b"") for uuid in users)),
+    ]
+    offset = HEADER.size + SECTION.size * len(sections)
+    directory, payload = [], []
+    for name, width, records in sections:
+        directory.append(SECTION.pack(name, offset, len(records), width))
+        payload.extend(key + value for key, value in records)
+        offset += len(records) * (KEY_WIDTH + width)
+    body = b"".join(directory) + b"".join(payload)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), version, time.time(), source, zlib.crc32(body))
+    return header + body
+
+
+def load_snapshot(db: Session, version: int, source: bytes) -> bytes:
+    """Read the reference tables and encode them."""
+    return encode_snapshot(
+        db.query(Competency.name, Competency.id).all(),
+        db.query(EvaluationCycle.id, EvaluationCycle.status).all(),
+        (user_id for (user_id,) in db.query(User.id).yield_per(10000)),
+        version,
+        source
+    )
+
+
+class ReferenceSnapshot:
+    """Read-only view over an encoded snapshot (bytes or a memory map)."""
+
+    def __init__(self, buffer):
+        if len(buffer) < HEADER.size:
+            raise ValueError("Reference snapshot is truncated")
+        magic, format_version, section_count, self.version, self.built_at, self.source, crc = \
+            HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError("Not a reference snapshot of a supported format")
+        if zlib.crc32(memoryview(buffer)[HEADER.size:]) != crc:
+            raise ValueError("Reference snapshot checksum mismatch")
+        self._buffer = buffer
+        self._sections: Dict[bytes, Tuple[int, int, int]] = {}
+        for index in range(section_count):
+            name, offset, count, width = SECTION.unpack_from(buffer, HEADER.size + index * SECTION.size)
+            self._sections[name.rstrip(b"\0")] = (offset, count, width)
+
+    def _find(self, section: bytes, key: bytes) -> Optional[bytes]:
+        """Value of ``key`` in a section, by binary search over the sorted records."""
+        offset, count, width = self._sections[section]
+        stride = KEY_WIDTH + width
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * stride
+            probe = self._buffer[start:start + KEY_WIDTH]
+            if probe < key:
+                low = middle + 1
+            elif probe > key:
+                high = middle
+            else:
+                return self._buffer[start + KEY_WIDTH:start + stride]
+        return None
+
+    def competency_id(self, name: str) -> Optional[UUID]:
+        value = self._find(COMPETENCIES, competency_key(name))
+        return UUID(bytes=value) if value is not None else None
+
+    def cycle_status(self, cycle_id: UUID) -> Optional[CycleStatus]:
+        value = self._find(CYCLES, cycle_id.bytes)
+        return CYCLE_STATUSES[value[0]] if value is not None else None
+
+    def has_user(self, user_id: UUID) -> bool:
+        return self._find(USERS, user_id.bytes) is not None
+
+    def counts(self) -> Dict[str, int]:
+        return {name.decode(): count for name, (_, count, _) in self._sections.items()}
+
+
+class ReferenceDataCache:
+    """
+    Per-process handle on the shared snapshot file.
+
+    Any process may rebuild the file; an exclusive ``flock`` on a side lock
+    file makes sure only one loader queries the database at a time.
+    """
+
+    def __init__(self, path: Path, source: bytes, max_age_seconds: float, check_interval: float,
+                 enabled: bool = True):
+        self.path = Path(path)
+        self.source = source
+        self.max_age_seconds = max_age_seconds
+        self.check_interval = check_interval
+        self.enabled = enabled
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # Reading
+
+    def snapshot(self) -> Optional[ReferenceSnapshot]:
+        """Current snapshot, remapped when another process replaced the file."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if now - self._checked_at >= self.check_interval:
+                    self._checked_at = now
+                    self._remap()
+        return self._snapshot
+
+    def _remap(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._snapshot, self._file_id = None, None
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id == self._file_id:
+            return
+        try:
+            with open(self.path, "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            snapshot = ReferenceSnapshot(mapping)
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable reference snapshot %s", self.path, exc_info=True)
+            self._snapshot, self._file_id = None, file_id
+            return
+        if snapshot.source != self.source:
+            logger.warning("Reference snapshot %s belongs to another database; ignoring it", self.path)
+            snapshot = None
+        # The previous mapping is unmapped once no lookup references it
+        self._snapshot, self._file_id = snapshot, file_id
+
+    def _lookup(self, table: str, find: Callable[[ReferenceSnapshot], object]):
+        snapshot = self.snapshot()
+        value = find(snapshot) if snapshot is not None else None
+        REFERENCE_CACHE_LOOKUPS.labels(table=table, result="hit" if value else "miss").inc()
+        return value
+
+    def competency_id(self, name: str) -> Optional[UUID]:
+        """Id of the competency with this name, or None when the database must be asked."""
+        return self._lookup("competencies", lambda snapshot: snapshot.competency_id(name))
+
+    def has_cycle(self, cycle_id: UUID) -> bool:
+        """True when the cycle is known to exist; False means "ask the database"."""
+        return bool(self._lookup("cycles", lambda snapshot: snapshot.cycle_status(cycle_id)))
+
+    def has_user(self, user_id: UUID) -> bool:
+        """True when the user is known to exist; False means "ask the database"."""
+        return bool(self._lookup("users", lambda snapshot: snapshot.has_user(user_id)))
+
+    # Writing
+
+    def rebuild(self, session_factory: Callable[[], Session], blocking: bool = True) -> bool:
+        """
+        Load the reference tables and atomically replace the snapshot file.
+        Returns False when ``blocking`` is off and another process holds the lock.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                return False
+            try:
+                self._write(session_factory)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        self._checked_at = float("-inf")
+        return True
+
+    def _write(self, session_factory: Callable[[], Session]) -> None:
+        current = self._read_header()
+        version = current[0] + 1 if current else 1
+        started = time.perf_counter()
+        db = session_factory()
+        try:
+            data = load_snapshot(db, version, self.source)
+        finally:
+            db.close()
+        descriptor, temporary = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        logger.info("Reference snapshot written", extra={
+            "version": version, "bytes": len(data), "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+        })
+
+    def _read_header(self) -> Optional[Tuple[int, float]]:
+        """(data version, built_at) of the file on disk, if any."""
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(HEADER.size)
+        except FileNotFoundError:
+            return None
+        if len(header) < HEADER.size:
+            return None
+        magic, format_version, _, version, built_at, source, _ = HEADER.unpack(header)
+        if magic != MAGIC or format_version != FORMAT_VERSION or source != self.source:
+            return None
+        return version, built_at
+
+    def refresh_if_stale(self, session_factory: Callable[[], Session]) -> bool:
+        """Rebuild a missing or expired snapshot unless another process is already doing it."""
+        current = self._read_header()
+        if current is not None and time.time() - current[1] < self.max_age_seconds:
+            return False
+        return self.rebuild(session_factory, blocking=False)
+
+    def invalidate(self) -> None:
+        """Delete the snapshot: every worker falls back to the database until it is rebuilt."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        self._checked_at = float("-inf")
+
+    # Background refresh
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """Keep the snapshot fresh from the running event loop (the first check runs immediately)."""
+        if self.enabled:
+            self._task = asyncio.get_running_loop().create_task(self._refresh_forever(session_factory))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_forever(self, session_factory: Callable[[], Session]) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh_if_stale, session_factory)
+            except Exception:
+                logger.exception("Reference snapshot refresh failed")
+            await asyncio.sleep(min(self.max_age_seconds / 2, 60.0))
+
+
+def for_database(database_url: str) -> ReferenceDataCache:
+    """Cache handle for a database, configured from settings."""
+    return ReferenceDataCache(
+        path=Path(settings.REFERENCE_CACHE_PATH) if settings.REFERENCE_CACHE_PATH else default_path(database_url),
+        source=source_digest(database_url),
+        max_age_seconds=settings.REFERENCE_CACHE_MAX_AGE_SECONDS,
+        check_interval=settings.REFERENCE_CACHE_CHECK_INTERVAL,
+        enabled=settings.REFERENCE_CACHE_ENABLED
+    )
+
+
+reference_data = for_database(settings.DATABASE_URL)
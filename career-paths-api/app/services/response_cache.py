@@ -0,0 +1,149 @@
+"""
+In-process cache of serialised JSON responses with strong ETags.
+
+Front-ends poll the skills-assessment and career-path endpoints while the AI
+pipeline runs. Each entry keeps the response bytes and their ETag for a short
+TTL (least recently used entries are evicted first), so repeat reads are
+answered without touching the database, and ``If-None-Match`` requests get a
+bodyless ``304 Not Modified``. Compressed variants are kept alongside the
+body, so hot reads are not recompressed on every hit.
+
+The cache lives in each worker process. Writers invalidate the entries they
+change; other workers (and reads served by a lagging replica) can serve stale
+data for at most ``RESPONSE_CACHE_TTL_SECONDS``.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, NamedTuple, Optional
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+from app.services.compression import compress, compressible, negotiate
+from app.services.metrics import RESPONSE_CACHE_LOOKUPS
+
+settings = get_settings()
+
+JSON_MEDIA_TYPE = "application/json"
+CACHE_CONTROL = "private, no-cache"  # Clients may store the response but must revalidate it
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+    expires_at: float
+    # Compressed bodies by content coding, filled on first use so hits never recompress
+    variants: Dict[str, bytes]
+
+    def variant(self, encoding: str) -> bytes:
+        body = self.variants.get(encoding)
+        if body is None:
+            body = self.variants[encoding] = compress(self.body, encoding)
+        return body
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU map of cache keys to serialised responses."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, etag: str, body: bytes) -> CachedResponse:
+        """Store a response and return it; nothing is stored when the cache is disabled."""
+        entry = CachedResponse(etag, body, self.clock() + self.ttl_seconds, {})
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from the values that identify a version of the response (ids, updated_at...)."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as required for ``If-None-Match`` (RFC 9110, section 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in (candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates)
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    """Strong ETag of a compressed variant: each representation needs its own."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def cached_response(request: Request, entry: CachedResponse) -> Response:
+    """
+    Answer with 304 when the client already has this version, otherwise with the
+    cached body, precompressed when the client accepts it.
+    """
+    encoding = None
+    headers = {"Cache-Control": CACHE_CONTROL}
+    if settings.COMPRESSION_ENABLED and compressible(JSON_MEDIA_TYPE, len(entry.body)):
+        encoding = negotiate(request.headers.get("accept-encoding"))
+        headers["Vary"] = "Accept-Encoding"
+    headers["ETag"] = variant_etag(entry.etag, encoding) if encoding else entry.etag
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, entry.etag) or etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(entry.body, media_type=JSON_MEDIA_TYPE, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(entry.variant(encoding), media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def lookup(request: Request, endpoint: str, key: Hashable) -> Optional[Response]:
+    """Response for ``key`` if it is cached, recording the hit or miss."""
+    entry = response_cache.get(key)
+    RESPONSE_CACHE_LOOKUPS.labels(endpoint=endpoint, result="miss" if entry is None else "hit").inc()
+    return None if entry is None else cached_response(request, entry)
+
+
+def store(request: Request, key: Hashable, etag: str, body: bytes) -> Response:
+    """Cache an encoded JSON response under ``key`` and answer the request with it."""
+    return cached_response(request, response_cache.put(key, etag, body))
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES if settings.RESPONSE_CACHE_ENABLED else 0,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,367 @@
+"""
+Lightweight in-process tracing with an OTLP-compatible file exporter.
+
+Spans follow the W3C Trace Context model (``traceparent`` header) and are
+written as OTLP/JSON ``ExportTraceServiceRequest`` objects, one batch per line,
+so traces can be inspected or imported into any OTLP tool fully offline.
+"""
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class Span:
+    """A timed operation; non-sampled spans only carry IDs for propagation."""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_span_id", "sampled",
+                 "start_ns", "end_ns", "attributes", "events", "status_code", "status_message")
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str], sampled: bool,
+                 kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status_code = 0
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        if self.sampled:
+            self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": attributes or {}})
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = str(exc)[:500]
+        self.add_event("exception", {
+            "exception.type": type(exc).__name__,
+            "exception.message": str(exc)[:500]
+        })
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.events:
+            span["events"] = [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": str(event["time_ns"]),
+                    "attributes": _otlp_attributes(event["attributes"]),
+                }
+                for event in self.events
+            ]
+        return span
+
+
+class FileSpanExporter:
+    """
+    Writes finished spans as OTLP/JSON lines from a background thread.
+    Spans are dropped (and counted) if the queue is full rather than blocking requests.
+    """
+
+    def __init__(self, path: str, service_name: str, max_batch: int = 512,
+                 flush_interval: float = 1.0, max_queue: int = 10000):
+        self.path = path
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch:
+                try:
+                    span = self._queue.get(timeout=max(deadline - time.monotonic(), 0.01))
+                except queue.Empty:
+                    break
+                if span is None:
+                    running = False
+                    break
+                batch.append(span)
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[Span]) -> None:
+        request = {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                "scopeSpans": [{
+                    "scope": {"name": "app.services.tracing"},
+                    "spans": [span.to_otlp() for span in batch],
+                }],
+            }]
+        }
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(request, separators=(",", ":")) + "\n")
+        except OSError:
+            logger.exception("Could not write spans", extra={"path": self.path})
+
+
+class Tracer:
+    """Creates spans and hands finished, sampled spans to the exporter."""
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.exporter: Optional[FileSpanExporter] = None
+
+    def configure(self, exporter: Optional[FileSpanExporter], sample_rate: float = 1.0) -> None:
+        self.exporter = exporter
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.enabled = exporter is not None
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+        self.configure(None)
+
+    def _new_span(self, name: str, kind: int, attributes: Optional[Dict[str, Any]],
+                  parent: Optional[Span] = None, remote_parent: Optional[str] = None) -> Span:
+        parent = parent or _current_span.get()
+        if parent is not None:
+            return Span(name, parent.trace_id, parent.span_id, parent.sampled, kind, attributes)
+        if remote_parent:
+            match = _TRACEPARENT_RE.match(remote_parent.strip().lower())
+            if match:
+                trace_id, parent_id, flags = match.groups()
+                # Parent-based sampling: follow the caller's decision
+                return Span(name, trace_id, parent_id, int(flags, 16) & 1 == 1, kind, attributes)
+        trace_id = f"{random.getrandbits(128):032x}"
+        return Span(name, trace_id, None, random.random() < self.sample_rate, kind, attributes)
+
+    def start_span(self, name: str, kind: int = SPAN_KIND_INTERNAL,
+                   attributes: Optional[Dict[str, Any]] = None, parent: Optional[Span] = None,
+                   remote_parent: Optional[str] = None) -> Optional[Span]:
+        """Start a span without making it current; finish it with ``end_span``."""
+        if not self.enabled:
+            return None
+        return self._new_span(name, kind, attributes, parent, remote_parent)
+
+    def end_span(self, span: Optional[Span]) -> None:
+        if span is None or span.end_ns is not None:
+            return
+        span.end_ns = time.time_ns()
+        if span.sampled and self.exporter is not None:
+            self.exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL,
+             attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Span]]:
+        """Run the block inside a child span of the current span."""
+        if not self.enabled:
+            yield None
+            return
+        span = self._new_span(name, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+
+tracer = Tracer()
+
+
+def current_span() -> Optional[Span]:
+    """Return the active span, if any."""
+    return _current_span.get()
+
+
+def inject_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Add the ``traceparent`` of the active span to outgoing HTTP headers."""
+    headers = dict(headers or {})
+    span = _current_span.get()
+    if span is not None:
+        headers[TRACEPARENT_HEADER] = span.traceparent()
+    return headers
+
+
+def instrument_engine(engine, max_statement_length: int = 1000) -> None:
+    """Record one client span per SQL statement executed through ``engine``."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # Statements are only traced as part of an existing request or job trace
+        span = tracer.start_span("db.query", kind=SPAN_KIND_CLIENT) if _current_span.get() else None
+        if span is not None:
+            span.set_attribute("db.system", "postgresql")
+            span.set_attribute("db.statement", statement[:max_statement_length])
+            if executemany:
+                span.set_attribute("db.executemany", True)
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("trace_spans")
+        if spans:
+            span = spans.pop()
+            if span is not None:
+                span.set_attribute("db.rowcount", cursor.rowcount)
+            tracer.end_span(span)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        spans = conn.info.get("trace_spans") if conn is not None else None
+        if spans:
+            span = spans.pop()
+            if span is not None:
+                span.record_exception(exception_context.original_exception)
+            tracer.end_span(span)
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span per HTTP request.
+    The span ends when the response body is complete, so background tasks
+    that run afterwards show up as separate child spans instead of inflating it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        remote_parent = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER.encode():
+                remote_parent = value.decode("latin-1")
+                break
+
+        method = scope["method"]
+        span = tracer.start_span(
+            f"HTTP {method}",
+            kind=SPAN_KIND_SERVER,
+            attributes={"http.method": method, "http.target": scope.get("path", "")},
+            remote_parent=remote_parent
+        )
+
+        def finish(status_code: Optional[int] = None):
+            if span is None or span.end_ns is not None:
+                return
+            route = getattr(scope.get("route"), "path", None) or _route_path(scope)
+            if route:
+                span.name = f"HTTP {method} {route}"
+                span.set_attribute("http.route", route)
+            if status_code is not None:
+                span.set_attribute("http.status_code", status_code)
+                if status_code >= 500:
+                    span.status_code = STATUS_CODE_ERROR
+            tracer.end_span(span)
+
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish(status_code)
+
+        token = _current_span.set(span)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            if span is not None and span.end_ns is None:
+                span.record_exception(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            finish(status_code or 500)
+
+
+def _route_path(scope) -> Optional[str]:
+    endpoint = scope.get("endpoint")
+    for route in getattr(scope.get("app"), "routes", []):
+        if endpoint is not None and getattr(route, "endpoint", None) is endpoint:
+            return route.path
+    return None
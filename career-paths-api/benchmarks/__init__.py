@@ -0,0 +1,10 @@
+"""
+Load-test harness for the Career Paths API.
+
+Runs the real application (uvicorn, local PostgreSQL) with the AI mock service
+mounted in-process with no simulated latency, drives scripted async scenarios
+against it and writes machine-readable results that can be compared between runs.
+
+Usage (from the career-paths-api directory):
+    python -m benchmarks --employees 200 --concurrency 20
+"""
@@ -0,0 +1,180 @@
+"""
+Building blocks of the load-test harness: in-process server, SQL query
+counting per endpoint, and client-side latency recording.
+"""
+import asyncio
+import math
+import socket
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+import httpx
+import uvicorn
+from sqlalchemy import event
+
+_request_queries: ContextVar[Optional[dict]] = ContextVar("benchmark_request_queries", default=None)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def _route_label(scope) -> str:
+    endpoint = scope.get("endpoint")
+    for route in getattr(scope.get("app"), "routes", []):
+        if endpoint is not None and getattr(route, "endpoint", None) is endpoint:
+            return f"{scope['method']} {route.path}"
+    return f"{scope['method']} unmatched"
+
+
+class QueryCounter:
+    """
+    Counts SQL statements per endpoint.
+
+    Statements executed before the response body is sent are charged to the
+    request; statements from background tasks started by the request (AI
+    processing) are counted separately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: Dict[str, Dict[str, int]] = {}
+
+    def install(self, engine) -> None:
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            counts = _request_queries.get()
+            if counts is not None:
+                counts[counts["phase"]] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.totals = {}
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {label: dict(values) for label, values in self.totals.items()}
+
+    def middleware(self, app):
+        """Wrap an ASGI app so every HTTP request gets its own counter."""
+        async def counting_app(scope, receive, send):
+            if scope["type"] != "http":
+                await app(scope, receive, send)
+                return
+            counts = {"phase": "request", "request": 0, "background": 0}
+            token = _request_queries.set(counts)
+
+            async def send_wrapper(message):
+                await send(message)
+                if message["type"] == "http.response.body" and not message.get("more_body", False):
+                    counts["phase"] = "background"
+
+            try:
+                await app(scope, receive, send_wrapper)
+            finally:
+                _request_queries.reset(token)
+                self._record(_route_label(scope), counts)
+
+        return counting_app
+
+    def _record(self, label: str, counts: dict) -> None:
+        with self._lock:
+            totals = self.totals.setdefault(label, {"requests": 0, "queries": 0, "background_queries": 0})
+            totals["requests"] += 1
+            totals["queries"] += counts["request"]
+            totals["background_queries"] += counts["background"]
+
+
+class ServerThread:
+    """Runs uvicorn on a free local port in a background thread with its own event loop."""
+
+    def __init__(self, app, host: str = "127.0.0.1"):
+        self.host = host
+        self.port = _free_port(host)
+        config = uvicorn.Config(app, host=host, port=self.port, log_level="warning", access_log=False,
+                                lifespan="on")
+        self.server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self.server.run, name="benchmark-server", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout: float = 30.0) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Benchmark server did not start")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self._thread.join(timeout=30.0)
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class Recorder:
+    """Client-side latencies and errors per endpoint label for one scenario."""
+
+    def __init__(self, client: httpx.AsyncClient, concurrency: int):
+        self.client = client
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(self, label: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """Send one request, recording its latency under ``label`` (e.g. ``GET /api/v1/x/{id}``)."""
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                response = None
+            elapsed = time.perf_counter() - start
+        self.latencies.setdefault(label, []).append(elapsed)
+        if response is None or response.status_code >= 400:
+            self.errors[label] = self.errors.get(label, 0) + 1
+        return response
+
+    def summary(self, duration: float, queries: Dict[str, Dict[str, int]]) -> dict:
+        endpoints = {}
+        for label, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            counted = queries.get(label, {})
+            requests = counted.get("requests") or 0
+            endpoints[label] = {
+                "requests": len(values),
+                "errors": self.errors.get(label, 0),
+                "rps": round(len(values) / duration, 2) if duration else 0.0,
+                "latency_ms": {
+                    "mean": round(sum(values) / len(values) * 1000, 2),
+                    "p50": round(percentile(values, 0.50) * 1000, 2),
+                    "p95": round(percentile(values, 0.95) * 1000, 2),
+                    "p99": round(percentile(values, 0.99) * 1000, 2),
+                    "max": round(values[-1] * 1000, 2),
+                },
+                "db_queries_per_request": round(counted.get("queries", 0) / requests, 2) if requests else None,
+                "background_db_queries_per_request": (
+                    round(counted.get("background_queries", 0) / requests, 2) if requests else None
+                ),
+            }
+        total = sum(len(values) for values in self.latencies.values())
+        return {
+            "duration_seconds": round(duration, 3),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "rps": round(total / duration, 2) if duration else 0.0,
+            "endpoints": endpoints,
+        }
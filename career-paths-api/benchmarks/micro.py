@@ -0,0 +1,346 @@
+"""
+Micro-benchmarks of hot Python paths with a committed baseline.
+
+Each case is timed with ``timeit`` (auto-ranged iterations, several rounds) and
+its fastest time per call is compared with ``benchmarks/baseline.json``: the
+minimum is the least disturbed by other processes, so it is the most stable
+metric between runs. The run exits with status 1 when a case is slower than the
+baseline by more than the tolerance, so it can gate merges in CI.
+
+Usage (from the career-paths-api directory):
+    python -m benchmarks.micro                    # compare against the baseline
+    python -m benchmarks.micro --tolerance 0.3    # allow up to 30% slowdown
+    python -m benchmarks.micro --update           # record a new baseline
+
+Baselines are machine dependent: record them on the machine that runs the gate.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_ROUNDS = 15
+
+CASES: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    """Register a case: a setup function returning the callable to time."""
+    def decorator(setup):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+def _run_coroutine(coroutine):
+    """Run a coroutine that never suspends without the overhead of an event loop."""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("Coroutine suspended; it cannot be benchmarked synchronously")
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+COMPETENCIES = ["Liderazgo", "Comunicación", "Trabajo en Equipo", "Resolución de Problemas",
+                "Adaptabilidad", "Pensamiento Estratégico", "Orientación a Resultados"]
+RELATIONSHIPS = ["SELF", "MANAGER", "PEER", "PEER", "DIRECT_REPORT"]
+AI_PROFILE = {
+    "strengths": COMPETENCIES[:3],
+    "growth_areas": COMPETENCIES[3:5],
+    "hidden_talents": COMPETENCIES[5:],
+    "readiness_for_roles": [
+        {"role_name": role, "readiness_percentage": 70, "reasoning": "Fortalezas identificadas"}
+        for role in ("Gerente Regional", "Director de Operaciones", "Coordinador de Equipo")
+    ]
+}
+
+
+def _evaluations():
+    """Transient ORM evaluations of one employee/cycle, as loaded by trigger_ai_processing."""
+    from app.models import Competency, Evaluation, EvaluationDetail, EvaluatorRelationship
+
+    competencies = [Competency(id=uuid.uuid4(), name=name) for name in COMPETENCIES]
+    evaluations = []
+    for index, relationship in enumerate(RELATIONSHIPS):
+        evaluation = Evaluation(id=uuid.uuid4(), evaluator_relationship=EvaluatorRelationship(relationship))
+        evaluation.details = [
+            EvaluationDetail(competency=competency, score=4 + (index + position) % 7,
+                             comments="Demuestra buen desempeño en situaciones complejas")
+            for position, competency in enumerate(competencies)
+        ]
+        evaluations.append(evaluation)
+    return evaluations
+
+
+@case("evaluation_create_validation")
+def _evaluation_create_validation():
+    from app.schemas.evaluation import EvaluationCreate
+
+    user_id = str(uuid.uuid4())
+    payload = {
+        "evaluator_id": user_id,
+        "employee_id": user_id,
+        "cycle_id": str(uuid.uuid4()),
+        "evaluator_relationship": "SELF",
+        "answers": [
+            {"competency": name, "score": 8, "comments": "Demuestra buen desempeño"}
+            for name in COMPETENCIES
+        ],
+        "general_feedback": "Excelente trimestre"
+    }
+    return lambda: EvaluationCreate.model_validate(payload)
+
+
+@case("skills_assessment_from_assessment")
+def _skills_assessment_from_assessment():
+    from app.models import Assessment, ProcessingStatus
+    from app.schemas.assessment import SkillsAssessmentResponse
+
+    assessment = Assessment(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        cycle_id=uuid.uuid4(),
+        processing_status=ProcessingStatus.COMPLETED,
+        created_at=datetime(2026, 3, 31, 12, 0, 0),
+        ai_profile=AI_PROFILE
+    )
+    return lambda: SkillsAssessmentResponse.from_assessment(assessment)
+
+
+@case("career_path_summary_from_career_path")
+def _career_path_summary_from_career_path():
+    from app.models import CareerPath, CareerPathStatus
+    from app.schemas.career_path import CareerPathSummaryResponse
+
+    path = CareerPath(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        path_name="Liderazgo Regional",
+        recommended=True,
+        total_duration_months=18.0,
+        feasibility_score=0.82,
+        status=CareerPathStatus.GENERATED,
+        generated_at=datetime(2026, 3, 31, 12, 0, 0)
+    )
+    return lambda: CareerPathSummaryResponse.from_career_path(path)
+
+
+@case("build_evaluation_payload")
+def _build_evaluation_payload():
+    from app.routers.assessments import build_evaluation_payload
+
+    user_id, cycle_id = uuid.uuid4(), uuid.uuid4()
+    evaluations = _evaluations()
+    return lambda: build_evaluation_payload(user_id, cycle_id, evaluations)
+
+
+@case("ai_mock_assess_skills")
+def _ai_mock_assess_skills():
+    from ai_mock_service import SkillsAssessmentRequest, assess_skills
+    from app.routers.assessments import build_evaluation_payload
+
+    request = SkillsAssessmentRequest(**build_evaluation_payload(uuid.uuid4(), uuid.uuid4(), _evaluations()))
+    return lambda: _run_coroutine(assess_skills(request))
+
+
+def _fastapi_serialise(response_model, content):
+    """Encode ``content`` the way FastAPI does for a route with ``response_model``."""
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_response_field
+
+    field = create_response_field(name="response", type_=response_model)
+    return lambda: JSONResponse(_run_coroutine(serialize_response(field=field, response_content=content))).body
+
+
+def _assessment_row():
+    """Core row of get_skills_assessment, with ai_profile as the JSON text PostgreSQL returns."""
+    from collections import namedtuple
+
+    from app.models import ProcessingStatus
+
+    Row = namedtuple("Row", "assessment_id user_id cycle_id processing_status timestamp updated_at ai_profile")
+    return Row(uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), ProcessingStatus.COMPLETED,
+               datetime(2026, 3, 31, 12, 0, 0), datetime(2026, 3, 31, 12, 0, 0), json.dumps(AI_PROFILE))
+
+
+@case("skills_assessment_response_validated")
+def _skills_assessment_response_validated():
+    from app.models import Assessment, ProcessingStatus
+    from app.schemas.assessment import SkillsAssessmentResponse
+
+    row = _assessment_row()
+    assessment = Assessment(id=row.assessment_id, user_id=row.user_id, cycle_id=row.cycle_id,
+                            processing_status=ProcessingStatus.COMPLETED, created_at=row.timestamp,
+                            ai_profile=json.loads(row.ai_profile))
+    # Before the fast path: ORM object -> model -> FastAPI re-validation -> json.dumps
+    serialise = _fastapi_serialise(SkillsAssessmentResponse, SkillsAssessmentResponse.from_assessment(assessment))
+
+    def run():
+        json.loads(row.ai_profile)  # psycopg2 also decoded the JSONB column
+        return serialise()
+    return run
+
+
+@case("skills_assessment_response_from_row")
+def _skills_assessment_response_from_row():
+    from app.routers.assessments import skills_assessment_json
+
+    row = _assessment_row()
+    return lambda: skills_assessment_json(row)
+
+
+def _evaluation_rows(count: int = 100):
+    from collections import namedtuple
+
+    from app.models import EvaluationStatus, EvaluatorRelationship
+
+    Row = namedtuple("Row", "id employee_id evaluator_id cycle_id evaluator_relationship status created_at updated_at")
+    now = datetime(2026, 3, 31, 12, 0, 0)
+    return [
+        Row(uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), EvaluatorRelationship(RELATIONSHIPS[index % 5]),
+            EvaluationStatus.SUBMITTED, now, now)
+        for index in range(count)
+    ]
+
+
+@case("evaluation_list_validated")
+def _evaluation_list_validated():
+    from app.schemas.evaluation import EvaluationResponse
+
+    # Before the fast path: ORM-like objects validated and encoded by FastAPI
+    rows = _evaluation_rows()
+    return _fastapi_serialise(List[EvaluationResponse], rows)
+
+
+@case("evaluation_list_from_rows")
+def _evaluation_list_from_rows():
+    from app.responses import dumps
+
+    rows = _evaluation_rows()
+    return lambda: dumps([row._asdict() for row in rows])
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def measure(func: Callable[[], object], rounds: int = DEFAULT_ROUNDS, min_time: float = 0.3) -> dict:
+    """
+    Time ``func`` over ``rounds`` rounds of at least ``min_time`` seconds each (enough
+    iterations for microsecond-scale cases to average out timer resolution and
+    scheduling); times are seconds per call.
+    """
+    timer = timeit.Timer(func)
+    iterations, elapsed = timer.autorange()
+    if elapsed < min_time:
+        iterations = max(int(iterations * min_time / max(elapsed, 1e-9)), 1)
+    per_call = [total / iterations for total in timer.repeat(repeat=rounds, number=iterations)]
+    return {
+        "min": min(per_call),
+        "median": statistics.median(per_call),
+        "mean": statistics.fmean(per_call),
+        "stddev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": iterations,
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float,
+            metric: str = "min") -> List[dict]:
+    """
+    Compare each case with its baseline; cases without a baseline are reported as new.
+    A case is slower when ``metric`` exceeds the baseline by more than the tolerance.
+    """
+    rows = []
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        row = {"name": name, "current": stats[metric], "baseline": None, "change": None, "status": "new"}
+        if reference is not None:
+            row["baseline"] = reference[metric]
+            row["change"] = stats[metric] / reference[metric] - 1.0
+            row["status"] = "slower" if row["change"] > tolerance else "ok"
+        rows.append(row)
+    return rows
+
+
+def _load_baseline(path: Path) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))["benchmarks"]
+
+
+def _write_results(path: Path, results: Dict[str, dict]) -> None:
+    report = {
+        "machine_info": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "benchmarks": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _print_rows(rows: List[dict], tolerance: float) -> None:
+    header = f"{'case':<40}{'min us':>12}{'baseline us':>14}{'change':>10}  status"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        baseline = f"{row['baseline'] * 1e6:.2f}" if row["baseline"] is not None else "-"
+        change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+        print(f"{row['name']:<40}{row['current'] * 1e6:>12.2f}{baseline:>14}{change:>10}  {row['status']}")
+    print(f"\nTolerance: +{tolerance:.0%}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro",
+                                     description="Micro-benchmarks with a committed baseline.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown as a fraction of the baseline (default: 0.25)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Timing rounds per case")
+    parser.add_argument("-k", "--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--output", type=Path, default=None, help="Also write this run's results as JSON")
+    parser.add_argument("--update", action="store_true", help="Record this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, setup in CASES.items():
+        if args.filter in name:
+            results[name] = measure(setup(), rounds=args.rounds)
+
+    if args.output:
+        _write_results(args.output, results)
+    if args.update:
+        baseline = _load_baseline(args.baseline)
+        baseline.update(results)
+        _write_results(args.baseline, baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    rows = compare(results, _load_baseline(args.baseline), args.tolerance)
+    _print_rows(rows, args.tolerance)
+    slower = [row["name"] for row in rows if row["status"] == "slower"]
+    if slower:
+        print(f"Performance regression in: {', '.join(slower)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
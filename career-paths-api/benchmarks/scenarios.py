@@ -0,0 +1,193 @@
+"""
+Seed data and scripted scenarios modelled on an evaluation cycle deadline.
+"""
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.competency import Competency
+from app.models.evaluation_cycle import CycleStatus, EvaluationCycle
+from app.models.user import User
+from benchmarks.harness import Recorder
+
+API = "/api/v1"
+
+COMPETENCIES = [
+    "Liderazgo",
+    "Comunicación",
+    "Trabajo en Equipo",
+    "Resolución de Problemas",
+    "Adaptabilidad",
+]
+
+TEAM_SIZE = 8
+
+
+@dataclass
+class Dataset:
+    """Users and reference data created for a benchmark run."""
+    employees: List[UUID]
+    managers: List[UUID]
+    competencies: List[str] = field(default_factory=lambda: list(COMPETENCIES))
+
+    def manager_of(self, index: int) -> UUID:
+        return self.managers[index // TEAM_SIZE]
+
+
+def seed(db: Session, employees: int) -> Dataset:
+    """Create employees (in teams of ``TEAM_SIZE``), their managers and the competency catalog."""
+    db.add_all(Competency(name=name, description=f"Competencia {name}") for name in COMPETENCIES)
+    return seed_cohort(db, employees)
+
+
+def seed_cohort(db: Session, employees: int, prefix: str = "") -> Dataset:
+    """
+    Create employees (in teams of ``TEAM_SIZE``) and their managers; ``prefix`` keeps
+    the emails of each cohort apart. A fresh cohort has no assessments or career paths yet.
+    """
+    managers = [
+        User(
+            id=uuid.uuid4(),
+            email=f"{prefix}manager{i}@bench.sendos.com",
+            full_name=f"Manager {i}",
+            current_position="Gerente de Área",
+            department=f"Departamento {i % 10}",
+            years_experience="10"
+        )
+        for i in range((employees + TEAM_SIZE - 1) // TEAM_SIZE)
+    ]
+    staff = [
+        User(
+            id=uuid.uuid4(),
+            email=f"{prefix}employee{i}@bench.sendos.com",
+            full_name=f"Employee {i}",
+            current_position="Analista",
+            department=f"Departamento {(i // TEAM_SIZE) % 10}",
+            years_experience=str(1 + i % 15),
+            manager_id=managers[i // TEAM_SIZE].id
+        )
+        for i in range(employees)
+    ]
+    db.add_all(managers + staff)
+    db.commit()
+    return Dataset(employees=[user.id for user in staff], managers=[user.id for user in managers])
+
+
+def create_cycle(db: Session, name: str) -> UUID:
+    cycle = EvaluationCycle(
+        name=name,
+        start_date=datetime.utcnow() - timedelta(days=30),
+        end_date=datetime.utcnow(),
+        status=CycleStatus.ACTIVE
+    )
+    db.add(cycle)
+    db.commit()
+    return cycle.id
+
+
+def submissions(dataset: Dataset, cycle_id: UUID, rng: random.Random) -> List[dict]:
+    """
+    Every employee receives SELF, MANAGER and two PEER evaluations.
+    The order is shuffled so cycles complete at different points of the surge.
+    """
+    payloads = []
+    count = len(dataset.employees)
+    for index, employee_id in enumerate(dataset.employees):
+        evaluators: List[Tuple[UUID, str]] = [
+            (employee_id, "SELF"),
+            (dataset.manager_of(index), "MANAGER"),
+        ]
+        if count > 1:
+            evaluators.append((dataset.employees[(index + 1) % count], "PEER"))
+        if count > 2:
+            evaluators.append((dataset.employees[(index + 2) % count], "PEER"))
+        for evaluator_id, relationship in evaluators:
+            payloads.append({
+                "evaluator_id": str(evaluator_id),
+                "employee_id": str(employee_id),
+                "cycle_id": str(cycle_id),
+                "evaluator_relationship": relationship,
+                "answers": [
+                    {"competency": name, "score": rng.randint(4, 10), "comments": "Buen desempeño"}
+                    for name in dataset.competencies
+                ],
+                "general_feedback": "Evaluación generada por el benchmark"
+            })
+    rng.shuffle(payloads)
+    return payloads
+
+
+async def wait_for_pipeline(session_factory, cycle_id: UUID, expected: int, timeout: float) -> float:
+    """Wait until every employee of the cycle has a finished assessment; returns the seconds waited."""
+    start = time.perf_counter()
+    while True:
+        db = session_factory()
+        try:
+            finished = db.query(Assessment).filter(
+                Assessment.cycle_id == cycle_id,
+                Assessment.processing_status.in_([ProcessingStatus.COMPLETED, ProcessingStatus.FAILED])
+            ).count()
+            pending = db.query(Assessment).filter(
+                Assessment.cycle_id == cycle_id,
+                Assessment.processing_status.in_([ProcessingStatus.PENDING, ProcessingStatus.PROCESSING])
+            ).count()
+        finally:
+            db.close()
+        waited = time.perf_counter() - start
+        if finished >= expected and pending == 0:
+            return waited
+        if waited > timeout:
+            raise TimeoutError(f"Assessments still pending after {timeout}s ({finished}/{expected} finished)")
+        await asyncio.sleep(0.2)
+
+
+def check_career_paths_generated(session_factory, cycle_id: UUID, expected: int) -> None:
+    """Fail unless every assessment of the cycle had its career paths generated."""
+    db = session_factory()
+    try:
+        ready = db.query(Assessment).filter(
+            Assessment.cycle_id == cycle_id,
+            Assessment.career_paths_ready_at.isnot(None)
+        ).count()
+    finally:
+        db.close()
+    if ready < expected:
+        raise RuntimeError(f"Career paths generated for {ready}/{expected} assessments of the cycle")
+
+
+async def submission_surge(recorder: Recorder, payloads: List[dict]) -> None:
+    """All evaluations of a cycle submitted concurrently, as happens right before the deadline."""
+    await asyncio.gather(*(
+        recorder.request("POST /api/v1/evaluations/", "POST", f"{API}/evaluations/", json=payload)
+        for payload in payloads
+    ))
+
+
+async def dashboard_reads(recorder: Recorder, dataset: Dataset, rounds: int, rng: random.Random) -> None:
+    """Employees and managers refreshing their dashboards once results are out."""
+    requests = []
+    for _ in range(rounds):
+        for employee_id in dataset.employees:
+            requests.append(("GET /api/v1/skills-assessments/{user_id}", f"{API}/skills-assessments/{employee_id}"))
+            requests.append(("GET /api/v1/employees/{user_id}/profile", f"{API}/employees/{employee_id}/profile"))
+        for manager_id in dataset.managers:
+            requests.append(("GET /api/v1/teams/{manager_id}/summary", f"{API}/teams/{manager_id}/summary"))
+        requests.append(("GET /api/v1/evaluations/", f"{API}/evaluations/?limit=100"))
+    rng.shuffle(requests)
+    await asyncio.gather(*(recorder.request(label, "GET", url) for label, url in requests))
+
+
+async def career_path_first_views(recorder: Recorder, dataset: Dataset) -> None:
+    """First visit to the career paths page, which generates the paths synchronously."""
+    await asyncio.gather(*(
+        recorder.request("GET /api/v1/career-paths/{user_id}", "GET", f"{API}/career-paths/{employee_id}")
+        for employee_id in dataset.employees
+    ))
@@ -0,0 +1,405 @@
+"""
+Synthetic large-scale dataset generator.
+
+Builds on the sample data of init_db.py but generates production-sized data
+(e.g. 100k users and 50M evaluation details) for benchmarking and index tuning.
+Rows are produced lazily and streamed into PostgreSQL with COPY, so memory use
+stays flat regardless of the dataset size. The same seed always produces the
+same rows, including primary keys.
+
+Note: Database tables are created via Alembic migrations.
+Run 'alembic upgrade head' before executing this script.
+
+Usage:
+    python generate_dataset.py --users 100000 --cycles 4 --competencies 25 --evaluators 5 --truncate
+"""
+import argparse
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.competency_score import rebuild_competency_scores
+from app.models.user_hierarchy import rebuild_hierarchy
+from app.services.analytics import refresh_views
+from app.services import reference_data
+
+COMPETENCY_NAMES = [
+    "Liderazgo", "Comunicación", "Trabajo en Equipo", "Resolución de Problemas", "Adaptabilidad",
+    "Pensamiento Estratégico", "Innovación", "Orientación a Resultados", "Desarrollo de Personas",
+    "Gestión de Proyectos",
+]
+DEPARTMENT_NAMES = ["Operaciones", "Ventas", "Marketing", "Tecnología", "Finanzas", "Recursos Humanos", "Logística"]
+COMMENTS = [
+    "Demuestra un desempeño consistente",
+    "Supera las expectativas en situaciones complejas",
+    "Tiene oportunidades claras de mejora",
+    "Es un referente para el equipo",
+]
+# Score bias per relationship: self-evaluations tend to be lower, managers slightly higher
+RELATIONSHIP_BIAS = {"SELF": -1, "MANAGER": 1, "PEER": 0, "DIRECT_REPORT": 0}
+CYCLES_START = datetime(2024, 1, 1)
+
+COPY_COLUMNS = {
+    "users": "id, email, full_name, current_position, department, years_experience, manager_id, created_at, updated_at",
+    "competencies": "id, name, description, created_at, updated_at",
+    "evaluation_cycles": "id, name, start_date, end_date, status, created_at, updated_at",
+    "evaluations": "id, evaluator_id, employee_id, cycle_id, evaluator_relationship, general_feedback, "
+                   "status, created_at, updated_at",
+    "evaluation_details": "id, evaluation_id, competency_id, score, comments, created_at",
+}
+
+
+@dataclass
+class DatasetConfig:
+    """Size and shape of the generated dataset."""
+    users: int = 1000
+    departments: int = 10
+    team_size: int = 8
+    cycles: int = 4
+    competencies: int = 10
+    evaluators: int = 5  # Evaluations received per employee and cycle, including SELF
+    seed: int = 42
+
+
+def copy_value(value) -> str:
+    """Format a value for COPY text format."""
+    if value is None:
+        return "\\N"
+    text = str(value)
+    if any(char in text for char in "\\\t\n\r"):
+        text = text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    return text
+
+
+class DatasetGenerator:
+    """
+    Deterministic row generator. Each table is an iterator of COPY text lines.
+
+    Primary keys are a per-table UUID prefix (derived from the seed) plus the
+    row number, so related tables can compute foreign keys without keeping
+    previously generated rows in memory.
+    """
+
+    def __init__(self, config: DatasetConfig):
+        self.config = config
+        rng = random.Random(config.seed)
+        self._prefixes = {
+            table: str(uuid.UUID(int=rng.getrandbits(128), version=4))[:24]
+            for table in COPY_COLUMNS
+        }
+        self._department_size = -(-config.users // max(config.departments, 1))
+        self._evaluation_plan: Optional[List[Tuple[int, List[Tuple[int, str]]]]] = None
+
+    def row_id(self, table: str, number: int) -> str:
+        return f"{self._prefixes[table]}{number:012x}"
+
+    # ------------------------------------------------------------------------
+    # Organization structure
+    # ------------------------------------------------------------------------
+
+    def department_of(self, user: int) -> int:
+        return user // self._department_size
+
+    def _team_lead(self, user: int) -> int:
+        start = self.department_of(user) * self._department_size
+        return start + (user - start) // self.config.team_size * self.config.team_size
+
+    def manager_of(self, user: int) -> Optional[int]:
+        """Team members report to their team lead, team leads to the department head."""
+        lead = self._team_lead(user)
+        if user != lead:
+            return lead
+        head = self.department_of(user) * self._department_size
+        return head if user != head else None
+
+    def _team(self, user: int) -> range:
+        lead = self._team_lead(user)
+        end = min(lead + self.config.team_size, (self.department_of(user) + 1) * self._department_size,
+                  self.config.users)
+        return range(lead, end)
+
+    def evaluators_of(self, user: int) -> List[Tuple[int, str]]:
+        """SELF, MANAGER, then team mates as PEER (or reports as DIRECT_REPORT for team leads)."""
+        evaluators = [(user, "SELF")]
+        manager = self.manager_of(user)
+        if manager is not None:
+            evaluators.append((manager, "MANAGER"))
+        is_lead = user == self._team_lead(user)
+        team = self._team(user)
+        mates = [member for member in team if member != user and member != team.start] if not is_lead \
+            else [member for member in team if member != user]
+        # Rotate so evaluations spread evenly across the team
+        offset = (user - team.start) % len(mates) if mates else 0
+        mates = mates[offset:] + mates[:offset]
+        relationship = "DIRECT_REPORT" if is_lead else "PEER"
+        for mate in mates[:max(self.config.evaluators - len(evaluators), 0)]:
+            evaluators.append((mate, relationship))
+        return evaluators
+
+    def _plan(self) -> List[Tuple[int, List[Tuple[int, str]]]]:
+        if self._evaluation_plan is None:
+            self._evaluation_plan = [(user, self.evaluators_of(user)) for user in range(self.config.users)]
+        return self._evaluation_plan
+
+    def cycle_dates(self, cycle: int) -> Tuple[datetime, datetime]:
+        start = CYCLES_START + timedelta(days=91 * cycle)
+        return start, start + timedelta(days=90)
+
+    # ------------------------------------------------------------------------
+    # Tables
+    # ------------------------------------------------------------------------
+
+    def users(self) -> Iterator[str]:
+        rng = random.Random(self.config.seed + 1)
+        created = CYCLES_START.isoformat(sep=" ")
+        for user in range(self.config.users):
+            department = self.department_of(user)
+            if user == department * self._department_size:
+                position = "Director de Área"
+            elif user == self._team_lead(user):
+                position = "Líder de Equipo"
+            else:
+                position = "Analista"
+            name = f"{DEPARTMENT_NAMES[department % len(DEPARTMENT_NAMES)]} {department + 1:03d}"
+            manager = self.manager_of(user)
+            yield "\t".join((
+                self.row_id("users", user),
+                f"user{user:07d}@dataset.sendos.com",
+                f"Usuario {user:07d}",
+                position,
+                copy_value(name),
+                str(1 + int(rng.random() * 20)),
+                copy_value(self.row_id("users", manager) if manager is not None else None),
+                created,
+                created,
+            )) + "\n"
+
+    def competencies(self) -> Iterator[str]:
+        created = CYCLES_START.isoformat(sep=" ")
+        for number in range(self.config.competencies):
+            base = COMPETENCY_NAMES[number % len(COMPETENCY_NAMES)]
+            name = base if number < len(COMPETENCY_NAMES) else f"{base} {number // len(COMPETENCY_NAMES) + 1}"
+            yield "\t".join((
+                self.row_id("competencies", number),
+                copy_value(name),
+                copy_value(f"Competencia de {name}"),
+                created,
+                created,
+            )) + "\n"
+
+    def cycles(self) -> Iterator[str]:
+        for cycle in range(self.config.cycles):
+            start, end = self.cycle_dates(cycle)
+            status = "ACTIVE" if cycle == self.config.cycles - 1 else "CLOSED"
+            yield "\t".join((
+                self.row_id("evaluation_cycles", cycle),
+                f"{start.year}-Q{(start.month - 1) // 3 + 1}",
+                start.isoformat(sep=" "),
+                end.isoformat(sep=" "),
+                status,
+                start.isoformat(sep=" "),
+                end.isoformat(sep=" "),
+            )) + "\n"
+
+    def _evaluations(self) -> Iterator[Tuple[int, int, int, int, str]]:
+        """Yield (evaluation number, cycle, employee, evaluator, relationship) in a stable order."""
+        number = 0
+        plan = self._plan()
+        for cycle in range(self.config.cycles):
+            for employee, evaluators in plan:
+                for evaluator, relationship in evaluators:
+                    yield number, cycle, employee, evaluator, relationship
+                    number += 1
+
+    def _submission_times(self, cycle: int, rng: random.Random) -> List[str]:
+        """A pool of submission timestamps for the cycle, skewed towards the deadline."""
+        start, end = self.cycle_dates(cycle)
+        span = (end - start).total_seconds()
+        return [
+            (start + timedelta(seconds=span * (1 - rng.random() ** 3))).isoformat(sep=" ", timespec="seconds")
+            for _ in range(4096)
+        ]
+
+    def evaluations(self) -> Iterator[str]:
+        rng = random.Random(self.config.seed + 2)
+        times = [self._submission_times(cycle, rng) for cycle in range(self.config.cycles)]
+        for number, cycle, employee, evaluator, relationship in self._evaluations():
+            submitted = times[cycle][rng.getrandbits(12)]
+            yield "\t".join((
+                self.row_id("evaluations", number),
+                self.row_id("users", evaluator),
+                self.row_id("users", employee),
+                self.row_id("evaluation_cycles", cycle),
+                relationship,
+                "\\N",
+                "SUBMITTED",
+                submitted,
+                submitted,
+            )) + "\n"
+
+    def evaluation_details(self) -> Iterator[str]:
+        rng = random.Random(self.config.seed + 3)
+        competencies = [self.row_id("competencies", number) for number in range(self.config.competencies)]
+        comments = [copy_value(comment) for comment in COMMENTS]
+        detail_prefix = self._prefixes["evaluation_details"]
+        created = [self.cycle_dates(cycle)[1].isoformat(sep=" ") for cycle in range(self.config.cycles)]
+        # Noise in -2..2, weighted towards 0
+        noise = [-2, -1, -1, 0, 0, 0, 1, 1, 2, 0, 0, 1, -1, 0, 1, -1]
+        detail = 0
+        current_employee = None
+        skills: List[int] = []
+        for number, cycle, employee, evaluator, relationship in self._evaluations():
+            if employee != current_employee:
+                # Stable per-employee skill profile so evaluators broadly agree
+                profile = random.Random(self.config.seed * 1_000_003 + employee)
+                skills = [4 + int(profile.random() * 5) for _ in competencies]
+                current_employee = employee
+            evaluation_id = self.row_id("evaluations", number)
+            bias = RELATIONSHIP_BIAS[relationship]
+            for competency_id, skill in zip(competencies, skills):
+                score = min(max(skill + bias + noise[rng.getrandbits(4)], 1), 10)
+                bits = rng.getrandbits(5)
+                comment = comments[bits & 3] if bits < 4 else "\\N"
+                yield f"{detail_prefix}{detail:012x}\t{evaluation_id}\t{competency_id}\t{score}\t{comment}\t{created[cycle]}\n"
+                detail += 1
+
+    def row_counts(self) -> dict:
+        evaluations = sum(len(evaluators) for _, evaluators in self._plan()) * self.config.cycles
+        return {
+            "users": self.config.users,
+            "competencies": self.config.competencies,
+            "evaluation_cycles": self.config.cycles,
+            "evaluations": evaluations,
+            "evaluation_details": evaluations * self.config.competencies,
+        }
+
+
+class CopyStream:
+    """Minimal file-like object that feeds an iterator of lines to ``cursor.copy_expert``."""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = ""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            self.rows += 1
+            if 0 <= size <= length:
+                break
+        data = "".join(chunks)
+        if 0 <= size < len(data):
+            data, self._buffer = data[:size], data[size:]
+        else:
+            self._buffer = ""
+        return data
+
+
+def generate(database_url: str, config: DatasetConfig, truncate: bool = False) -> None:
+    """Stream every table into the database inside a single transaction."""
+    generator = DatasetGenerator(config)
+    engine = create_engine(database_url)
+    connection = engine.raw_connection()
+    tables = [
+        ("users", generator.users),
+        ("competencies", generator.competencies),
+        ("evaluation_cycles", generator.cycles),
+        ("evaluations", generator.evaluations),
+        ("evaluation_details", generator.evaluation_details),
+    ]
+    expected = generator.row_counts()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SET synchronous_commit = off")
+        if truncate:
+            cursor.execute("TRUNCATE users, competencies, evaluation_cycles CASCADE")
+            print("Tablas vaciadas (TRUNCATE ... CASCADE)")
+        started = time.perf_counter()
+        for table, rows in tables:
+            table_started = time.perf_counter()
+            stream = CopyStream(rows())
+            print(f"Cargando {table} ({expected[table]:,} filas)...", flush=True)
+            cursor.copy_expert(f"COPY {table} ({COPY_COLUMNS[table]}) FROM STDIN", stream, size=1 << 20)
+            elapsed = time.perf_counter() - table_started
+            print(f"   {stream.rows:,} filas en {elapsed:.1f}s ({stream.rows / max(elapsed, 1e-9):,.0f} filas/s)")
+        connection.commit()
+        print(f"\nDatos generados en {time.perf_counter() - started:.1f}s")
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    # COPY bypasses the ORM events that maintain the reporting hierarchy
+    hierarchy_started = time.perf_counter()
+    with engine.begin() as conn:
+        rebuild_hierarchy(conn)
+    print(f"Jerarquía de reporte reconstruida en {time.perf_counter() - hierarchy_started:.1f}s")
+
+    # ...and the per-employee competency score totals
+    scores_started = time.perf_counter()
+    with engine.begin() as conn:
+        rebuild_competency_scores(conn)
+    print(f"Totales de competency_scores calculados en {time.perf_counter() - scores_started:.1f}s")
+
+    # Refresh planner statistics so query plans reflect the new data
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in [table for table, _ in tables] + ["user_hierarchy", "competency_scores"]:
+            conn.exec_driver_sql(f"ANALYZE {table}")
+
+    # Analytics views now aggregate the new evaluations
+    views_started = time.perf_counter()
+    with Session(engine) as db:
+        refresh_views(db)
+    print(f"Vistas de analítica refrescadas en {time.perf_counter() - views_started:.1f}s")
+    engine.dispose()
+    # Workers reload users, cycles and competencies from the new data
+    reference_data.for_database(database_url).invalidate()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    defaults = DatasetConfig()
+    parser = argparse.ArgumentParser(description="Generate a synthetic large-scale dataset with COPY.")
+    parser.add_argument("--database-url", default=get_settings().DATABASE_URL,
+                        help="Target database (default: DATABASE_URL)")
+    parser.add_argument("--users", type=int, default=defaults.users, help="Number of users")
+    parser.add_argument("--departments", type=int, default=defaults.departments, help="Number of departments")
+    parser.add_argument("--team-size", type=int, default=defaults.team_size,
+                        help="Users per team, including the team lead")
+    parser.add_argument("--cycles", type=int, default=defaults.cycles, help="Quarterly evaluation cycles")
+    parser.add_argument("--competencies", type=int, default=defaults.competencies, help="Competencies in the catalog")
+    parser.add_argument("--evaluators", type=int, default=defaults.evaluators,
+                        help="Evaluations per employee and cycle, including SELF and MANAGER")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed (same seed, same rows)")
+    parser.add_argument("--truncate", action="store_true",
+                        help="Empty users, competencies, cycles and all dependent tables first")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    dataset_config = DatasetConfig(
+        users=args.users,
+        departments=args.departments,
+        team_size=args.team_size,
+        cycles=args.cycles,
+        competencies=args.competencies,
+        evaluators=args.evaluators,
+        seed=args.seed
+    )
+    counts = DatasetGenerator(dataset_config).row_counts()
+    print("Generando dataset sintético:")
+    for table_name, count in counts.items():
+        print(f"   {table_name}: {count:,}")
+    generate(args.database_url, dataset_config, truncate=args.truncate)
@@ -6,6 +6,7 @@ Note: Database tables are created via Alembic migrations.
 Run 'alembic upgrade head' before executing this script.
 """
 from app.database import SessionLocal
+from app.services.reference_data import reference_data
 from app.models.user import User
 from app.models.evaluation_cycle import EvaluationCycle, CycleStatus
 from app.models.competency import Competency
@@ -74,6 +75,12 @@ def init_db():
             users.append(user)
         
         db.flush()
+        
+        # Reporting lines: Pedro leads Carlos and Ana; Carlos leads María and Laura
+        maria, carlos, ana, pedro, laura = users
+        for user, manager in ((carlos, pedro), (ana, pedro), (maria, carlos), (laura, carlos)):
+            user.manager_id = manager.id
+        db.flush()
         print(f"Usuarios creados: {len(users)}")
         
         # 2. Create evaluation cycle
@@ -180,6 +187,7 @@ def init_db():
             db.add(detail)
         
         db.commit()
+        reference_data.invalidate()  # Workers reload the new users, cycles and competencies
         print(f"Evaluaciones 360° creadas para {users[0].full_name}")
         print("   - Auto-evaluación (SELF)")
         print("   - Evaluación de manager (MANAGER)")
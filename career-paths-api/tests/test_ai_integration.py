@@ -0,0 +1,71 @@
+"""
+Tests for storing the AI skills profile as returned by the AI service.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+import ai_mock_service
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_detail import EvaluationDetail
+from app.routers.assessments import trigger_ai_processing
+from app.services.ai_integration import ai_service, validate_skills_profile
+
+
+@pytest.fixture()
+def in_process_ai(monkeypatch):
+    """Route AI calls to the mock service in-process, without simulated latency or failures."""
+    monkeypatch.setattr(ai_service, "transport", httpx.ASGITransport(app=ai_mock_service.app))
+    monkeypatch.setattr(ai_service, "base_url", "http://ai-mock")
+    monkeypatch.setattr(ai_service, "simulate_latency", False)
+    monkeypatch.setattr(ai_service, "simulated_failure_rate", 0.0)
+
+
+class TestValidateSkillsProfile:
+    """Tests for the AI response check."""
+
+    def test_valid_profile_is_returned_unchanged(self):
+        """The exact bytes are kept, including formatting."""
+        # Arrange
+        content = b'{"strengths": ["Liderazgo"],  "readiness_for_roles": []}'
+
+        # Act / Assert
+        assert validate_skills_profile(content) is content
+
+    @pytest.mark.parametrize("content", [b"not json", b"[1, 2]", b'{"strengths": "Liderazgo"}'])
+    def test_invalid_profiles_are_rejected(self, content):
+        """Malformed JSON, non-objects and wrongly typed fields raise ValueError."""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            validate_skills_profile(content)
+
+
+class TestProfilePassthrough:
+    """The AI response is stored as JSONB without a Python round trip."""
+
+    def test_processing_stores_and_serves_ai_profile(self, client, db_session, in_process_ai,
+                                                    sample_users, sample_cycle, sample_competencies):
+        """The stored profile is the one returned by the AI service and is served by the API."""
+        # Arrange
+        employee = sample_users[0]
+        for evaluator, relationship in ((sample_users[0], EvaluatorRelationship.SELF),
+                                        (sample_users[1], EvaluatorRelationship.MANAGER)):
+            evaluation = Evaluation(evaluator_id=evaluator.id, employee_id=employee.id,
+                                    cycle_id=sample_cycle.id, evaluator_relationship=relationship)
+            evaluation.details = [EvaluationDetail(competency_id=competency.id, score=8)
+                                  for competency in sample_competencies]
+            db_session.add(evaluation)
+        db_session.commit()
+
+        # Act
+        asyncio.run(trigger_ai_processing(employee.id, sample_cycle.id, db_session))
+        response = client.get(f"/api/v1/skills-assessments/{employee.id}")
+
+        # Assert
+        assessment = db_session.query(Assessment).filter(Assessment.user_id == employee.id).one()
+        assert assessment.processing_status == ProcessingStatus.COMPLETED
+        assert isinstance(assessment.ai_profile["readiness_for_roles"], list)
+        assert response.status_code == 200
+        assert response.json()["ai_profile"] == assessment.ai_profile
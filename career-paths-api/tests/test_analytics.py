@@ -0,0 +1,107 @@
+"""
+Tests for the analytics materialized views and their endpoints.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_cycle import CycleStatus
+from app.models.evaluation_detail import EvaluationDetail
+from app.services.analytics import last_refreshed_at, refresh_due, refresh_views
+
+
+@pytest.fixture()
+def evaluations(db_session, sample_users, sample_cycle, sample_competencies):
+    """Two Tecnología employees evaluated by their manager, one Ventas self evaluation."""
+    employee, manager, peer = sample_users[:3]
+    leadership, communication = sample_competencies[:2]
+
+    def evaluation(evaluator, evaluatee, relationship, scores):
+        item = Evaluation(evaluator_id=evaluator.id, employee_id=evaluatee.id, cycle_id=sample_cycle.id,
+                          evaluator_relationship=relationship)
+        item.details = [EvaluationDetail(competency_id=competency.id, score=score) for competency, score in scores]
+        return item
+
+    employee.department = peer.department = "Tecnología"
+    manager.department = "Ventas"
+    db_session.add_all([
+        evaluation(manager, employee, EvaluatorRelationship.MANAGER, [(leadership, 8), (communication, 6)]),
+        evaluation(manager, peer, EvaluatorRelationship.MANAGER, [(leadership, 6)]),
+        evaluation(manager, manager, EvaluatorRelationship.SELF, [(leadership, 9)])
+    ])
+    db_session.commit()
+
+
+class TestAnalyticsViews:
+    """Refresh of the materialized views."""
+
+    def test_views_are_read_after_a_refresh(self, client, db_session, sample_cycle, evaluations):
+        """The heatmap only reflects the data as of the last refresh."""
+        # Arrange
+        before = client.get("/api/v1/analytics/competency-heatmap", params={"cycle_id": str(sample_cycle.id)})
+
+        # Act
+        durations = refresh_views(db_session)
+        response = client.get("/api/v1/analytics/competency-heatmap",
+                              params={"cycle_id": str(sample_cycle.id), "relationship": "MANAGER"})
+
+        # Assert
+        assert before.json()["cells"] == []
+        assert set(durations) == {"mv_competency_scores", "mv_department_participation"}
+        body = response.json()
+        assert body["refreshed_at"] is not None
+        assert body["cells"] == [
+            {"department": "Tecnología", "competency": "Comunicación",
+             "evaluator_relationship": "MANAGER", "answers": 1, "employees": 1, "average_score": 6.0},
+            {"department": "Tecnología", "competency": "Liderazgo",
+             "evaluator_relationship": "MANAGER", "answers": 2, "employees": 2, "average_score": 7.0}
+        ]
+
+    def test_department_participation(self, client, db_session, sample_cycle, evaluations):
+        """Departments report evaluated employees, evaluations and their average score."""
+        # Arrange
+        refresh_views(db_session)
+
+        # Act
+        response = client.get("/api/v1/analytics/departments", params={"cycle_id": str(sample_cycle.id)})
+
+        # Assert
+        assert response.status_code == 200
+        assert [
+            (item["department"], item["employees_evaluated"], item["evaluations"], item["average_score"])
+            for item in response.json()["departments"]
+        ] == [("Tecnología", 2, 2, 6.67), ("Ventas", 1, 1, 9.0)]
+
+    def test_refresh_is_due_after_interval_or_cycle_close(self, db_session, sample_cycle):
+        """Never refreshed or older than the interval is due; so is a cycle closed after the refresh."""
+        # Arrange
+        assert refresh_due(db_session, interval_seconds=3600)
+        refresh_views(db_session)
+        refreshed_at = last_refreshed_at(db_session)
+
+        # Act
+        fresh = refresh_due(db_session, interval_seconds=3600)
+        sample_cycle.status = CycleStatus.CLOSED
+        sample_cycle.updated_at = refreshed_at + timedelta(seconds=1)
+        db_session.commit()
+        after_close = refresh_due(db_session, interval_seconds=3600)
+
+        # Assert
+        assert not fresh
+        assert after_close
+        assert refreshed_at <= datetime.utcnow()
+
+    def test_manual_refresh_only_when_due(self, client, db_session, sample_cycle):
+        """POST /internal/analytics/refresh refreshes once; calling it again before it is due does nothing."""
+        # Act
+        first = client.post("/internal/analytics/refresh")
+        refreshed_at = last_refreshed_at(db_session)
+        second = client.post("/internal/analytics/refresh")
+
+        # Assert
+        assert first.status_code == 200
+        assert set(first.json()["refreshed"]) == {"mv_competency_scores", "mv_department_participation"}
+        assert second.status_code == 200
+        assert second.json() == {"refreshed": {}}
+        assert last_refreshed_at(db_session) == refreshed_at
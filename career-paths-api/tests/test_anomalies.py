@@ -0,0 +1,156 @@
+"""
+Tests for the anomaly detection job and the cycle anomalies endpoint.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models.anomaly import AnomalyReason, EvaluationAnomaly
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_detail import EvaluationDetail
+from app.models.user import User
+from app.services.anomalies import detect_anomalies
+
+
+@pytest.fixture()
+def evaluations(db_session, sample_cycle, sample_competencies):
+    """
+    A cycle with a straight-lined self evaluation, an outlier peer and two peers
+    inflating each other's scores. Returns the evaluations by (evaluator, employee) names.
+    """
+    users = {name: User(id=uuid4(), email=f"{name}@sendos.com", full_name=name.title())
+             for name in ("target", "ana", "beto", "carla", "dario", "ximena", "yago")}
+    db_session.add_all(users.values())
+    db_session.commit()
+
+    items = {}
+    for evaluator, employee, relationship, scores in [
+        ("target", "target", EvaluatorRelationship.SELF, [5, 5, 5]),
+        ("ana", "target", EvaluatorRelationship.PEER, [7, 8, 7]),
+        ("beto", "target", EvaluatorRelationship.PEER, [8, 7, 8]),
+        ("carla", "target", EvaluatorRelationship.MANAGER, [7, 7, 8]),
+        ("dario", "target", EvaluatorRelationship.PEER, [2, 1, 2]),
+        ("ximena", "yago", EvaluatorRelationship.PEER, [10, 9, 10]),
+        ("yago", "ximena", EvaluatorRelationship.PEER, [9, 10, 10]),
+        ("ana", "ximena", EvaluatorRelationship.PEER, [5, 6, 5]),
+        ("beto", "ximena", EvaluatorRelationship.PEER, [6, 5, 5]),
+        ("ana", "yago", EvaluatorRelationship.PEER, [5, 5, 6]),
+        ("beto", "yago", EvaluatorRelationship.PEER, [6, 6, 5]),
+    ]:
+        evaluation = Evaluation(evaluator_id=users[evaluator].id, employee_id=users[employee].id,
+                                cycle_id=sample_cycle.id, evaluator_relationship=relationship)
+        evaluation.details = [EvaluationDetail(competency_id=competency.id, score=score)
+                              for competency, score in zip(sample_competencies, scores)]
+        items[(evaluator, employee)] = evaluation
+    db_session.add_all(items.values())
+    db_session.commit()
+    return items
+
+
+def _flags(client, cycle_id, **params):
+    """Every flag of a cycle as (evaluation_id, reason), following next_cursor."""
+    flags, cursor = [], None
+    while True:
+        response = client.get(f"/api/v1/cycles/{cycle_id}/anomalies",
+                              params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.json()
+        flags.extend((item["evaluation_id"], item["reason"]) for item in body["anomalies"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return flags
+
+
+class TestDetectAnomalies:
+    """Tests for the detection rules."""
+
+    def test_rules_flag_the_suspicious_evaluations(self, db_session, sample_cycle, evaluations):
+        """Each rule flags its evaluation and leaves the consistent raters alone."""
+        # Act
+        first_run = detect_anomalies(db_session.connection(), sample_cycle.id)
+        # Running again replaces the flags instead of adding to them
+        counts = detect_anomalies(db_session.connection(), sample_cycle.id)
+        flagged = {}
+        for row in db_session.execute(
+            select(EvaluationAnomaly).where(EvaluationAnomaly.cycle_id == sample_cycle.id)
+        ).scalars():
+            flagged.setdefault(row.reason, {})[row.evaluation_id] = row.details
+
+        # Assert
+        assert counts == first_run
+        assert counts[AnomalyReason.STRAIGHT_LINING] == 1
+        assert flagged[AnomalyReason.STRAIGHT_LINING] == {evaluations[("target", "target")].id: {"score": 5, "answers": 3}}
+        reciprocal = flagged[AnomalyReason.RECIPROCAL_INFLATION]
+        assert set(reciprocal) == {evaluations[("ximena", "yago")].id, evaluations[("yago", "ximena")].id}
+        assert reciprocal[evaluations[("ximena", "yago")].id]["counterpart_evaluation_id"] == \
+            str(evaluations[("yago", "ximena")].id)
+        outliers = flagged[AnomalyReason.OUTLIER]
+        assert evaluations[("dario", "target")].id in outliers
+        assert outliers[evaluations[("dario", "target")].id]["mean_z"] < -2
+        assert not any(evaluations[("ana", "target")].id in flags for flags in flagged.values())
+
+    def test_reciprocal_inflation_against_non_peer_raters(self, db_session, sample_cycle, sample_competencies):
+        """Peers inflating each other are flagged when their only other raters are managers and reports."""
+        # Arrange
+        users = {name: User(id=uuid4(), email=f"{name}@sendos.com", full_name=name.title())
+                 for name in ("ximena", "yago", "jefa", "reporte")}
+        db_session.add_all(users.values())
+        db_session.commit()
+        items = {}
+        for evaluator, employee, relationship, scores in [
+            ("ximena", "yago", EvaluatorRelationship.PEER, [10, 9, 10]),
+            ("yago", "ximena", EvaluatorRelationship.PEER, [9, 10, 10]),
+            ("jefa", "ximena", EvaluatorRelationship.MANAGER, [4, 5, 4]),
+            ("jefa", "yago", EvaluatorRelationship.MANAGER, [5, 4, 5]),
+            ("reporte", "ximena", EvaluatorRelationship.DIRECT_REPORT, [5, 4, 5]),
+            ("reporte", "yago", EvaluatorRelationship.DIRECT_REPORT, [4, 5, 4]),
+        ]:
+            evaluation = Evaluation(evaluator_id=users[evaluator].id, employee_id=users[employee].id,
+                                    cycle_id=sample_cycle.id, evaluator_relationship=relationship)
+            evaluation.details = [EvaluationDetail(competency_id=competency.id, score=score)
+                                  for competency, score in zip(sample_competencies, scores)]
+            items[(evaluator, employee)] = evaluation
+        db_session.add_all(items.values())
+        db_session.commit()
+
+        # Act
+        detect_anomalies(db_session.connection(), sample_cycle.id)
+        reciprocal = db_session.execute(
+            select(EvaluationAnomaly.evaluation_id).where(
+                EvaluationAnomaly.cycle_id == sample_cycle.id,
+                EvaluationAnomaly.reason == AnomalyReason.RECIPROCAL_INFLATION
+            )
+        ).scalars().all()
+
+        # Assert
+        assert set(reciprocal) == {items[("ximena", "yago")].id, items[("yago", "ximena")].id}
+
+
+class TestCycleAnomalies:
+    """Tests for GET /cycles/{cycle_id}/anomalies."""
+
+    def test_pages_follow_the_cursor(self, client, db_session, sample_cycle, evaluations):
+        """Walking one-flag pages returns every flag once, in the same order as one big page."""
+        # Arrange
+        detect_anomalies(db_session.connection(), sample_cycle.id)
+
+        # Act
+        paged = _flags(client, sample_cycle.id, limit=1)
+        single = _flags(client, sample_cycle.id, limit=500)
+        outliers = _flags(client, sample_cycle.id, limit=1, reason="OUTLIER")
+
+        # Assert
+        assert paged == single
+        assert len(set(paged)) == len(paged) >= 4
+        assert outliers == [flag for flag in single if flag[1] == "OUTLIER"]
+
+    def test_invalid_cursor_and_unknown_cycle(self, client, sample_cycle):
+        """A malformed cursor is a 422 and an unknown cycle a 404."""
+        # Act
+        invalid = client.get(f"/api/v1/cycles/{sample_cycle.id}/anomalies", params={"cursor": "nope"})
+        unknown = client.get(f"/api/v1/cycles/{uuid4()}/anomalies")
+
+        # Assert
+        assert invalid.status_code == 422
+        assert unknown.status_code == 404
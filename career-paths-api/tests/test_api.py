@@ -165,6 +165,80 @@ class TestCareerPaths:
         assert response.status_code == 404
 
 
+class TestPipelineLatency:
+    """Tests for the /pipeline/latency endpoint."""
+    
+    def test_pipeline_latency_empty(self, client):
+        """Without processed assessments the report is empty."""
+        # Act
+        response = client.get("/api/v1/pipeline/latency")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"stages": [], "cycles": []}
+    
+    def test_pipeline_latency_reports_stages(self, client, db_session, sample_users, sample_cycle):
+        """Stage percentiles are computed from persisted timestamps."""
+        # Arrange
+        from datetime import timedelta
+        from app.models.assessment import Assessment, ProcessingStatus
+        
+        submitted = datetime(2026, 3, 1, 12, 0, 0)
+        assessment = Assessment(
+            user_id=sample_users[0].id,
+            cycle_id=sample_cycle.id,
+            processing_status=ProcessingStatus.COMPLETED,
+            last_evaluation_submitted_at=submitted,
+            completion_detected_at=submitted + timedelta(seconds=1),
+            queued_at=submitted + timedelta(seconds=1),
+            processing_started_at=submitted + timedelta(seconds=2),
+            ai_call_started_at=submitted + timedelta(seconds=2),
+            ai_call_completed_at=submitted + timedelta(seconds=6),
+            processing_completed_at=submitted + timedelta(seconds=7)
+        )
+        db_session.add(assessment)
+        db_session.commit()
+        
+        # Act
+        response = client.get(f"/api/v1/pipeline/latency?cycle_id={sample_cycle.id}")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        stages = {stage["stage"]: stage for stage in data["stages"]}
+        assert stages["ai_call"]["p50"] == 4.0
+        assert stages["end_to_end"]["p99"] == 7.0
+        assert "career_paths" not in stages
+        assert data["cycles"][0]["cycle_id"] == str(sample_cycle.id)
+    
+    def test_pipeline_latency_end_to_end_includes_career_paths(self, client, db_session, sample_users, sample_cycle):
+        """Once career paths are ready, end_to_end runs until then."""
+        # Arrange
+        from datetime import timedelta
+        from app.models.assessment import Assessment, ProcessingStatus
+        
+        submitted = datetime(2026, 3, 1, 12, 0, 0)
+        assessment = Assessment(
+            user_id=sample_users[0].id,
+            cycle_id=sample_cycle.id,
+            processing_status=ProcessingStatus.COMPLETED,
+            last_evaluation_submitted_at=submitted,
+            processing_completed_at=submitted + timedelta(seconds=7),
+            career_paths_ready_at=submitted + timedelta(seconds=12)
+        )
+        db_session.add(assessment)
+        db_session.commit()
+        
+        # Act
+        response = client.get(f"/api/v1/pipeline/latency?cycle_id={sample_cycle.id}")
+        
+        # Assert
+        assert response.status_code == 200
+        stages = {stage["stage"]: stage for stage in response.json()["stages"]}
+        assert stages["career_paths"]["p50"] == 5.0
+        assert stages["end_to_end"]["p50"] == 12.0
+
+
 class TestIntegration:
     """
     Integration tests for complete flow (require DB and AI Mock Service).
@@ -0,0 +1,94 @@
+"""
+Tests for the :batchGet endpoints.
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.config import get_settings
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.evaluation_cycle import CycleStatus, EvaluationCycle
+
+
+class TestSkillsAssessmentsBatchGet:
+    """Tests for POST /skills-assessments:batchGet."""
+
+    def test_latest_assessment_per_user_in_one_query(self, client, db_session, sample_users, sample_cycle,
+                                                     sql_statements):
+        """Each user gets their newest completed assessment; the rest are reported missing."""
+        # Arrange
+        now = datetime.utcnow()
+        previous_cycle = EvaluationCycle(name="Q4 2025", start_date=now - timedelta(days=120),
+                                         end_date=now - timedelta(days=60), status=CycleStatus.CLOSED)
+        db_session.add(previous_cycle)
+        db_session.flush()
+        older, newer, other = (
+            Assessment(user_id=sample_users[0].id, cycle_id=previous_cycle.id, created_at=now - timedelta(days=30),
+                       processing_status=ProcessingStatus.COMPLETED, ai_profile={"strengths": ["Antigua"]}),
+            Assessment(user_id=sample_users[0].id, cycle_id=sample_cycle.id, created_at=now,
+                       processing_status=ProcessingStatus.COMPLETED, ai_profile={"strengths": ["Reciente"]}),
+            Assessment(user_id=sample_users[1].id, cycle_id=sample_cycle.id, created_at=now,
+                       processing_status=ProcessingStatus.FAILED)
+        )
+        db_session.add_all([older, newer, other])
+        db_session.commit()
+        unknown = uuid4()
+        user_ids = [str(sample_users[0].id), str(sample_users[1].id), str(unknown), str(sample_users[0].id)]
+        selects = sql_statements("SELECT")
+
+        # Act
+        response = client.post("/api/v1/skills-assessments:batchGet", json={"user_ids": user_ids})
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["user_id"] for item in body["skills_assessments"]] == [user_ids[0]]
+        assert body["skills_assessments"][0]["ai_profile"] == {"strengths": ["Reciente"]}
+        assert body["missing_user_ids"] == [user_ids[1], user_ids[2]]
+        assert len(selects) == 1
+
+    def test_batch_size_is_limited(self, client, monkeypatch):
+        """Requests over BATCH_GET_MAX_USERS, or without IDs, are rejected."""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "BATCH_GET_MAX_USERS", 2)
+
+        # Act
+        too_many = client.post("/api/v1/skills-assessments:batchGet",
+                               json={"user_ids": [str(uuid4()) for _ in range(3)]})
+        empty = client.post("/api/v1/career-paths:batchGet", json={"user_ids": []})
+
+        # Assert
+        assert too_many.status_code == 422
+        assert empty.status_code == 422
+
+
+class TestCareerPathsBatchGet:
+    """Tests for POST /career-paths:batchGet."""
+
+    def test_paths_grouped_by_user(self, client, db_session, sample_users, sql_statements):
+        """Current paths come grouped per user, newest first; archived ones are left out."""
+        # Arrange
+        now = datetime.utcnow()
+        db_session.add_all([
+            CareerPath(user_id=sample_users[0].id, path_name="Liderazgo", total_duration_months=18.0,
+                       status=CareerPathStatus.GENERATED, generated_at=now - timedelta(hours=1)),
+            CareerPath(user_id=sample_users[0].id, path_name="Especialista", total_duration_months=12.0,
+                       status=CareerPathStatus.IN_PROGRESS, generated_at=now),
+            CareerPath(user_id=sample_users[1].id, path_name="Anterior", total_duration_months=6.0,
+                       status=CareerPathStatus.ARCHIVED, generated_at=now)
+        ])
+        db_session.commit()
+        user_ids = [str(sample_users[1].id), str(sample_users[0].id)]
+        selects = sql_statements("SELECT")
+
+        # Act
+        response = client.post("/api/v1/career-paths:batchGet", json={"user_ids": user_ids})
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["career_paths"]) == 1
+        assert body["career_paths"][0]["user_id"] == user_ids[1]
+        assert [path["path_name"] for path in body["career_paths"][0]["generated_paths"]] == ["Especialista", "Liderazgo"]
+        assert body["missing_user_ids"] == [user_ids[0]]
+        assert len(selects) == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the rater calibration engine.
+"""
+import numpy as np
+import pytest
+from sqlalchemy import select
+
+from app.models.calibration import CalibratedScore, CompetencyCalibration
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_detail import EvaluationDetail
+from app.services.calibration import RELATIONSHIPS, SELF, Answers, calibrate, calibrate_cycle
+
+PEER = RELATIONSHIPS.index(EvaluatorRelationship.PEER)
+
+
+def _answers(rows, users, competencies=1):
+    """Answers from (evaluator, employee, competency, relationship, score) tuples."""
+    evaluator, employee, competency, relationship, score = (np.array(column) for column in zip(*rows))
+    return Answers(ids=np.zeros(len(rows), dtype="V16"), evaluator=evaluator, employee=employee,
+                   competency=competency, relationship=relationship, score=score,
+                   users=users, competencies=competencies)
+
+
+class TestCalibrate:
+    """Tests for the vectorised computations."""
+
+    def test_harsh_and_lenient_raters_become_comparable(self):
+        """Two raters ranking the same employees alike get the same calibrated scores."""
+        # Arrange: rater 0 is harsh, rater 1 lenient, both rate employees 2-5 in the same order
+        rows = [(0, employee, 0, PEER, score) for employee, score in zip(range(2, 6), [2, 3, 4, 5])]
+        rows += [(1, employee, 0, PEER, score) for employee, score in zip(range(2, 6), [7, 8, 9, 10])]
+
+        # Act
+        result = calibrate(_answers(rows, users=6), min_ratings=3)
+
+        # Assert
+        np.testing.assert_allclose(result.z_score[:4], result.z_score[4:])
+        np.testing.assert_allclose(result.calibrated[:4], result.calibrated[4:])
+        assert result.calibrated.mean() == pytest.approx(6.0)
+
+    def test_raters_with_few_ratings_keep_raw_scores(self):
+        """Below min_ratings an evaluator's answers are not rescaled."""
+        # Arrange
+        rows = [(0, 1, 0, PEER, 3), (0, 2, 0, PEER, 9)]
+
+        # Act
+        result = calibrate(_answers(rows, users=3), min_ratings=5)
+
+        # Assert
+        np.testing.assert_allclose(result.calibrated, [3, 9])
+
+    def test_rater_agreement_and_self_delta(self):
+        """Raters that agree give an ICC of 1; self ratings above others give a positive delta."""
+        # Arrange: employees 2 and 3 rated by raters 0 and 1, who agree; both rate themselves 2 points up
+        rows = [
+            (0, 2, 0, PEER, 4), (1, 2, 0, PEER, 4), (2, 2, 0, SELF, 6),
+            (0, 3, 0, PEER, 8), (1, 3, 0, PEER, 8), (3, 3, 0, SELF, 10),
+        ]
+
+        # Act
+        result = calibrate(_answers(rows, users=4, competencies=2), min_ratings=5)
+
+        # Assert
+        assert result.answers.tolist() == [6, 0]
+        assert result.rater_agreement[0] == pytest.approx(1.0)
+        assert np.isnan(result.rater_agreement[1])
+        assert result.self_delta[0] == pytest.approx(2.0)
+        assert np.isnan(result.self_delta[1])
+
+
+class TestCalibrateCycle:
+    """Tests for the load / write round trip through PostgreSQL."""
+
+    def test_cycle_results_are_stored(self, db_session, sample_users, sample_cycle, sample_competencies):
+        """Every answer of the cycle gets a calibrated score and each competency its summary."""
+        # Arrange
+        employee, manager, peer = sample_users
+        leadership, communication = sample_competencies[:2]
+        for evaluator, relationship, scores in [
+            (employee, EvaluatorRelationship.SELF, [9, 7]),
+            (manager, EvaluatorRelationship.MANAGER, [6, 8]),
+            (peer, EvaluatorRelationship.PEER, [8, 4])
+        ]:
+            evaluation = Evaluation(evaluator_id=evaluator.id, employee_id=employee.id, cycle_id=sample_cycle.id,
+                                    evaluator_relationship=relationship)
+            evaluation.details = [EvaluationDetail(competency_id=competency.id, score=score)
+                                  for competency, score in zip([leadership, communication], scores)]
+            db_session.add(evaluation)
+        db_session.commit()
+
+        # Act
+        calibrate_cycle(db_session.connection(), sample_cycle.id, min_ratings=2)
+
+        # Assert
+        scores = {
+            (detail.competency_id, detail.score): calibrated
+            for detail, calibrated in db_session.execute(
+                select(EvaluationDetail, CalibratedScore).join(
+                    CalibratedScore, CalibratedScore.evaluation_detail_id == EvaluationDetail.id
+                )
+            ).all()
+        }
+        assert len(scores) == 6
+        assert all(item.cycle_id == sample_cycle.id for item in scores.values())
+        # The peer's 8 is their higher rating: above the cycle mean after calibration
+        assert scores[(leadership.id, 8)].z_score == pytest.approx(1.0)
+        assert scores[(leadership.id, 8)].calibrated_score > 7
+        summaries = {
+            item.competency_id: item
+            for item in db_session.execute(select(CompetencyCalibration)).scalars()
+        }
+        assert set(summaries) == {leadership.id, communication.id}
+        assert summaries[leadership.id].answers == 3
+        assert summaries[leadership.id].self_delta == pytest.approx(2.0)
+        assert summaries[leadership.id].rater_agreement is None
@@ -0,0 +1,122 @@
+"""
+Tests for the competency_scores totals and the employee competency scores endpoint.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models.competency_score import CompetencyScore, rebuild_competency_scores
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_detail import EvaluationDetail
+from app.models.user import User
+
+
+def _totals(db_session):
+    """Every competency_scores row as a comparable tuple."""
+    return {
+        (row.employee_id, row.competency_id, row.evaluator_relationship,
+         row.answers, row.score_sum, row.score_sum_squares, row.score_min, row.score_max)
+        for row in db_session.execute(select(CompetencyScore)).scalars()
+    }
+
+
+@pytest.fixture()
+def evaluations(db_session, sample_users, sample_cycle, sample_competencies):
+    """Self evaluation plus manager and peer evaluations of the first user."""
+    employee, manager, peer = sample_users[:3]
+    leadership, communication = sample_competencies[:2]
+
+    def evaluation(evaluator, relationship, scores):
+        item = Evaluation(evaluator_id=evaluator.id, employee_id=employee.id, cycle_id=sample_cycle.id,
+                          evaluator_relationship=relationship)
+        item.details = [EvaluationDetail(competency_id=competency.id, score=score) for competency, score in scores]
+        return item
+
+    items = [
+        evaluation(employee, EvaluatorRelationship.SELF, [(leadership, 9), (communication, 7)]),
+        evaluation(manager, EvaluatorRelationship.MANAGER, [(leadership, 6), (communication, 8)]),
+        evaluation(peer, EvaluatorRelationship.PEER, [(leadership, 8)])
+    ]
+    db_session.add_all(items)
+    db_session.commit()
+    return items
+
+
+class TestCompetencyScoreMaintenance:
+    """Totals follow the answers in the same transaction."""
+
+    def test_submitted_evaluations_are_added(self, client, db_session, sample_users, sample_cycle,
+                                             sample_competencies):
+        """Answers submitted through the API accumulate count, sums and range per relationship."""
+        # Arrange
+        employee, manager, peer = sample_users
+        other = User(id=uuid4(), email="otro.par@sendos.com", full_name="Otro Par")
+        db_session.add(other)
+        db_session.commit()
+
+        def submit(evaluator, relationship, score):
+            return client.post("/api/v1/evaluations/", json={
+                "evaluator_id": str(evaluator.id),
+                "employee_id": str(employee.id),
+                "cycle_id": str(sample_cycle.id),
+                "evaluator_relationship": relationship,
+                "answers": [{"competency": "Liderazgo", "score": score}]
+            })
+
+        # Act
+        responses = [submit(peer, "PEER", 4), submit(other, "PEER", 10), submit(manager, "MANAGER", 7)]
+
+        # Assert
+        assert [response.status_code for response in responses] == [201, 201, 201]
+        peer_totals = db_session.execute(select(CompetencyScore).where(
+            CompetencyScore.evaluator_relationship == EvaluatorRelationship.PEER
+        )).scalar_one()
+        assert (peer_totals.answers, peer_totals.score_sum, peer_totals.score_sum_squares) == (2, 14, 116)
+        assert (peer_totals.score_min, peer_totals.score_max) == (4, 10)
+        incremental = _totals(db_session)
+        rebuild_competency_scores(db_session.connection())
+        assert _totals(db_session) == incremental
+
+    def test_deleted_and_edited_answers_are_recomputed(self, db_session, evaluations):
+        """Deleting an evaluation or editing a score leaves the same totals as a full rebuild."""
+        # Act
+        db_session.delete(evaluations[2])
+        evaluations[1].details[0].score = 2
+        db_session.commit()
+        maintained = _totals(db_session)
+        rebuild_competency_scores(db_session.connection())
+
+        # Assert
+        assert _totals(db_session) == maintained
+        assert not any(relationship == EvaluatorRelationship.PEER for _, _, relationship, *_ in maintained)
+        assert any(relationship == EvaluatorRelationship.MANAGER and score_sum == 2
+                   for _, _, relationship, _, score_sum, *_ in maintained)
+
+
+class TestEmployeeCompetencyScores:
+    """Tests for GET /employees/{user_id}/competency-scores."""
+
+    def test_statistics_and_self_gap(self, client, sample_users, sample_cycle, evaluations):
+        """Each competency reports per relationship, others combined and the self-vs-others gap."""
+        # Act
+        response = client.get(f"/api/v1/employees/{sample_users[0].id}/competency-scores")
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert body["cycle_id"] == str(sample_cycle.id)
+        leadership = next(item for item in body["competencies"] if item["competency"] == "Liderazgo")
+        assert leadership["relationships"]["SELF"] == {"answers": 1, "mean": 9.0, "stddev": 0.0, "min": 9, "max": 9}
+        assert leadership["others"] == {"answers": 2, "mean": 7.0, "stddev": 1.0, "min": 6, "max": 8}
+        assert leadership["self_gap"] == 2.0
+        communication = next(item for item in body["competencies"] if item["competency"] == "Comunicación")
+        assert communication["self_gap"] == -1.0
+
+    def test_employee_without_scores(self, client):
+        """An employee with no answers in the cycle is a 404."""
+        # Act
+        response = client.get(f"/api/v1/employees/{uuid4()}/competency-scores")
+
+        # Assert
+        assert response.status_code == 404
@@ -0,0 +1,123 @@
+"""
+Tests for response compression and precompressed cache variants.
+"""
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.services.compression import CompressionMiddleware, negotiate
+from app.services.response_cache import ResponseCache, cached_response
+
+LARGE_TEXT = "Participar en un programa de mentoría con un líder regional. " * 100
+
+
+@pytest.fixture()
+def compressed_client():
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(LARGE_TEXT, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(3):
+                yield LARGE_TEXT.encode("utf-8")
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500, content_types=["text/"])
+    return TestClient(app)
+
+
+def _request(headers):
+    scope = {"type": "http", "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()]}
+    return Request(scope)
+
+
+class TestNegotiate:
+    """Tests for Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize("header, supported, expected", [
+        ("gzip, deflate, br", ("br", "gzip"), "br"),
+        ("gzip, deflate, br", ("gzip",), "gzip"),
+        ("br;q=0, gzip;q=0.5", ("br", "gzip"), "gzip"),
+        ("gzip;q=0.2, br;q=0.8", ("br", "gzip"), "br"),
+        ("*", ("gzip",), "gzip"),
+        ("identity", ("br", "gzip"), None),
+        (None, ("gzip",), None),
+    ])
+    def test_negotiate(self, header, supported, expected):
+        """The preferred accepted encoding wins and q=0 refuses an encoding."""
+        # Act / Assert
+        assert negotiate(header, supported) == expected
+
+
+class TestCompressionMiddleware:
+    """Tests for the ASGI middleware."""
+
+    def test_large_response_is_compressed(self, compressed_client):
+        """Bodies over the minimum size are gzipped and their ETag becomes weak."""
+        # Act
+        response = compressed_client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert int(response.headers["content-length"]) < len(LARGE_TEXT)
+        assert response.text == LARGE_TEXT
+
+    def test_small_or_unaccepted_responses_are_not_compressed(self, compressed_client):
+        """Responses under the minimum size, or for clients without gzip, are sent as is."""
+        # Act
+        small = compressed_client.get("/small", headers={"Accept-Encoding": "gzip"})
+        identity = compressed_client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        # Assert
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert identity.text == LARGE_TEXT
+
+    def test_streaming_response_is_compressed_per_chunk(self, compressed_client):
+        """Streaming bodies are compressed incrementally into one valid gzip stream."""
+        # Act
+        with compressed_client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert zlib.decompress(raw, 31).decode("utf-8") == LARGE_TEXT * 3
+
+
+class TestPrecompressedCacheEntries:
+    """Tests for compressed variants of cached responses."""
+
+    def test_variant_is_compressed_once(self):
+        """Repeated hits reuse the stored variant with its own strong ETag."""
+        # Arrange
+        cache = ResponseCache(max_entries=10, ttl_seconds=30.0)
+        entry = cache.put("key", '"v1"', LARGE_TEXT.encode("utf-8"))
+        request = _request({"Accept-Encoding": "gzip"})
+
+        # Act
+        first = cached_response(request, entry)
+        second = cached_response(request, entry)
+        revalidated = cached_response(_request({"Accept-Encoding": "gzip", "If-None-Match": '"v1-gzip"'}), entry)
+
+        # Assert
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.headers["etag"] == '"v1-gzip"'
+        assert first.body is second.body is entry.variants["gzip"]
+        assert gzip.decompress(first.body) == entry.body
+        assert revalidated.status_code == 304
@@ -0,0 +1,129 @@
+"""
+Tests for the cycle progress endpoint.
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_cycle import CycleStatus, EvaluationCycle
+
+
+def _evaluation(evaluator, employee, cycle, relationship):
+    return Evaluation(evaluator_id=evaluator.id, employee_id=employee.id, cycle_id=cycle.id,
+                      evaluator_relationship=relationship)
+
+
+class TestCycleProgress:
+    """Tests for GET /cycles/{cycle_id}/progress."""
+
+    def test_progress_counts(self, client, db_session, sample_users, sample_cycle, sql_statements):
+        """Coverage, assessments and career paths are reported in one query."""
+        # Arrange
+        employee, manager, peer = sample_users[:3]
+        now = datetime.utcnow()
+        db_session.add_all([
+            _evaluation(employee, employee, sample_cycle, EvaluatorRelationship.SELF),
+            _evaluation(manager, employee, sample_cycle, EvaluatorRelationship.MANAGER),
+            _evaluation(peer, employee, sample_cycle, EvaluatorRelationship.PEER),
+            _evaluation(peer, peer, sample_cycle, EvaluatorRelationship.SELF),
+            Assessment(user_id=employee.id, cycle_id=sample_cycle.id, created_at=now - timedelta(hours=2),
+                       processing_status=ProcessingStatus.COMPLETED),
+            Assessment(user_id=peer.id, cycle_id=sample_cycle.id, created_at=now - timedelta(hours=2),
+                       processing_status=ProcessingStatus.PENDING),
+            CareerPath(user_id=employee.id, path_name="Liderazgo", total_duration_months=12.0,
+                       status=CareerPathStatus.IN_PROGRESS, generated_at=now - timedelta(hours=1), started_at=now),
+            CareerPath(user_id=employee.id, path_name="Especialista", total_duration_months=18.0,
+                       status=CareerPathStatus.GENERATED, generated_at=now - timedelta(hours=1)),
+            # Generated before the cycle's assessment: not part of this cycle
+            CareerPath(user_id=employee.id, path_name="Anterior", total_duration_months=6.0,
+                       status=CareerPathStatus.ARCHIVED, generated_at=now - timedelta(days=60))
+        ])
+        db_session.commit()
+        cycle_id = str(sample_cycle.id)
+        selects = sql_statements("SELECT")
+
+        # Act
+        response = client.get(f"/api/v1/cycles/{cycle_id}/progress")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "cycle_id": cycle_id,
+            "name": "Q1 2026",
+            "status": "ACTIVE",
+            "evaluated_employees": 2,
+            "coverage": {"SELF": 2, "MANAGER": 1, "PEER": 1, "DIRECT_REPORT": 0},
+            "complete_employees": 1,
+            "assessments": {"PENDING": 1, "PROCESSING": 0, "COMPLETED": 1, "FAILED": 0},
+            "career_paths_generated": 2,
+            "career_paths_accepted": 1
+        }
+        assert "etag" in response.headers
+        assert len(selects) == 1
+
+    def test_paths_from_a_later_assessment_belong_to_the_later_cycle(self, client, db_session, sample_users,
+                                                                      sample_cycle):
+        """A path generated after a newer assessment is not counted for the older cycle."""
+        # Arrange
+        now = datetime.utcnow()
+        previous = EvaluationCycle(name="Q4 2025", start_date=now - timedelta(days=120),
+                                   end_date=now - timedelta(days=60), status=CycleStatus.CLOSED)
+        db_session.add(previous)
+        db_session.flush()
+        db_session.add_all([
+            Assessment(user_id=sample_users[0].id, cycle_id=previous.id, created_at=now - timedelta(days=70),
+                       processing_status=ProcessingStatus.COMPLETED),
+            Assessment(user_id=sample_users[0].id, cycle_id=sample_cycle.id, created_at=now - timedelta(days=1),
+                       processing_status=ProcessingStatus.COMPLETED),
+            CareerPath(user_id=sample_users[0].id, path_name="Nuevo", total_duration_months=12.0,
+                       status=CareerPathStatus.GENERATED, generated_at=now)
+        ])
+        db_session.commit()
+
+        # Act
+        older = client.get(f"/api/v1/cycles/{previous.id}/progress").json()
+        current = client.get(f"/api/v1/cycles/{sample_cycle.id}/progress").json()
+
+        # Assert
+        assert older["career_paths_generated"] == 0
+        assert current["career_paths_generated"] == 1
+        assert older["evaluated_employees"] == 0
+
+    def test_regenerated_paths_are_counted_once(self, client, db_session, sample_users, sample_cycle):
+        """Paths archived by a regeneration within the cycle are not counted."""
+        # Arrange
+        now = datetime.utcnow()
+        employee = sample_users[0]
+        db_session.add_all([
+            Assessment(user_id=employee.id, cycle_id=sample_cycle.id, created_at=now - timedelta(hours=2),
+                       processing_status=ProcessingStatus.COMPLETED),
+            # First set, archived when the paths were generated again
+            CareerPath(user_id=employee.id, path_name="Liderazgo", total_duration_months=12.0,
+                       status=CareerPathStatus.ARCHIVED, generated_at=now - timedelta(hours=1)),
+            CareerPath(user_id=employee.id, path_name="Especialista", total_duration_months=18.0,
+                       status=CareerPathStatus.ARCHIVED, generated_at=now - timedelta(hours=1)),
+            # Regenerated set
+            CareerPath(user_id=employee.id, path_name="Liderazgo", total_duration_months=12.0,
+                       status=CareerPathStatus.IN_PROGRESS, generated_at=now, started_at=now),
+            CareerPath(user_id=employee.id, path_name="Especialista", total_duration_months=18.0,
+                       status=CareerPathStatus.GENERATED, generated_at=now)
+        ])
+        db_session.commit()
+
+        # Act
+        response = client.get(f"/api/v1/cycles/{sample_cycle.id}/progress")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["career_paths_generated"] == 2
+        assert response.json()["career_paths_accepted"] == 1
+
+    def test_unknown_cycle(self, client):
+        """A cycle that does not exist is a 404."""
+        # Act
+        response = client.get(f"/api/v1/cycles/{uuid4()}/progress")
+
+        # Assert
+        assert response.status_code == 404
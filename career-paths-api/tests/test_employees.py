@@ -0,0 +1,101 @@
+"""
+Tests for the combined employee profile endpoint.
+"""
+import pytest
+
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.career_path_step import CareerPathStep
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+
+
+@pytest.fixture()
+def employee_data(db_session, sample_users, sample_cycle):
+    employee, manager = sample_users[0], sample_users[1]
+    db_session.add_all([
+        Evaluation(evaluator_id=employee.id, employee_id=employee.id, cycle_id=sample_cycle.id,
+                   evaluator_relationship=EvaluatorRelationship.SELF),
+        Evaluation(evaluator_id=manager.id, employee_id=employee.id, cycle_id=sample_cycle.id,
+                   evaluator_relationship=EvaluatorRelationship.MANAGER),
+        Assessment(user_id=employee.id, cycle_id=sample_cycle.id, processing_status=ProcessingStatus.COMPLETED,
+                   ai_profile={"strengths": ["Liderazgo"]})
+    ])
+    path = CareerPath(user_id=employee.id, path_name="Liderazgo Regional", total_duration_months=18.0,
+                      status=CareerPathStatus.GENERATED)
+    path.steps = [
+        CareerPathStep(step_order=2, title="Paso 2", target_role="Director", duration_months=6),
+        CareerPathStep(step_order=1, title="Paso 1", target_role="Gerente", duration_months=12,
+                       required_competencies=["Liderazgo"])
+    ]
+    archived = CareerPath(user_id=employee.id, path_name="Anterior", total_duration_months=6.0,
+                          status=CareerPathStatus.ARCHIVED)
+    db_session.add_all([path, archived])
+    db_session.commit()
+    return {"user_id": str(employee.id), "cycle_id": str(sample_cycle.id), "path_id": str(path.id)}
+
+
+class TestEmployeeProfile:
+    """Tests for GET /employees/{user_id}/profile."""
+
+    def test_profile_is_built_by_one_query(self, client, employee_data, sql_statements):
+        """User, latest assessment, active paths with ordered steps and cycle coverage in one statement."""
+        # Arrange
+        selects = sql_statements("SELECT", "WITH")
+
+        # Act
+        response = client.get(f"/api/v1/employees/{employee_data['user_id']}/profile")
+
+        # Assert
+        assert response.status_code == 200
+        assert len(selects) == 1
+        profile = response.json()
+        assert profile["user"]["user_id"] == employee_data["user_id"]
+        assert profile["latest_assessment"]["ai_profile"] == {"strengths": ["Liderazgo"]}
+        assert profile["latest_assessment"]["processing_status"] == "COMPLETED"
+        assert [path["path_id"] for path in profile["career_paths"]] == [employee_data["path_id"]]
+        steps = profile["career_paths"][0]["steps"]
+        assert [step["target_role"] for step in steps] == ["Gerente", "Director"]
+        assert steps[1]["required_competencies"] == []
+        assert profile["cycle_coverage"] == [{
+            "cycle_id": employee_data["cycle_id"],
+            "name": "Q1 2026",
+            "status": "ACTIVE",
+            "evaluations": {"SELF": 1, "MANAGER": 1},
+            "complete": False
+        }]
+
+    def test_profile_is_cached_until_an_evaluation_arrives(self, client, db_session, employee_data,
+                                                         sample_users, sample_competencies, sql_statements):
+        """Repeat reads hit the cache; a new evaluation invalidates the profile."""
+        # Arrange
+        url = f"/api/v1/employees/{employee_data['user_id']}/profile"
+        first = client.get(url)
+        peer_id = str(sample_users[2].id)
+        selects = sql_statements("SELECT", "WITH")
+
+        # Act
+        conditional = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        queries_while_cached = len(selects)
+        created = client.post("/api/v1/evaluations/", json={
+            "evaluator_id": peer_id,
+            "employee_id": employee_data["user_id"],
+            "cycle_id": employee_data["cycle_id"],
+            "evaluator_relationship": "PEER",
+            "answers": [{"competency": "Liderazgo", "score": 8}]
+        })
+        after = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+        # Assert
+        assert conditional.status_code == 304
+        assert queries_while_cached == 0
+        assert created.status_code == 201
+        assert after.status_code == 200
+        assert after.json()["cycle_coverage"][0]["complete"] is True
+
+    def test_unknown_employee(self, client):
+        """An unknown user is a 404."""
+        # Act
+        response = client.get("/api/v1/employees/00000000-0000-0000-0000-000000000000/profile")
+
+        # Assert
+        assert response.status_code == 404
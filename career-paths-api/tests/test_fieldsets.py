@@ -0,0 +1,173 @@
+"""
+Tests for sparse fieldsets (?fields=) and expansions (?include=) on read endpoints.
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.fieldsets import parse_fields, parse_include
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.career_path_step import CareerPathStep
+from app.models.development_action import DevelopmentAction
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.models.evaluation_detail import EvaluationDetail
+
+
+@pytest.fixture()
+def evaluation(db_session, sample_users, sample_cycle, sample_competencies):
+    evaluation = Evaluation(
+        evaluator_id=sample_users[1].id,
+        employee_id=sample_users[0].id,
+        cycle_id=sample_cycle.id,
+        evaluator_relationship=EvaluatorRelationship.MANAGER,
+        general_feedback="Buen desempeño"
+    )
+    evaluation.details = [EvaluationDetail(competency_id=sample_competencies[0].id, score=8, comments="Sólido")]
+    db_session.add(evaluation)
+    db_session.commit()
+    return evaluation
+
+
+@pytest.fixture()
+def career_path(db_session, sample_users):
+    path = CareerPath(
+        user_id=sample_users[0].id,
+        path_name="Liderazgo Regional",
+        total_duration_months=18.0,
+        feasibility_score=0.8,
+        status=CareerPathStatus.GENERATED
+    )
+    step = CareerPathStep(step_order=1, title="Paso 1", target_role="Gerente", duration_months=12,
+                          required_competencies=["Liderazgo"])
+    step.development_actions = [DevelopmentAction(type="mentoring", description="Mentoría con un líder regional")]
+    path.steps = [step]
+    db_session.add(path)
+    db_session.commit()
+    return path
+
+
+class TestParseFields:
+    """Tests for the parameter parsing."""
+
+    def test_absent_or_empty_selects_everything(self):
+        """Without a selection all fields are returned in declared order."""
+        # Act / Assert
+        assert parse_fields(None, ["a", "b"]) == ["a", "b"]
+        assert parse_fields(" , ", ["a", "b"]) == ["a", "b"]
+        assert parse_include(None, ["x"]) == set()
+
+    def test_selection_keeps_declared_order(self):
+        """Requested fields are deduplicated and ordered as declared."""
+        # Act / Assert
+        assert parse_fields("c, a,a", ["a", "b", "c"]) == ["a", "c"]
+
+    def test_unknown_names_are_rejected(self):
+        """Unknown fields or expansions raise 400 listing the allowed names."""
+        # Act
+        with pytest.raises(HTTPException) as error:
+            parse_include("answers,foo", ["answers"])
+
+        # Assert
+        assert error.value.status_code == 400
+        assert "foo" in error.value.detail
+
+
+class TestEvaluationFieldsets:
+    """Fieldsets on the evaluation endpoints."""
+
+    def test_list_with_fields_and_answers(self, client, evaluation):
+        """Only the requested columns are returned, with answers embedded on request."""
+        # Act
+        response = client.get("/api/v1/evaluations/", params={"fields": "status,id", "include": "answers"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == [{
+            "id": str(evaluation.id),
+            "status": evaluation.status.value,
+            "answers": [{"competency": "Liderazgo", "score": 8, "comments": "Sólido"}]
+        }]
+
+    def test_get_without_answers_skips_details(self, client, evaluation, sql_statements):
+        """Answers are not queried unless they are part of the selection."""
+        # Arrange
+        statements = sql_statements("SELECT")
+
+        # Act
+        response = client.get(f"/api/v1/evaluations/{evaluation.id}", params={"fields": "general_feedback"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"general_feedback": "Buen desempeño"}
+        assert not any("evaluation_details" in statement for statement in statements)
+
+    def test_unknown_field_is_a_bad_request(self, client, evaluation):
+        """Fields outside the response schema are rejected."""
+        # Act
+        response = client.get("/api/v1/evaluations/", params={"fields": "id,password"})
+
+        # Assert
+        assert response.status_code == 400
+
+
+class TestSkillsAssessmentFieldsets:
+    """Fieldsets on the skills assessment endpoint."""
+
+    def test_ai_profile_is_not_read_unless_requested(self, client, db_session, sample_users, sample_cycle,
+                                                     sql_statements):
+        """Leaving out ai_profile keeps the JSONB column out of the query; sparse responses have no ETag."""
+        # Arrange
+        assessment = Assessment(user_id=sample_users[0].id, cycle_id=sample_cycle.id,
+                                processing_status=ProcessingStatus.COMPLETED, ai_profile={"strengths": []})
+        db_session.add(assessment)
+        db_session.commit()
+        assessment_id = str(assessment.id)
+        statements = sql_statements("SELECT")
+
+        # Act
+        response = client.get(f"/api/v1/skills-assessments/{sample_users[0].id}",
+                              params={"fields": "assessment_id,processing_status"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"assessment_id": assessment_id, "processing_status": "COMPLETED"}
+        assert "etag" not in response.headers
+        assert not any("ai_profile" in statement for statement in statements)
+
+
+class TestCareerPathFieldsets:
+    """Fieldsets and expansions on the career path endpoints."""
+
+    def test_list_with_steps_and_actions(self, client, sample_users, career_path):
+        """Each path carries the requested fields plus its steps and their actions."""
+        # Act
+        response = client.get(f"/api/v1/career-paths/{sample_users[0].id}",
+                              params={"fields": "path_name", "include": "development_actions"})
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert body["career_path_id"] == str(career_path.id)
+        assert body["generated_paths"] == [{
+            "path_name": "Liderazgo Regional",
+            "steps": [{
+                "step_number": 1,
+                "target_role": "Gerente",
+                "duration_months": 12,
+                "required_competencies": ["Liderazgo"],
+                "development_actions": [{"type": "mentoring", "description": "Mentoría con un líder regional"}]
+            }]
+        }]
+
+    def test_steps_endpoint_without_steps(self, client, career_path, sql_statements):
+        """Selecting only path columns skips the steps query."""
+        # Arrange
+        statements = sql_statements("SELECT")
+
+        # Act
+        response = client.get(f"/api/v1/career-paths/{career_path.id}/steps", params={"fields": "path_name,status"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"path_name": "Liderazgo Regional", "status": "GENERATED"}
+        assert not any("career_path_steps" in statement for statement in statements)
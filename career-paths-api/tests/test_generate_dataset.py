@@ -0,0 +1,66 @@
+"""
+Tests for the synthetic dataset generator (no database required).
+"""
+from generate_dataset import CopyStream, DatasetConfig, DatasetGenerator, copy_value
+
+
+class TestDatasetGenerator:
+    """Tests for deterministic row generation and COPY streaming."""
+
+    def test_same_seed_produces_same_rows(self):
+        """Two generators with the same seed yield identical rows and keys."""
+        # Arrange
+        config = DatasetConfig(users=30, departments=3, cycles=2, competencies=4, seed=7)
+
+        # Act
+        first = list(DatasetGenerator(config).evaluation_details())
+        second = list(DatasetGenerator(config).evaluation_details())
+        other_seed = list(DatasetGenerator(DatasetConfig(users=30, departments=3, cycles=2,
+                                                         competencies=4, seed=8)).evaluation_details())
+
+        # Assert
+        assert first == second
+        assert first != other_seed
+
+    def test_evaluations_respect_structure_and_counts(self):
+        """Each employee gets one SELF evaluation per cycle and no evaluator repeats."""
+        # Arrange
+        generator = DatasetGenerator(DatasetConfig(users=40, departments=2, team_size=5, cycles=2, evaluators=4))
+
+        # Act
+        rows = [line.rstrip("\n").split("\t") for line in generator.evaluations()]
+        keys = {(row[1], row[2], row[3]) for row in rows}
+
+        # Assert
+        assert len(rows) == generator.row_counts()["evaluations"]
+        assert len(keys) == len(rows)
+        assert sum(1 for row in rows if row[4] == "SELF") == 40 * 2
+        assert all(row[1] == row[2] for row in rows if row[4] == "SELF")
+
+    def test_users_are_loaded_after_their_managers(self):
+        """Every user row carries its manager, which appears earlier in the COPY stream."""
+        # Arrange
+        generator = DatasetGenerator(DatasetConfig(users=40, departments=2, team_size=5))
+
+        # Act
+        rows = [line.rstrip("\n").split("\t") for line in generator.users()]
+        position = {row[0]: index for index, row in enumerate(rows)}
+
+        # Assert
+        roots = [row for row in rows if row[6] == "\\N"]
+        assert len(roots) == 2  # One head per department
+        assert all(position[row[6]] < position[row[0]] for row in rows if row[6] != "\\N")
+
+    def test_copy_stream_and_escaping(self):
+        """Values are escaped for COPY and the stream returns every line in chunks."""
+        # Arrange
+        lines = [copy_value("a\tb") + "\t" + copy_value(None) + "\n" for _ in range(50)]
+        stream = CopyStream(iter(lines))
+
+        # Act
+        data = "".join(iter(lambda: stream.read(64), ""))
+
+        # Assert
+        assert lines[0] == "a\\tb\t\\N\n"
+        assert data == "".join(lines)
+        assert stream.rows == 50
@@ -0,0 +1,79 @@
+"""
+Tests for structured logging and correlation IDs.
+"""
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.logging_config import (
+    ContextFilter,
+    JsonFormatter,
+    RequestContextMiddleware,
+    job_context,
+    parse_log_levels,
+    request_id_var,
+)
+
+
+def _make_record(message: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, message, (), None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestStructuredLogging:
+    """Tests for JSON formatting and context propagation."""
+
+    def test_json_formatter_includes_job_id_and_extra(self):
+        """Records carry the active job ID and extra fields."""
+        # Arrange
+        formatter = JsonFormatter()
+        record = _make_record("Career paths generation completed", user_id="abc")
+
+        # Act
+        with job_context("career-paths") as job_id:
+            ContextFilter().filter(record)
+        payload = json.loads(formatter.format(record))
+
+        # Assert
+        assert payload["message"] == "Career paths generation completed"
+        assert payload["job_id"] == job_id
+        assert payload["user_id"] == "abc"
+        assert "request_id" not in payload
+
+    def test_parse_log_levels(self):
+        """Per-module levels are parsed from a comma separated list."""
+        # Act
+        levels = parse_log_levels("app.routers=debug, sqlalchemy.engine=INFO")
+
+        # Assert
+        assert levels == {"app.routers": "DEBUG", "sqlalchemy.engine": "INFO"}
+
+    def test_parse_log_levels_rejects_unknown_level(self):
+        """Unknown level names are rejected."""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            parse_log_levels("app.routers=LOUD")
+
+    def test_request_id_is_echoed(self):
+        """Incoming X-Request-ID is visible to handlers and echoed back."""
+        # Arrange
+        app = FastAPI()
+        app.add_middleware(RequestContextMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            return {"request_id": request_id_var.get()}
+
+        client = TestClient(app)
+
+        # Act
+        response = client.get("/ping", headers={"X-Request-ID": "req-123"})
+
+        # Assert
+        assert response.json() == {"request_id": "req-123"}
+        assert response.headers["x-request-id"] == "req-123"
@@ -0,0 +1,50 @@
+"""
+Tests for the event-loop blocking detector.
+"""
+import asyncio
+import time
+
+from app.services.loop_monitor import EventLoopMonitor, track_activity
+
+
+def blocking_report_export():
+    """Stand-in for synchronous work done on the event loop."""
+    time.sleep(0.3)
+
+
+class TestEventLoopMonitor:
+    """Tests for stall detection and attribution."""
+
+    async def test_stall_is_attributed_with_stack(self):
+        """A blocking call is reported with its activity and stack."""
+        # Arrange
+        monitor = EventLoopMonitor(interval=0.01, threshold=0.1)
+        monitor.start()
+        await asyncio.sleep(0.05)
+
+        # Act
+        with track_activity("job:assessment"):
+            blocking_report_export()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        # Assert
+        assert len(monitor.recent_stalls) == 1
+        stall = monitor.recent_stalls[0]
+        assert stall.activity == "job:assessment"
+        assert stall.blocked_seconds >= 0.1
+        assert "blocking_report_export" in stall.stack
+
+    async def test_no_stall_for_cooperative_code(self):
+        """Awaiting code never triggers a stall."""
+        # Arrange
+        monitor = EventLoopMonitor(interval=0.01, threshold=0.1)
+        monitor.start()
+
+        # Act
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        # Assert
+        assert len(monitor.recent_stalls) == 0
@@ -27,3 +27,31 @@ def test_health_check(client):
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
+
+
+def test_metrics_endpoint(client):
+    """Test: Metrics endpoint exposes Prometheus text format."""
+    # Arrange
+    client.get("/health")
+    
+    # Act
+    response = client.get("/metrics")
+    
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+
+
+def test_pool_status_endpoint(client):
+    """Test: Internal pool endpoint reports the primary pool configuration and usage."""
+    # Arrange - No setup needed
+    
+    # Act
+    response = client.get("/internal/pool")
+    
+    # Assert
+    assert response.status_code == 200
+    primary = response.json()["primary"]
+    assert primary["size"] == 10
+    assert {"saturation", "checked_out", "checkout"} <= primary.keys()
@@ -0,0 +1,67 @@
+"""
+Tests for the in-process metrics registry.
+"""
+import pytest
+
+from app.services.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests for Prometheus text rendering."""
+
+    def test_counter_renders_labels(self):
+        """Counters render one sample per label set."""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("ai_request_retries_total", "Retries.", ("operation",))
+
+        # Act
+        counter.labels(operation="analyze_skills").inc()
+        counter.labels(operation="analyze_skills").inc(2)
+        output = registry.render()
+
+        # Assert
+        assert "# TYPE ai_request_retries_total counter" in output
+        assert 'ai_request_retries_total{operation="analyze_skills"} 3' in output
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Histogram buckets are cumulative and end with +Inf."""
+        # Arrange
+        registry = MetricsRegistry()
+        histogram = registry.histogram("stage_seconds", "Stages.", ("stage",), buckets=(0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.5, 0.1, 5.0):
+            histogram.labels(stage="ai_call").observe(value)
+        output = registry.render()
+
+        # Assert
+        assert 'stage_seconds_bucket{stage="ai_call",le="0.1"} 2' in output
+        assert 'stage_seconds_bucket{stage="ai_call",le="1"} 3' in output
+        assert 'stage_seconds_bucket{stage="ai_call",le="+Inf"} 4' in output
+        assert 'stage_seconds_count{stage="ai_call"} 4' in output
+
+    def test_gauge_function_is_read_at_scrape_time(self):
+        """Callback gauges are evaluated when rendering."""
+        # Arrange
+        registry = MetricsRegistry()
+        gauge = registry.gauge("db_pool_checked_out", "Checked out.")
+        state = {"checked_out": 1}
+        gauge.set_function(lambda: state["checked_out"])
+
+        # Act
+        state["checked_out"] = 7
+        output = registry.render()
+
+        # Assert
+        assert "db_pool_checked_out 7" in output
+
+    def test_missing_labels_raise(self):
+        """Labelled metrics cannot be used without their labels."""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("failures_total", "Failures.", ("operation",))
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            counter.inc()
@@ -0,0 +1,104 @@
+"""
+Tests for the micro-benchmark regression gate and the AI payload builder.
+"""
+import json
+from uuid import uuid4
+
+from app.models import Competency, Evaluation, EvaluationDetail, EvaluatorRelationship
+from app.routers.assessments import build_evaluation_payload
+from benchmarks.micro import BASELINE_PATH, CASES, compare, main
+
+
+class TestMicroBenchmarks:
+    """Tests for baseline comparison."""
+
+    def test_compare_flags_slowdowns_beyond_tolerance(self):
+        """Cases slower than the tolerance fail, new cases are only reported."""
+        # Arrange
+        baseline = {"fast": {"min": 1.0}, "slow": {"min": 1.0}}
+        results = {"fast": {"min": 1.1}, "slow": {"min": 1.5}, "added": {"min": 2.0}}
+
+        # Act
+        rows = {row["name"]: row for row in compare(results, baseline, tolerance=0.25)}
+
+        # Assert
+        assert rows["fast"]["status"] == "ok"
+        assert rows["slow"]["status"] == "slower"
+        assert rows["added"]["status"] == "new"
+
+    def test_compare_flags_a_uniformly_slower_run(self):
+        """A run 1.5x slower than the committed baseline in every statistic fails every case."""
+        # Arrange
+        baseline = json.loads(BASELINE_PATH.read_text())["benchmarks"]
+        results = {name: {key: value * 1.5 if isinstance(value, float) else value for key, value in stats.items()}
+                   for name, stats in baseline.items()}
+
+        # Act
+        rows = compare(results, baseline, tolerance=0.25)
+
+        # Assert
+        assert rows and all(row["status"] == "slower" for row in rows)
+
+    def test_main_exits_non_zero_on_regression(self, tmp_path):
+        """A baseline that is much faster than the current code fails the gate."""
+        # Arrange
+        baseline = tmp_path / "baseline.json"
+        main(["-k", "career_path_summary", "--rounds", "2", "--baseline", str(baseline), "--update"])
+        # Make the stored minimum impossibly fast
+        report = json.loads(baseline.read_text())
+        report["benchmarks"]["career_path_summary_from_career_path"]["min"] = 1e-12
+        baseline.write_text(json.dumps(report))
+
+        # Act
+        exit_code = main(["-k", "career_path_summary", "--rounds", "2", "--baseline", str(baseline)])
+
+        # Assert
+        assert exit_code == 1
+
+    def test_every_case_runs(self):
+        """Every registered case can be set up and executed once."""
+        # Act / Assert
+        for name, setup in CASES.items():
+            assert setup()() is not None, name
+
+
+class TestBuildEvaluationPayload:
+    """Tests for the AI payload builder."""
+
+    def test_payload_groups_competencies_by_evaluation(self):
+        """Each evaluation becomes an entry with its relationship and scores."""
+        # Arrange
+        user_id, cycle_id = uuid4(), uuid4()
+        evaluation = Evaluation(evaluator_relationship=EvaluatorRelationship.MANAGER)
+        evaluation.details = [
+            EvaluationDetail(competency=Competency(name="Liderazgo"), score=8, comments="Bien"),
+            EvaluationDetail(competency=None, score=5, comments=None)
+        ]
+
+        # Act
+        payload = build_evaluation_payload(user_id, cycle_id, [evaluation])
+
+        # Assert
+        assert payload["user_id"] == str(user_id)
+        assert payload["evaluations"] == [{
+            "relationship": "MANAGER",
+            "competencies": [
+                {"name": "Liderazgo", "score": 8, "comments": "Bien"},
+                {"name": "Unknown", "score": 5, "comments": None}
+            ]
+        }]
+
+    def test_payload_includes_calibrated_scores(self):
+        """Answers with a calibrated score carry it next to the raw score."""
+        # Arrange
+        evaluation = Evaluation(evaluator_relationship=EvaluatorRelationship.PEER)
+        calibrated, raw = EvaluationDetail(id=uuid4(), score=9), EvaluationDetail(id=uuid4(), score=4)
+        evaluation.details = [calibrated, raw]
+
+        # Act
+        payload = build_evaluation_payload(uuid4(), uuid4(), [evaluation], {calibrated.id: 6.4321})
+
+        # Assert
+        answers = payload["evaluations"][0]["competencies"]
+        assert answers[0]["calibrated_score"] == 6.43
+        assert "calibrated_score" not in answers[1]
@@ -0,0 +1,52 @@
+"""
+Tests for connection pool configuration and checkout statistics.
+"""
+from app.database import PoolStats, _connect_args, settings
+
+
+class TestPoolStats:
+    """Tests for checkout wait statistics."""
+
+    def test_snapshot_reports_waits_in_milliseconds(self):
+        """Counts, timeouts and percentiles are computed from the recorded waits."""
+        # Arrange
+        stats = PoolStats(window=100)
+        for wait in range(1, 101):
+            stats.record(wait / 1000, timed_out=wait == 100)
+
+        # Act
+        snapshot = stats.snapshot()
+
+        # Assert
+        assert snapshot["checkouts"] == 100
+        assert snapshot["timeouts"] == 1
+        assert snapshot["max_wait_ms"] == 100.0
+        assert snapshot["recent_p50_wait_ms"] == 51.0
+        assert snapshot["recent_p99_wait_ms"] == 100.0
+
+
+class TestConnectArgs:
+    """Tests for server-side timeouts sent on connect."""
+
+    def test_timeouts_are_sent_as_startup_options(self, monkeypatch):
+        """Non-zero timeouts become ``-c`` options of the connection."""
+        # Arrange
+        monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+        monkeypatch.setattr(settings, "DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", 10000)
+        monkeypatch.setattr(settings, "PGBOUNCER_MODE", False)
+
+        # Act
+        options = _connect_args()["options"]
+
+        # Assert
+        assert "-c statement_timeout=5000" in options
+        assert "-c idle_in_transaction_session_timeout=10000" in options
+
+    def test_pgbouncer_mode_sends_no_startup_options(self, monkeypatch):
+        """PgBouncer rejects unknown startup parameters, so none are sent."""
+        # Arrange
+        monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+        monkeypatch.setattr(settings, "PGBOUNCER_MODE", True)
+
+        # Act / Assert
+        assert _connect_args() == {}
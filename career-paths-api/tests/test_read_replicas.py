@@ -0,0 +1,170 @@
+"""
+Tests for read-replica routing.
+
+The integration test needs two local PostgreSQL databases and only runs when
+TEST_REPLICA_DATABASE_URL points at the second one (a plain database is enough:
+it is not in recovery, so its lag is 0).
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.database import ReadYourWritesMiddleware, ReplicaSet, RoutingSession, client_writes, settings
+
+
+class FakeReplicaSet(ReplicaSet):
+    """ReplicaSet whose lag is set by the test instead of queried."""
+
+    def __init__(self, engines, lag=0.0):
+        super().__init__(engines, max_lag_seconds=5.0, check_interval=0.0)
+        self.lag = lag
+
+    def measure_lag(self, replica):
+        if isinstance(self.lag, Exception):
+            raise self.lag
+        return self.lag
+
+
+@pytest.fixture()
+def engines():
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _read_session(primary, replica_set, monkeypatch):
+    monkeypatch.setattr(RoutingSession, "replica_set", replica_set)
+    return RoutingSession(bind=primary, info={"read_only": True})
+
+
+class TestReadReplicaRouting:
+    """Tests for RoutingSession and ReplicaSet."""
+
+    def test_read_only_session_uses_healthy_replica(self, engines, monkeypatch):
+        """Read-only sessions read from the replica, regular sessions from the primary."""
+        # Arrange
+        primary, replica = engines
+        read_session = _read_session(primary, FakeReplicaSet([replica]), monkeypatch)
+        write_session = RoutingSession(bind=primary)
+
+        # Act / Assert
+        assert read_session.get_bind() is replica
+        assert write_session.get_bind() is primary
+
+    @pytest.mark.parametrize("lag", [60.0, ConnectionError("replica down")])
+    def test_lagging_or_unreachable_replica_falls_back_to_primary(self, engines, monkeypatch, lag):
+        """Replicas over the lag limit or failing the health check are skipped."""
+        # Arrange
+        primary, replica = engines
+        session = _read_session(primary, FakeReplicaSet([replica], lag=lag), monkeypatch)
+
+        # Act / Assert
+        assert session.get_bind() is primary
+        assert not session.reads_from_replica()
+
+    def test_session_reads_its_own_writes_after_commit(self, engines, monkeypatch):
+        """After committing a write the session reads from the primary for a window."""
+        # Arrange
+        primary, replica = engines
+        session = _read_session(primary, FakeReplicaSet([replica]), monkeypatch)
+        session.execute(text("SELECT 1"))
+        session.wrote_in_transaction = True  # As set by a flush
+
+        # Act
+        session.commit()
+        bind_in_window = session.get_bind()
+        monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 0.0)
+        bind_after_window = session.get_bind()
+
+        # Assert
+        assert bind_in_window is primary
+        assert bind_after_window is replica
+
+    def test_fresh_read_session_sees_the_clients_writes(self, engines, monkeypatch):
+        """A new read session of the same client reads from the primary after another session wrote."""
+        # Arrange
+        primary, replica = engines
+        with client_writes() as holder:
+            write_session = _read_session(primary, FakeReplicaSet([replica]), monkeypatch)
+            write_session.use_primary()
+            write_session.execute(text("SELECT 1"))
+            write_session.wrote_in_transaction = True  # As set by a flush
+            write_session.commit()
+
+        # Act
+        with client_writes(holder["last_write_at"]):
+            same_client = _read_session(primary, FakeReplicaSet([replica]), monkeypatch).get_bind()
+        with client_writes():
+            other_client = _read_session(primary, FakeReplicaSet([replica]), monkeypatch).get_bind()
+
+        # Assert
+        assert holder["wrote"]
+        assert same_client is primary
+        assert other_client is replica
+
+    def test_last_write_cookie_routes_the_next_request_to_primary(self, engines, monkeypatch):
+        """The write request sets the cookie; the client's next request reads from the primary."""
+        # Arrange
+        primary, replica = engines
+        monkeypatch.setattr(RoutingSession, "replica_set", FakeReplicaSet([replica]))
+
+        def write(request):
+            session = RoutingSession(bind=primary)
+            session.execute(text("SELECT 1"))
+            session.wrote_in_transaction = True  # As set by a flush
+            session.commit()
+            return PlainTextResponse("ok")
+
+        def read(request):
+            session = RoutingSession(bind=primary, info={"read_only": True})
+            return PlainTextResponse("replica" if session.get_bind() is replica else "primary")
+
+        app = Starlette(routes=[Route("/write", write, methods=["POST"]), Route("/read", read)])
+        app.add_middleware(ReadYourWritesMiddleware)
+        writer, other = TestClient(app), TestClient(app)
+
+        # Act
+        before = writer.get("/read").text
+        response = writer.post("/write")
+        after = writer.get("/read").text
+
+        # Assert
+        assert before == "replica"
+        assert "last_write" in response.cookies
+        assert after == "primary"
+        assert other.get("/read").text == "replica"
+
+
+@pytest.mark.skipif(not os.environ.get("TEST_REPLICA_DATABASE_URL"),
+                    reason="Requires TEST_REPLICA_DATABASE_URL (second local PostgreSQL database)")
+class TestReadReplicaIntegration:
+    """Routing between two real PostgreSQL databases."""
+
+    def test_reads_hit_replica_database(self, db_engine, monkeypatch):
+        """Reads run on the replica database and move to the primary after a write."""
+        # Arrange
+        replica = create_engine(os.environ["TEST_REPLICA_DATABASE_URL"])
+        replica_set = ReplicaSet([replica], max_lag_seconds=5.0, check_interval=60.0)
+        session = _read_session(db_engine, replica_set, monkeypatch)
+
+        try:
+            # Act
+            read_database = session.execute(text("SELECT current_database()")).scalar()
+            session.wrote_in_transaction = True
+            session.commit()
+            after_write_database = session.execute(text("SELECT current_database()")).scalar()
+        finally:
+            session.close()
+            replica.dispose()
+
+        # Assert
+        assert read_database == replica.url.database
+        assert after_write_database == db_engine.url.database
+        assert replica_set.replicas[0].lag_seconds == 0.0
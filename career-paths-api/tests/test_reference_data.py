@@ -0,0 +1,96 @@
+"""
+Tests for the shared reference-data snapshot.
+"""
+import re
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.evaluation_cycle import CycleStatus
+from app.services.reference_data import ReferenceDataCache, ReferenceSnapshot, encode_snapshot, reference_data
+
+
+@pytest.fixture()
+def session_factory(db_session):
+    """Sessions on the test transaction's connection, so they see uncommitted fixtures."""
+    return lambda: Session(bind=db_session.connection())
+
+
+def _cache(path, **kwargs):
+    return ReferenceDataCache(path, source=b"testsrc\0", max_age_seconds=300.0, check_interval=0.0, **kwargs)
+
+
+class TestReferenceSnapshot:
+    """Tests for the binary snapshot format."""
+
+    def test_lookups_find_encoded_records(self):
+        """Competencies, cycles and users are found by key; unknown keys miss."""
+        # Arrange
+        competency_id, cycle_id, user_ids = uuid4(), uuid4(), [uuid4() for _ in range(50)]
+        data = encode_snapshot([("Liderazgo", competency_id), ("Comunicación", uuid4())],
+                               [(cycle_id, CycleStatus.CLOSED)], user_ids, version=3, source=b"testsrc\0")
+
+        # Act
+        snapshot = ReferenceSnapshot(data)
+
+        # Assert
+        assert snapshot.version == 3
+        assert snapshot.competency_id("Liderazgo") == competency_id
+        assert snapshot.competency_id("Negociación") is None
+        assert snapshot.cycle_status(cycle_id) == CycleStatus.CLOSED
+        assert all(snapshot.has_user(user_id) for user_id in user_ids)
+        assert not snapshot.has_user(uuid4())
+        assert snapshot.counts() == {"compets": 2, "cycles": 1, "users": 50}
+
+
+class TestReferenceDataCache:
+    """Tests for sharing the snapshot file between processes."""
+
+    def test_rebuild_by_one_handle_is_seen_by_another(self, tmp_path, session_factory, sample_users, sample_cycle):
+        """A reader remaps the file written by the loader and drops it once invalidated."""
+        # Arrange
+        path = tmp_path / "reference.bin"
+        loader, reader = _cache(path), _cache(path)
+
+        # Act
+        loader.rebuild(session_factory)
+        known_after_build = reader.has_user(sample_users[0].id) and reader.has_cycle(sample_cycle.id)
+        first_version = reader.snapshot().version
+        loader.rebuild(session_factory)
+        second_version = reader.snapshot().version
+        loader.invalidate()
+
+        # Assert
+        assert known_after_build
+        assert (first_version, second_version) == (1, 2)
+        assert reader.snapshot() is None
+        assert not reader.has_user(sample_users[0].id)
+
+    def test_create_evaluation_uses_snapshot(self, client, tmp_path, monkeypatch, session_factory, sql_statements,
+                                             sample_users, sample_cycle, sample_competencies):
+        """Evaluations are validated against the shared snapshot without querying the reference tables."""
+        # Arrange
+        cache = _cache(tmp_path / "reference.bin")
+        cache.rebuild(session_factory)
+        monkeypatch.setattr(reference_data, "path", cache.path)
+        monkeypatch.setattr(reference_data, "source", cache.source)
+        monkeypatch.setattr(reference_data, "check_interval", 0.0)
+        monkeypatch.setattr(reference_data, "enabled", True)
+        employee = sample_users[0]
+        payload = {
+            "evaluator_id": str(employee.id),
+            "employee_id": str(employee.id),
+            "cycle_id": str(sample_cycle.id),
+            "evaluator_relationship": "SELF",
+            "answers": [{"competency": "Liderazgo", "score": 8, "comments": "Buen desempeño"}]
+        }
+        selects = sql_statements("SELECT")
+
+        # Act
+        response = client.post("/api/v1/evaluations/", json=payload)
+
+        # Assert
+        assert response.status_code == 201
+        reference_tables = re.compile(r"\b(users|evaluation_cycles|competencies)\b")
+        assert not [statement for statement in selects if reference_tables.search(statement)]
@@ -0,0 +1,129 @@
+"""
+Tests for the response cache, ETags and conditional requests.
+"""
+import pytest
+
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.services.response_cache import ResponseCache, etag_matches
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def completed_assessment(db_session, sample_users, sample_cycle):
+    assessment = Assessment(
+        user_id=sample_users[0].id,
+        cycle_id=sample_cycle.id,
+        processing_status=ProcessingStatus.COMPLETED,
+        ai_profile={"strengths": ["Liderazgo"], "growth_areas": [], "hidden_talents": [], "readiness_for_roles": []}
+    )
+    db_session.add(assessment)
+    db_session.commit()
+    return assessment
+
+
+class TestResponseCache:
+    """Tests for the TTL + LRU cache."""
+
+    def test_entries_expire_after_ttl(self):
+        """Entries are served until their TTL elapses."""
+        # Arrange
+        clock = FakeClock()
+        cache = ResponseCache(max_entries=10, ttl_seconds=30.0, clock=clock)
+        cache.put("key", '"v1"', b"{}")
+
+        # Act
+        clock.now = 29.0
+        before_expiry = cache.get("key")
+        clock.now = 30.0
+        after_expiry = cache.get("key")
+
+        # Assert
+        assert before_expiry.etag == '"v1"'
+        assert after_expiry is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Reading an entry protects it from eviction."""
+        # Arrange
+        cache = ResponseCache(max_entries=2, ttl_seconds=30.0)
+        cache.put("a", '"a"', b"a")
+        cache.put("b", '"b"', b"b")
+        cache.get("a")
+
+        # Act
+        cache.put("c", '"c"', b"c")
+
+        # Assert
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    @pytest.mark.parametrize("header, expected", [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        (None, False),
+    ])
+    def test_etag_matching(self, header, expected):
+        """If-None-Match accepts lists, weak validators and the wildcard."""
+        # Act / Assert
+        assert etag_matches(header, '"abc"') is expected
+
+
+class TestConditionalReads:
+    """Tests for cached skills-assessment and career-path reads."""
+
+    def test_repeat_assessment_reads_hit_cache(self, client, completed_assessment, sql_statements):
+        """The second read and the conditional read issue no SQL."""
+        # Arrange
+        statements = sql_statements()
+        url = f"/api/v1/skills-assessments/{completed_assessment.user_id}"
+        first = client.get(url)
+        queries_after_first = len(statements)
+
+        # Act
+        second = client.get(url)
+        conditional = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+        # Assert
+        assert first.status_code == 200
+        assert queries_after_first > 0
+        assert second.content == first.content
+        assert second.json()["assessment_id"] == str(completed_assessment.id)
+        assert conditional.status_code == 304
+        assert conditional.content == b""
+        assert conditional.headers["etag"] == first.headers["etag"]
+        assert len(statements) == queries_after_first
+
+    def test_accepting_a_path_invalidates_cached_list(self, client, db_session, sample_users):
+        """After accepting a path the list is rebuilt with a new ETag."""
+        # Arrange
+        path = CareerPath(
+            user_id=sample_users[0].id,
+            path_name="Liderazgo Regional",
+            total_duration_months=18.0,
+            status=CareerPathStatus.GENERATED
+        )
+        db_session.add(path)
+        db_session.commit()
+        url = f"/api/v1/career-paths/{sample_users[0].id}"
+        before = client.get(url)
+
+        # Act
+        accept = client.post(f"/api/v1/career-paths/{path.id}/accept")
+        after = client.get(url, headers={"If-None-Match": before.headers["etag"]})
+
+        # Assert
+        assert accept.status_code == 200
+        assert after.status_code == 200
+        assert after.headers["etag"] != before.headers["etag"]
+        assert after.json()["generated_paths"][0]["status"] == "IN_PROGRESS"
@@ -0,0 +1,87 @@
+"""
+Tests for the fast JSON response helpers and the routes that use them.
+"""
+import json
+
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.evaluation import Evaluation, EvaluatorRelationship
+from app.responses import dumps, embed_raw_json
+
+
+class TestEmbedRawJson:
+    """Tests for splicing pre-encoded JSON into a document."""
+
+    def test_raw_value_is_embedded_unchanged(self):
+        """The raw text is inserted as the value of the new field."""
+        # Act
+        document = embed_raw_json(dumps({"id": 1}), "profile", '{"a": [1, 2]}')
+
+        # Assert
+        assert document == b'{"id":1,"profile":{"a": [1, 2]}}'
+        assert json.loads(document) == {"id": 1, "profile": {"a": [1, 2]}}
+
+    def test_null_and_empty_document(self):
+        """A missing value becomes null and an empty object gets no leading comma."""
+        # Act / Assert
+        assert embed_raw_json(b"{}", "profile", None) == b'{"profile":null}'
+
+
+class TestFastPathRoutes:
+    """Routes that serialise rows and models without FastAPI re-validation."""
+
+    def test_skills_assessment_embeds_ai_profile(self, client, db_session, sample_users, sample_cycle):
+        """The JSONB profile read as text is returned as a JSON object."""
+        # Arrange
+        profile = {"strengths": ["Liderazgo"], "readiness_for_roles": [{"role_name": "Gerente", "readiness_percentage": 70}]}
+        assessment = Assessment(
+            user_id=sample_users[0].id,
+            cycle_id=sample_cycle.id,
+            processing_status=ProcessingStatus.COMPLETED,
+            ai_profile=profile
+        )
+        db_session.add(assessment)
+        db_session.commit()
+
+        # Act
+        response = client.get(f"/api/v1/skills-assessments/{sample_users[0].id}")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "assessment_id": str(assessment.id),
+            "user_id": str(sample_users[0].id),
+            "cycle_id": str(sample_cycle.id),
+            "processing_status": "COMPLETED",
+            "timestamp": assessment.created_at.isoformat(),
+            "ai_profile": profile
+        }
+
+    def test_list_evaluations_from_rows(self, client, db_session, sample_users, sample_cycle):
+        """Listed evaluations keep the EvaluationResponse fields and formats."""
+        # Arrange
+        evaluation = Evaluation(
+            evaluator_id=sample_users[1].id,
+            employee_id=sample_users[0].id,
+            cycle_id=sample_cycle.id,
+            evaluator_relationship=EvaluatorRelationship.MANAGER
+        )
+        db_session.add(evaluation)
+        db_session.commit()
+
+        # Act
+        response = client.get("/api/v1/evaluations/")
+
+        # Assert
+        assert response.status_code == 200
+        listed = {item["id"]: item for item in response.json()}
+        assert listed[str(evaluation.id)] == {
+            "id": str(evaluation.id),
+            "employee_id": str(sample_users[0].id),
+            "evaluator_id": str(sample_users[1].id),
+            "cycle_id": str(sample_cycle.id),
+            "evaluator_relationship": "MANAGER",
+            "status": evaluation.status.value,
+            "created_at": evaluation.created_at.isoformat(),
+            "updated_at": evaluation.updated_at.isoformat()
+        }
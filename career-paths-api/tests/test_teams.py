@@ -0,0 +1,131 @@
+"""
+Tests for the reporting hierarchy closure table and the team summary endpoint.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models.assessment import Assessment, ProcessingStatus
+from app.models.career_path import CareerPath, CareerPathStatus
+from app.models.user import User
+from app.models.user_hierarchy import UserHierarchy, rebuild_hierarchy
+
+
+def _user(name, manager=None):
+    return User(id=uuid4(), email=f"{name}@sendos.com", full_name=name.title(),
+                manager_id=manager.id if manager is not None else None)
+
+
+def _closure(db_session, users):
+    """Closure rows among ``users`` as (ancestor name, descendant name, depth)."""
+    names = {user.id: user.full_name for user in users}
+    rows = db_session.execute(select(UserHierarchy).where(UserHierarchy.ancestor_id.in_(names))).scalars()
+    return {(names[row.ancestor_id], names[row.descendant_id], row.depth) for row in rows}
+
+
+@pytest.fixture()
+def org(db_session):
+    """director -> lead -> (analyst, intern); other reports to nobody."""
+    director = _user("director")
+    lead = _user("lead", director)
+    analyst = _user("analyst", lead)
+    intern = _user("intern", lead)
+    other = _user("other")
+    users = [director, lead, analyst, intern, other]
+    db_session.add_all(users)
+    db_session.commit()
+    return {user.full_name: user for user in users}
+
+
+class TestHierarchyMaintenance:
+    """The closure table follows inserts, moves and deletes."""
+
+    def test_inserts_build_every_path(self, db_session, org):
+        """Each user is linked to all its ancestors with the right depth."""
+        # Act
+        closure = _closure(db_session, org.values())
+
+        # Assert
+        assert ("Director", "Intern", 2) in closure
+        assert ("Lead", "Analyst", 1) in closure
+        assert ("Analyst", "Analyst", 0) in closure
+        assert len(closure) == 5 + 3 + 2  # self rows + director's reports + lead's reports
+
+    def test_moving_a_manager_moves_the_subtree(self, db_session, org):
+        """Reports keep following their manager, and the result matches a full rebuild."""
+        # Act
+        org["Lead"].manager_id = org["Other"].id
+        db_session.commit()
+        incremental = _closure(db_session, org.values())
+        rebuild_hierarchy(db_session.connection())
+        rebuilt = _closure(db_session, org.values())
+
+        # Assert
+        assert ("Other", "Intern", 2) in incremental
+        assert not any(ancestor == "Director" and depth > 0 for ancestor, _, depth in incremental)
+        assert incremental == rebuilt
+
+    def test_cycles_are_rejected(self, db_session, org):
+        """A manager cannot be moved under one of their reports."""
+        # Act / Assert
+        org["Director"].manager_id = org["Analyst"].id
+        with pytest.raises(ValueError):
+            db_session.flush()
+        db_session.rollback()
+
+    def test_deleting_a_manager_detaches_reports(self, db_session, org):
+        """Reports of a deleted user become roots of their own subtrees."""
+        # Act
+        db_session.delete(org["Lead"])
+        db_session.commit()
+
+        # Assert
+        remaining = [org["Director"], org["Analyst"], org["Intern"]]
+        assert _closure(db_session, remaining) == {
+            ("Director", "Director", 0), ("Analyst", "Analyst", 0), ("Intern", "Intern", 0)
+        }
+
+
+class TestTeamSummary:
+    """Tests for GET /teams/{manager_id}/summary."""
+
+    def test_summary_rolls_up_the_subtree(self, client, db_session, org, sample_cycle):
+        """Assessment and career path counts cover every report at any depth."""
+        # Arrange
+        db_session.add_all([
+            Assessment(user_id=org["Analyst"].id, cycle_id=sample_cycle.id,
+                       processing_status=ProcessingStatus.COMPLETED),
+            Assessment(user_id=org["Intern"].id, cycle_id=sample_cycle.id,
+                       processing_status=ProcessingStatus.FAILED),
+            CareerPath(user_id=org["Analyst"].id, path_name="Liderazgo", total_duration_months=12.0,
+                       status=CareerPathStatus.GENERATED),
+            CareerPath(user_id=org["Analyst"].id, path_name="Especialista", total_duration_months=18.0,
+                       status=CareerPathStatus.IN_PROGRESS),
+            CareerPath(user_id=org["Other"].id, path_name="Fuera del equipo", total_duration_months=6.0,
+                       status=CareerPathStatus.GENERATED)
+        ])
+        db_session.commit()
+
+        # Act
+        response = client.get(f"/api/v1/teams/{org['Director'].id}/summary")
+        direct = client.get(f"/api/v1/teams/{org['Director'].id}/summary", params={"depth": 1})
+
+        # Assert
+        assert response.status_code == 200
+        summary = response.json()
+        assert (summary["team_size"], summary["direct_reports"], summary["levels"]) == (3, 1, 2)
+        assert summary["assessments"] == {"PENDING": 0, "PROCESSING": 0, "COMPLETED": 1, "FAILED": 1, "NONE": 1}
+        assert summary["career_paths"] == {"GENERATED": 1, "IN_PROGRESS": 1, "COMPLETED": 0}
+        assert summary["members_with_career_paths"] == 1
+        assert "etag" in response.headers
+        assert direct.json()["team_size"] == 1
+        assert direct.json()["assessments"]["NONE"] == 1
+
+    def test_unknown_manager(self, client):
+        """A manager that does not exist is a 404."""
+        # Act
+        response = client.get(f"/api/v1/teams/{uuid4()}/summary")
+
+        # Assert
+        assert response.status_code == 404
@@ -0,0 +1,107 @@
+"""
+Tests for local tracing and the OTLP file exporter.
+"""
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.tracing import (
+    FileSpanExporter,
+    Tracer,
+    TracingMiddleware,
+    inject_headers,
+    tracer,
+)
+
+
+@pytest.fixture()
+def span_file(tmp_path):
+    """Configure the global tracer to export into a temporary file."""
+    path = tmp_path / "spans.jsonl"
+    tracer.configure(FileSpanExporter(str(path), "test-service", flush_interval=0.05), sample_rate=1.0)
+    yield path
+    tracer.shutdown()
+
+
+def _read_spans(path):
+    spans = []
+    for line in path.read_text().splitlines():
+        request = json.loads(line)
+        for resource_spans in request["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                spans.extend(scope_spans["spans"])
+    return spans
+
+
+class TestTracing:
+    """Tests for span creation, propagation and export."""
+
+    def test_child_span_shares_trace_and_propagates_header(self, span_file):
+        """Nested spans share the trace ID and inject a traceparent header."""
+        # Act
+        with tracer.span("job.assessment") as parent:
+            with tracer.span("ai.analyze_skills") as child:
+                headers = inject_headers()
+        tracer.shutdown()
+        spans = {span["name"]: span for span in _read_spans(span_file)}
+
+        # Assert
+        assert child.trace_id == parent.trace_id
+        assert headers["traceparent"] == f"00-{child.trace_id}-{child.span_id}-01"
+        assert spans["ai.analyze_skills"]["parentSpanId"] == parent.span_id
+        assert "parentSpanId" not in spans["job.assessment"]
+
+    def test_exception_marks_span_as_error(self, span_file):
+        """Exceptions set an error status and an exception event."""
+        # Act
+        with pytest.raises(RuntimeError):
+            with tracer.span("ai.generate_career_paths.attempt"):
+                raise RuntimeError("Simulated AI service failure")
+        tracer.shutdown()
+        span = _read_spans(span_file)[0]
+
+        # Assert
+        assert span["status"]["code"] == 2
+        assert span["events"][0]["name"] == "exception"
+
+    def test_zero_sample_rate_exports_nothing(self, tmp_path):
+        """Unsampled traces still propagate IDs but are not exported."""
+        # Arrange
+        path = tmp_path / "spans.jsonl"
+        local_tracer = Tracer()
+        local_tracer.configure(FileSpanExporter(str(path), "test-service"), sample_rate=0.0)
+
+        # Act
+        with local_tracer.span("job.assessment") as span:
+            traceparent = span.traceparent()
+        local_tracer.shutdown()
+
+        # Assert
+        assert traceparent.endswith("-00")
+        assert not path.exists()
+
+    def test_middleware_continues_remote_trace(self, span_file):
+        """Incoming traceparent headers are continued by the server span."""
+        # Arrange
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"item_id": item_id}
+
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        parent_id = "00f067aa0ba902b7"
+
+        # Act
+        TestClient(app).get("/items/1", headers={"traceparent": f"00-{trace_id}-{parent_id}-01"})
+        tracer.shutdown()
+        span = _read_spans(span_file)[0]
+
+        # Assert
+        assert span["name"] == "HTTP GET /items/{item_id}"
+        assert span["traceId"] == trace_id
+        assert span["parentSpanId"] == parent_id
+        assert span["kind"] == 2